@@ -1,6 +1,10 @@
 """Configuration module."""
 
-from config.settings import Settings, get_settings
-
-__all__ = ["Settings", "get_settings"]
+from config.settings import (
+    CloudSettings,
+    Settings,
+    get_cloud_settings,
+    get_settings,
+)
 
+__all__ = ["CloudSettings", "Settings", "get_cloud_settings", "get_settings"]
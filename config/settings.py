@@ -1,53 +1,102 @@
 """Application configuration settings."""
 
-import os
+import warnings
 from pathlib import Path
 from functools import lru_cache
+from typing import Literal
 
-from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Project root directory
 PROJECT_ROOT = Path(__file__).parent.parent
 
 
 class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+    """Application settings loaded from environment variables.
+    
+    Each field is read from the environment variable of the same name
+    (case-insensitive) or from the project's .env file when a Settings
+    instance is created, falling back to the defaults below.
+    """
+    
+    model_config = SettingsConfigDict(
+        env_file=PROJECT_ROOT / ".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
     
     # Google Cloud Configuration
-    google_cloud_project: str = os.getenv("GOOGLE_CLOUD_PROJECT", "")
-    google_cloud_region: str = os.getenv("GOOGLE_CLOUD_REGION", "us-central1")
+    google_cloud_project: str = ""
+    google_cloud_region: str = "us-central1"
     
     # Google Cloud Storage
-    gcs_bucket: str = os.getenv("GCS_BUCKET", "")
+    gcs_bucket: str = ""
     
     # Model Configuration
-    embedding_model: str = os.getenv("EMBEDDING_MODEL", "text-embedding-005")
-    gemini_model: str = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+    embedding_model: str = "text-embedding-005"
+    gemini_model: str = "gemini-2.5-flash"
     
     # Embedding dimensions for text-embedding-005
     embedding_dimensions: int = 768
     
+    # Texts per online embedding request (text-embedding-005 accepts up to 250)
+    embedding_batch_size: int = 64
+    
+    # Estimated token budget per embedding request (the API limit is 20k)
+    embedding_max_tokens_per_request: int = 18000
+    
+    # Also write an int8-quantized copy of the embeddings ("none" or "int8").
+    # Vector Search ingestion always uses the float file.
+    embedding_quantization: Literal["none", "int8"] = "none"
+    
     # Vector Search Configuration
-    vector_search_index_id: str = os.getenv("VECTOR_SEARCH_INDEX_ID", "")
-    vector_search_endpoint_id: str = os.getenv("VECTOR_SEARCH_ENDPOINT_ID", "")
-    deployed_index_id: str = os.getenv("DEPLOYED_INDEX_ID", "job_vacancies_deployed")
+    vector_search_index_id: str = ""
+    vector_search_endpoint_id: str = ""
+    # In-flight creation operations, recorded so deployment can resume polling
+    vector_search_index_operation: str = ""
+    vector_search_endpoint_operation: str = ""
+    deployed_index_id: str = "job_vacancies_deployed"
+    # CRC32C of the embeddings verified before the index was created
+    embeddings_preflight_hash: str = ""
     
     # API Configuration
-    api_host: str = os.getenv("API_HOST", "0.0.0.0")
-    api_port: int = int(os.getenv("API_PORT", "8000"))
+    api_host: str = "0.0.0.0"
+    api_port: int = 8000
+    
+    # In-memory chat sessions: least recently used ones are evicted beyond
+    # session_max_count, idle ones expire after session_ttl_seconds, and each
+    # keeps only its latest session_max_messages messages
+    session_max_count: int = 10000
+    session_ttl_seconds: int = 3600
+    session_max_messages: int = 200
     
     # Data paths
     data_dir: Path = PROJECT_ROOT / "data"
     jobs_file: Path = PROJECT_ROOT / "data" / "jobs.json"
     candidates_file: Path = PROJECT_ROOT / "data" / "candidates.json"
+
+
+class CloudSettings(Settings):
+    """Settings for scripts that must talk to Google Cloud.
+    
+    Validation fails at construction when GOOGLE_CLOUD_PROJECT is missing,
+    so scripts can stop before doing any other work.
+    """
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    google_cloud_project: str = Field(..., min_length=1)
+    gcs_bucket: str = Field(default="", validate_default=True)
+    
+    @field_validator("gcs_bucket")
+    @classmethod
+    def warn_if_bucket_missing(cls, value: str) -> str:
+        """Warn (without failing) when no GCS bucket is configured."""
+        if not value:
+            warnings.warn(
+                "GCS_BUCKET is not set; embeddings cannot be uploaded to GCS.",
+                stacklevel=2,
+            )
+        return value
 
 
 @lru_cache()
@@ -55,3 +104,13 @@ def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
 
+
+@lru_cache()
+def get_cloud_settings() -> CloudSettings:
+    """Get cached cloud settings instance.
+    
+    Raises:
+        pydantic.ValidationError: If GOOGLE_CLOUD_PROJECT is not set
+    """
+    return CloudSettings()
+
@@ -1,47 +1,420 @@
 #!/usr/bin/env python3
 """Create embeddings for jobs and upload to GCS."""
 
-import json
+import argparse
+import asyncio
+import base64
+import multiprocessing
+import random
 import sys
+import time
+from contextlib import nullcontext
 from pathlib import Path
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional
+
+import numpy as np
+import orjson
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from config.settings import get_settings
-from src.services.data_generator import DataGenerator
-from src.services.embeddings import EmbeddingService
+from pydantic import ValidationError
+
+from config.settings import get_cloud_settings, get_settings
+from data_generator import DataGenerator
+from src.models.job import Job
+from src.services.embeddings import EmbeddingService, quantize_int8
+
+
+# Maximum number of embedding requests in flight at once
+MAX_CONCURRENT_BATCHES = 16
+
+# Candidate batch sizes and sample size for --calibrate
+CALIBRATION_BATCH_SIZES = (8, 32, 64, 128, 250)
+CALIBRATION_SAMPLE_SIZE = 500
+CALIBRATION_FILENAME = ".embedding_batch_size"
+
+# Distinct texts read ahead, deduplicated and length-sorted before batching
+SORT_WINDOW = 2048
+
+# Rough characters-per-token ratio used to budget request sizes
+CHARS_PER_TOKEN = 4
+
+# Jobs handed to each text-building worker at a time (--text-workers)
+TEXT_WORKER_CHUNKSIZE = 64
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text (~4 characters per token)."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def pack_batches(
+    items: list[tuple[str, list[str]]],
+    max_items: int,
+    max_tokens: int
+) -> Iterator[list[tuple[str, list[str]]]]:
+    """Greedily pack (text, job_ids) items into token-budgeted batches.
+    
+    A batch is closed when adding the next text would exceed either the
+    item limit or the token budget. A single text larger than the budget
+    still gets a batch of its own (the API truncates it).
+    
+    Args:
+        items: (text, job_ids) pairs, ideally sorted by length
+        max_items: Maximum number of texts per request
+        max_tokens: Maximum estimated tokens per request
+    
+    Yields:
+        Lists of (text, job_ids) pairs
+    """
+    batch: list[tuple[str, list[str]]] = []
+    batch_tokens = 0
+    
+    for item in items:
+        tokens = estimate_tokens(item[0])
+        if batch and (len(batch) >= max_items or batch_tokens + tokens > max_tokens):
+            yield batch
+            batch, batch_tokens = [], 0
+        batch.append(item)
+        batch_tokens += tokens
+    
+    if batch:
+        yield batch
+
+
+def job_text_pair(job: Job) -> tuple[str, str]:
+    """Return a job's ID and embedding text (picklable for worker pools)."""
+    return job.id, job.to_embedding_text()
+
+
+async def embed_jobs(
+    embedding_service: EmbeddingService,
+    jobs: Iterable[Job],
+    on_batch: Callable[[list[str], np.ndarray], None],
+    batch_size: int = 5,
+    max_concurrency: int = MAX_CONCURRENT_BATCHES,
+    on_error: Optional[Callable[[list[str], Exception], None]] = None,
+    text_workers: int = 0,
+    max_tokens: int = 18000
+) -> None:
+    """Embed jobs through a pipelined producer / embedder / writer chain.
+    
+    The stages are linked by bounded queues, so text preparation, the
+    embedding requests and result handling overlap while backpressure keeps
+    memory bounded:
+    
+    - producer builds the embedding texts, collapses identical texts so
+      each is embedded once, sorts each window of ``SORT_WINDOW`` distinct
+      texts by length (so each request carries similarly sized inputs) and
+      enqueues batches packed up to ``batch_size`` texts and ``max_tokens``
+      estimated tokens
+    - ``max_concurrency`` embedder workers send the batches to Vertex AI
+    - the writer hands each finished batch to ``on_batch``, which runs in a
+      worker thread (one batch at a time) so blocking file and upload
+      writes stay off the event loop
+    
+    Batches reach ``on_batch`` in completion order, not input order. If
+    ``on_error`` is given, a failed batch is reported to it and the run
+    carries on; otherwise the first failure aborts the run. An exception
+    in any stage (including ``on_batch``) cancels the others and is raised.
+    
+    Args:
+        embedding_service: Service used to generate embeddings
+        jobs: Jobs to embed (may be a lazy iterator)
+        on_batch: Called with the job IDs and embeddings of each batch
+        batch_size: Maximum number of texts per request
+        max_concurrency: Number of embedder workers (requests in flight)
+        on_error: Called with the job IDs and exception of a failed batch
+        text_workers: If > 0, build embedding texts in a process pool of
+            this size instead of a single worker thread
+        max_tokens: Maximum estimated tokens per request
+    """
+    q_in: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency * 2)
+    q_out: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency * 2)
+    # Embedders still running; the last one to finish stops the writer
+    active_embedders = max_concurrency
+    
+    async def enqueue_window(window: dict[str, list[str]]) -> None:
+        items = sorted(window.items(), key=lambda item: len(item[0]))
+        for batch in pack_batches(items, batch_size, max_tokens):
+            await q_in.put(batch)
+    
+    async def producer() -> None:
+        # Maps each distinct text to the IDs of the jobs that share it
+        window: dict[str, list[str]] = {}
+        pool = multiprocessing.Pool(text_workers) if text_workers > 0 else None
+        with pool or nullcontext():
+            pairs = (
+                pool.imap(job_text_pair, jobs, chunksize=TEXT_WORKER_CHUNKSIZE)
+                if pool else map(job_text_pair, jobs)
+            )
+            # Pull pairs in chunks from a worker thread: reading the jobs file,
+            # building texts and waiting on the pool all block, and must not
+            # stall the embedding requests running on the loop
+            while chunk := await asyncio.to_thread(
+                list, islice(pairs, TEXT_WORKER_CHUNKSIZE)
+            ):
+                for job_id, text in chunk:
+                    window.setdefault(text, []).append(job_id)
+                    if len(window) >= SORT_WINDOW:
+                        await enqueue_window(window)
+                        window = {}
+        await enqueue_window(window)
+        for _ in range(max_concurrency):
+            await q_in.put(None)
+    
+    async def embedder() -> None:
+        while (batch := await q_in.get()) is not None:
+            ids = [job_id for _, job_ids in batch for job_id in job_ids]
+            # Small jitter spreads the initial burst of concurrent requests
+            await asyncio.sleep(random.uniform(0, 0.1))
+            try:
+                embeddings = await embedding_service.aget_embeddings_batch(
+                    [text for text, _ in batch]
+                )
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(ids, e)
+                continue
+            # Fan each unique embedding back out to every job sharing the text
+            embeddings = np.repeat(
+                embeddings, [len(job_ids) for _, job_ids in batch], axis=0
+            )
+            await q_out.put((ids, embeddings))
+        
+        nonlocal active_embedders
+        active_embedders -= 1
+        if active_embedders == 0:
+            await q_out.put(None)
+    
+    async def writer() -> None:
+        completed = 0
+        while (result := await q_out.get()) is not None:
+            ids, embeddings = result
+            await asyncio.to_thread(on_batch, ids, embeddings)
+            completed += len(ids)
+            print(f"  Processed {completed} jobs...")
+    
+    tasks = [
+        asyncio.create_task(producer()),
+        *(asyncio.create_task(embedder()) for _ in range(max_concurrency)),
+        asyncio.create_task(writer()),
+    ]
+    try:
+        # Returns when every stage is done, or as soon as one of them fails
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            task.result()
+    finally:
+        # A failed stage would otherwise leave the others blocked on its queue
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def load_completed_ids(embeddings_file: Path) -> set[str]:
+    """Read the job IDs already present in an embeddings JSONL file.
+    
+    A trailing partial line (left behind by an interrupted run) is
+    truncated away so that new records can be appended safely.
+    
+    Args:
+        embeddings_file: Path to the JSONL embeddings file
+    
+    Returns:
+        Set of job IDs that already have an embedding
+    """
+    if not embeddings_file.exists():
+        return set()
+    
+    done_ids = set()
+    valid_bytes = 0
+    
+    with open(embeddings_file, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                done_ids.add(orjson.loads(line)["id"])
+            except (orjson.JSONDecodeError, KeyError, TypeError):
+                break
+            valid_bytes += len(line)
+    
+    if valid_bytes < embeddings_file.stat().st_size:
+        with open(embeddings_file, "r+b") as f:
+            f.truncate(valid_bytes)
+    
+    return done_ids
+
+
+def _calibrate_batch_size(
+    embedding_service: EmbeddingService,
+    jobs: list[Job],
+    cache_file: Path,
+    max_tokens: int
+) -> Optional[int]:
+    """Find the fastest batch size by timing a sample of texts.
+    
+    Each candidate size embeds the same sample; the size with the lowest
+    seconds-per-text wins and is cached to disk for later runs. Sizes whose
+    requests could exceed the token budget are skipped, and probing stops
+    at the first size whose requests fail.
+    
+    Args:
+        embedding_service: Service used to generate embeddings
+        jobs: Jobs to sample from
+        cache_file: File in which to store the chosen batch size
+        max_tokens: Maximum estimated tokens per request
+    
+    Returns:
+        The fastest batch size, or None if no size could be timed
+    """
+    sample = [job.to_embedding_text() for job in jobs[:CALIBRATION_SAMPLE_SIZE]]
+    # Largest possible request per size: its longest texts batched together
+    sample_tokens = sorted((estimate_tokens(text) for text in sample), reverse=True)
+    timings: dict[int, float] = {}
+    
+    for size in CALIBRATION_BATCH_SIZES:
+        if size > len(sample) and timings:
+            break
+        if sum(sample_tokens[:size]) > max_tokens:
+            print(f"  batch_size={size}: over the {max_tokens}-token request budget; stopping calibration")
+            break
+        start = time.perf_counter()
+        try:
+            embedding_service.get_embeddings_batch(sample, batch_size=size)
+        except Exception as e:
+            print(f"  batch_size={size}: failed ({e}); stopping calibration")
+            break
+        timings[size] = (time.perf_counter() - start) / len(sample)
+        print(f"  batch_size={size}: {timings[size] * 1000:.2f} ms/text")
+    
+    if not timings:
+        return None
+    best = min(timings, key=timings.get)
+    cache_file.write_text(str(best))
+    return best
 
 
-def main():
+def resolve_batch_size(
+    embedding_service: EmbeddingService,
+    jobs: list[Job],
+    calibrate: bool
+) -> int:
+    """Pick the embedding batch size for this run.
+    
+    Uses a fresh calibration when requested, otherwise a previously cached
+    calibration result, falling back to the configured default.
+    
+    Args:
+        embedding_service: Service used to generate embeddings
+        jobs: Sample of the jobs that will be embedded
+        calibrate: Whether to run the calibration sweep
+    
+    Returns:
+        Batch size to use
+    """
+    settings = get_settings()
+    cache_file = settings.data_dir / CALIBRATION_FILENAME
+    
+    if calibrate:
+        print("\nCalibrating batch size...")
+        best = _calibrate_batch_size(
+            embedding_service,
+            jobs,
+            cache_file,
+            settings.embedding_max_tokens_per_request,
+        )
+        if best is not None:
+            return best
+        print("  Calibration failed; using the cached or configured batch size")
+    
+    if cache_file.exists():
+        try:
+            return int(cache_file.read_text().strip())
+        except ValueError:
+            pass
+    
+    return settings.embedding_batch_size
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--batch-mode",
+        action="store_true",
+        help="Use a Vertex AI batch prediction job instead of online requests "
+             "(cheaper, no online quota; requires GCS_BUCKET)",
+    )
+    parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help=f"Time batch sizes {list(CALIBRATION_BATCH_SIZES)} on a sample "
+             "and cache the fastest for later runs",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Discard previously generated embeddings instead of resuming",
+    )
+    parser.add_argument(
+        "--text-workers",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Build embedding texts in N worker processes (0 = one thread); "
+             "worthwhile only for very large job files",
+    )
+    return parser.parse_args()
+
+
+async def main():
     """Create embeddings for all jobs."""
+    args = parse_args()
+    
     print("=" * 50)
     print("Vector AI PoC - Embedding Generation")
     print("=" * 50)
     
-    settings = get_settings()
-    
-    # Check configuration
-    if not settings.google_cloud_project:
+    # Fail fast on missing configuration
+    try:
+        settings = get_cloud_settings()
+    except ValidationError:
         print("\nError: GOOGLE_CLOUD_PROJECT not set in .env file.")
         print("Please run: ./scripts/setup_gcp.sh <PROJECT_ID>")
         sys.exit(1)
     
-    print(f"\nProject: {settings.google_cloud_project}")
-    print(f"Region: {settings.google_cloud_region}")
-    print(f"Embedding Model: {settings.embedding_model}")
+    project, region, model = (
+        settings.google_cloud_project,
+        settings.google_cloud_region,
+        settings.embedding_model,
+    )
+    jobs_file, data_dir, bucket = (
+        settings.jobs_file,
+        settings.data_dir,
+        settings.gcs_bucket,
+    )
+    quantize = settings.embedding_quantization == "int8"
+    
+    print(f"\nProject: {project}")
+    print(f"Region: {region}")
+    print(f"Embedding Model: {model}")
     
     # Load jobs
     print("\nLoading jobs...")
     generator = DataGenerator()
     
-    if not settings.jobs_file.exists():
+    if not jobs_file.exists():
         print("Error: Jobs file not found. Run generate_data.py first.")
         sys.exit(1)
     
-    jobs = generator.load_jobs(settings.jobs_file)
-    print(f"✓ Loaded {len(jobs)} jobs")
+    # Jobs are streamed from disk rather than loaded into memory up front
+    jobs = generator.iter_jobs_from_file(jobs_file)
     
     # Initialize embedding service
     print("\nInitializing embedding service...")
@@ -55,48 +428,142 @@ def main():
         print("  2. Set the correct project in .env")
         sys.exit(1)
     
-    # Generate embeddings
+    # Resume from a previous run, skipping jobs that are already embedded
+    embeddings_file = data_dir / "job_embeddings.jsonl"
+    quantized_file = data_dir / "job_embeddings.int8.jsonl"
+    failed_file = data_dir / "job_embeddings.failed.txt"
+    
+    if args.restart:
+        embeddings_file.unlink(missing_ok=True)
+        quantized_file.unlink(missing_ok=True)
+    
+    done_ids = load_completed_ids(embeddings_file)
+    if done_ids:
+        jobs = (job for job in jobs if job.id not in done_ids)
+        print(f"✓ Resuming: {len(done_ids)} jobs already embedded")
+    
+    # Generate embeddings, streaming each batch to JSON Lines as it arrives
     print("\nGenerating embeddings for jobs...")
-    embeddings_data = []
+    written = 0
+    failed_ids: list[str] = []
     
-    # Process in batches
-    batch_size = 5
-    for i in range(0, len(jobs), batch_size):
-        batch = jobs[i:i + batch_size]
-        texts = [job.to_embedding_text() for job in batch]
-        
+    def record_failure(ids: list[str], error: Exception) -> None:
+        print(f"  Warning: batch of {len(ids)} jobs failed: {error}")
+        failed_ids.extend(ids)
+    
+    # On a fresh run, stream records to GCS while embedding so the upload
+    # overlaps with the API calls. Resumed runs upload the full file at the end.
+    stream = None
+    if bucket and not done_ids:
         try:
-            embeddings = embedding_service.get_embeddings_batch(texts)
-            
-            for job, embedding in zip(batch, embeddings):
-                embeddings_data.append({
-                    "id": job.id,
-                    "embedding": embedding
-                })
-            
-            print(f"  Processed {min(i + batch_size, len(jobs))}/{len(jobs)} jobs...")
+            from src.services.vector_search import VectorSearchService
             
+            stream = VectorSearchService().open_embeddings_stream(
+                "job_embeddings.jsonl"
+            )
         except Exception as e:
-            print(f"Error generating embeddings: {e}")
-            sys.exit(1)
+            print(f"  Note: streaming upload unavailable ({e}); will upload at the end")
     
-    print(f"✓ Generated {len(embeddings_data)} embeddings")
+    with open(embeddings_file, "ab") as f, \
+            (open(quantized_file, "ab") if quantize else nullcontext()) as qf:
+        def write_batch(ids: list[str], embeddings: np.ndarray) -> None:
+            nonlocal written
+            chunk = b"".join(
+                orjson.dumps(
+                    {"id": job_id, "embedding": embedding},
+                    option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY,
+                )
+                for job_id, embedding in zip(ids, embeddings)
+            )
+            f.write(chunk)
+            if stream is not None:
+                stream.write(chunk)
+            if qf is not None:
+                quantized, scales = quantize_int8(embeddings)
+                for job_id, q, scale in zip(ids, quantized, scales):
+                    qf.write(orjson.dumps(
+                        {
+                            "id": job_id,
+                            "q": base64.b64encode(q.tobytes()).decode("ascii"),
+                            "scale": float(scale),
+                        },
+                        option=orjson.OPT_APPEND_NEWLINE,
+                    ))
+            written += len(ids)
+        
+        if args.batch_mode:
+            if not bucket:
+                print("Error: --batch-mode requires GCS_BUCKET to be set.")
+                sys.exit(1)
+            # A batch job needs the whole dataset up front
+            jobs = list(jobs)
+            if jobs:
+                print("  Submitting batch prediction job (this can take a while)...")
+                try:
+                    embeddings = await asyncio.to_thread(
+                        embedding_service.get_embeddings_batch_prediction,
+                        [job.to_embedding_text() for job in jobs],
+                        bucket,
+                    )
+                    await asyncio.to_thread(
+                        write_batch, [job.id for job in jobs], embeddings
+                    )
+                except Exception as e:
+                    record_failure([job.id for job in jobs], e)
+        else:
+            sample = (
+                list(islice(
+                    generator.iter_jobs_from_file(jobs_file),
+                    CALIBRATION_SAMPLE_SIZE,
+                ))
+                if args.calibrate else []
+            )
+            batch_size = resolve_batch_size(
+                embedding_service, sample, args.calibrate
+            )
+            print(f"  Using batch size {batch_size}")
+            await embed_jobs(
+                embedding_service,
+                jobs,
+                write_batch,
+                batch_size=batch_size,
+                on_error=record_failure,
+                text_workers=args.text_workers,
+                max_tokens=settings.embedding_max_tokens_per_request,
+            )
     
-    # Save embeddings locally
-    embeddings_file = settings.data_dir / "job_embeddings.json"
-    with open(embeddings_file, "w") as f:
-        json.dump(embeddings_data, f)
+    print(f"✓ Generated {written} embeddings")
     print(f"✓ Saved embeddings locally to {embeddings_file}")
+    if quantize:
+        print(f"✓ Saved int8-quantized embeddings to {quantized_file}")
+    
+    if failed_ids:
+        if stream is not None:
+            await asyncio.to_thread(stream.abort)
+        failed_file.write_text("\n".join(failed_ids) + "\n")
+        print(f"\nError: {len(failed_ids)} jobs failed; IDs written to {failed_file}")
+        print("Re-run this script to retry them (completed jobs are skipped).")
+        sys.exit(1)
+    failed_file.unlink(missing_ok=True)
     
     # Upload to GCS
-    if settings.gcs_bucket:
-        print(f"\nUploading embeddings to GCS bucket: {settings.gcs_bucket}...")
+    gcs_uri = None
+    if stream is not None:
+        try:
+            await asyncio.to_thread(stream.close)
+            gcs_uri = f"gs://{bucket}/embeddings/job_embeddings.jsonl"
+            print(f"\n✓ Streamed to {gcs_uri}")
+        except Exception as e:
+            print(f"\nWarning: Streaming upload failed ({e}); uploading the file instead")
+    
+    if bucket and not gcs_uri:
+        print(f"\nUploading embeddings to GCS bucket: {bucket}...")
         try:
             from src.services.vector_search import VectorSearchService
             
             vector_service = VectorSearchService()
-            gcs_uri = vector_service.upload_embeddings_to_gcs(
-                embeddings_data,
+            gcs_uri = vector_service.upload_embeddings_file_to_gcs(
+                embeddings_file,
                 filename="job_embeddings.jsonl"
             )
             print(f"✓ Uploaded to {gcs_uri}")
@@ -104,9 +571,20 @@ def main():
         except Exception as e:
             print(f"Warning: Could not upload to GCS: {e}")
             print("You may need to upload manually or ensure bucket permissions are correct.")
-    else:
+    elif not bucket:
         print("\nWarning: GCS_BUCKET not configured. Embeddings not uploaded to cloud.")
     
+    # Record what was uploaded so deploy_index.py can verify the blob first
+    if gcs_uri:
+        from src.services.vector_search import EMBEDDINGS_MANIFEST_FILENAME, file_checksums
+        
+        manifest_file = data_dir / EMBEDDINGS_MANIFEST_FILENAME
+        manifest_file.write_bytes(orjson.dumps(
+            {"gcs_uri": gcs_uri, **file_checksums(embeddings_file)},
+            option=orjson.OPT_INDENT_2,
+        ))
+        print(f"✓ Wrote upload manifest to {manifest_file}")
+    
     print("\n" + "=" * 50)
     print("Embedding generation complete!")
     print("=" * 50)
@@ -114,5 +592,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
 
@@ -1,15 +1,71 @@
 """Mock data generator for jobs and candidates."""
 
-import json
+import os
 import random
-import uuid
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import repeat
 from pathlib import Path
 from enum import Enum
+from typing import Callable, Iterable, Iterator, Sequence, TypeVar
+
+import ijson
+from pydantic import BaseModel, TypeAdapter
 
 from src.models.job import Job, ExperienceLevel, LocationType
 from src.models.candidate import Candidate
 
 
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+# Parse and validate whole files in one pydantic-core pass
+_JOB_LIST_ADAPTER = TypeAdapter(list[Job])
+_CANDIDATE_LIST_ADAPTER = TypeAdapter(list[Candidate])
+
+# Random ids are sliced from one os.urandom block instead of a uuid4 each
+ID_HEX_CHARS = 8
+ID_POOL_SIZE = 1024
+
+# Records per parallel generation chunk; each chunk gets its own seed, so
+# parallel output depends on this value but not on the worker count
+PARALLEL_CHUNK_SIZE = 500
+
+
+def _build_model(model: type[M], validate: bool, **fields) -> M:
+    """Instantiate a model, skipping validation unless requested.
+    
+    Generated values come from fixed pools and arithmetic, so they are valid
+    by construction and model_construct avoids running the validators.
+    """
+    return model(**fields) if validate else model.model_construct(**fields)
+
+
+def _write_json_array(models: Iterable[BaseModel], filepath: Path) -> None:
+    """Write models to a JSON array file one element at a time.
+    
+    Each model is serialized and written on its own, so peak memory holds a
+    single record rather than the whole document. Output matches an
+    indent=2 dump of the full list. Records are serialized straight to
+    bytes by the model's pydantic-core serializer, skipping the str round
+    trip of model_dump_json.
+    
+    Args:
+        models: Models to write
+        filepath: Destination JSON file
+    """
+    with open(filepath, "wb") as f:
+        separator = b"[\n  "
+        for model in models:
+            f.write(separator)
+            # JSON strings never contain raw newlines, so re-indenting is safe
+            record = type(model).__pydantic_serializer__.to_json(model, indent=2)
+            f.write(record.replace(b"\n", b"\n  "))
+            separator = b",\n  "
+        f.write(b"[]" if separator == b"[\n  " else b"\n]")
+
+
 class PayType(str, Enum):
     """Pay frequency type."""
     HOURLY = "hourly"
@@ -19,11 +75,125 @@ class PayType(str, Enum):
     ANNUAL = "annual"
 
 
+def _interned(values: list[str]) -> list[str]:
+    """Intern pool strings so every record shares one object per value."""
+    return [sys.intern(value) for value in values]
+
+
+def _flatten_pools(pools: dict[str, list[str]]) -> tuple[tuple[str, ...], dict[str, range]]:
+    """Flatten a dict of string pools into one tuple plus per-key index ranges.
+    
+    Drawing an index from a key's range and reading the flat tuple is
+    equivalent to drawing from the original list, but keeps every pool in
+    one contiguous sequence.
+    
+    Args:
+        pools: Mapping of category to its list of values
+    
+    Returns:
+        Tuple of (flat tuple of all values, mapping of category to index range)
+    """
+    flat: list[str] = []
+    ranges: dict[str, range] = {}
+    for key, values in pools.items():
+        ranges[key] = range(len(flat), len(flat) + len(values))
+        flat.extend(map(sys.intern, values))
+    return tuple(flat), ranges
+
+
+def _sample(randrange: Callable[[int], int], population: Sequence[T], k: int) -> list[T]:
+    """Choose k unique elements from a sequence with a partial Fisher-Yates.
+    
+    Only the k swapped positions are tracked (in a small dict) instead of
+    copying the whole population, which is cheaper than random.sample for
+    the small k used here. Draws are made in the same order as
+    random.sample's pool algorithm, so seeded output is identical.
+    
+    Args:
+        randrange: Bound randrange of the generator's RNG
+        population: Sequence to draw from (lists, tuples and ranges)
+        k: Number of elements to choose
+    
+    Returns:
+        List of k elements in selection order
+    """
+    n = len(population)
+    if not 0 <= k <= n:
+        raise ValueError("Sample larger than population or is negative")
+    swapped: dict[int, int] = {}
+    lookup = swapped.get
+    result = []
+    for last in range(n - 1, n - 1 - k, -1):
+        j = randrange(last + 1)
+        result.append(population[lookup(j, j)])
+        # Move the not-yet-selected tail element into the vacated slot
+        swapped[j] = lookup(last, last)
+    return result
+
+
+def _filter_ranges(
+    flat: tuple[str, ...],
+    ranges: dict[str, range],
+    predicate: Callable[[str], bool]
+) -> dict[str, tuple[int, ...]]:
+    """Precompute, per category, the flat-pool indices whose value passes predicate."""
+    return {
+        key: tuple(i for i in indices if predicate(flat[i]))
+        for key, indices in ranges.items()
+    }
+
+
+def _other_keys(pools: dict[str, list[str]]) -> dict[str, tuple[str, ...]]:
+    """Map each key to the tuple of all other keys, in their original order."""
+    return {key: tuple(other for other in pools if other != key) for key in pools}
+
+
+def _align_pay_ranges(
+    pay: dict[str, dict[str, tuple[int, int]]],
+    pay_types: list[PayType]
+) -> dict[str, tuple[tuple[int, int], ...]]:
+    """Reorder each category's pay ranges into a tuple aligned with pay_types."""
+    return {
+        category: tuple(rates[pay_type.value] for pay_type in pay_types)
+        for category, rates in pay.items()
+    }
+
+
+def _name_table(
+    first_names: Sequence[str],
+    first_lower: Sequence[str],
+    last_names: Sequence[str],
+    last_lower: Sequence[str]
+) -> tuple[tuple[str, str], ...]:
+    """Build every (full name, email) pair, first-name major."""
+    return tuple(
+        (f"{first} {last}", f"{first_l}.{last_l}@email.com")
+        for first, first_l in zip(first_names, first_lower)
+        for last, last_l in zip(last_names, last_lower)
+    )
+
+
+# Experience classes derived from a job title
+EXP_CLASS_JUNIOR = 0
+EXP_CLASS_SENIOR = 1
+EXP_CLASS_PRINCIPAL = 2
+
+
+def _experience_class(title: str) -> int:
+    """Classify a job title into an experience class by its wording."""
+    lowered = title.lower()
+    if any(word in lowered for word in ["senior", "staff", "lead", "manager", "architect"]):
+        return EXP_CLASS_SENIOR
+    if "principal" in lowered:
+        return EXP_CLASS_PRINCIPAL
+    return EXP_CLASS_JUNIOR
+
+
 class DataGenerator:
     """Generate mock job vacancies and candidate profiles."""
     
     # Job data pools
-    COMPANIES = [
+    COMPANIES = _interned([
         "TechCorp", "InnovateTech", "DataDynamics", "CloudNine Systems",
         "QuantumLeap Inc", "NexGen Solutions", "CyberSecure Ltd", "AIVentures",
         "BlockchainBase", "FinTech Global", "HealthTech Solutions", "EduTech Inc",
@@ -31,7 +201,7 @@ class DataGenerator:
         "VirtualReality Co", "IoT Innovations", "BigData Corp", "MLOps Inc",
         "DevOps Masters", "AgileWorks", "CloudFirst", "SecureNet",
         "DataLake Systems", "StreamTech"
-    ]
+    ])
     
     JOB_TITLES = {
         "engineering": [
@@ -75,32 +245,32 @@ class DataGenerator:
                      "Incident Response", "Compliance", "IAM"]
     }
     
-    INDUSTRIES = [
+    INDUSTRIES = _interned([
         "Technology", "Finance", "Healthcare", "E-commerce", "Education",
         "Energy", "Manufacturing", "Media", "Telecommunications", "Transportation"
-    ]
+    ])
     
-    DEPARTMENTS = [
+    DEPARTMENTS = _interned([
         "Engineering", "Data Science", "Product", "Security", "Infrastructure",
         "Platform", "Research", "Analytics"
-    ]
+    ])
     
-    LOCATIONS = [
+    LOCATIONS = _interned([
         "San Francisco, CA", "New York, NY", "Seattle, WA", "Austin, TX",
         "Boston, MA", "Chicago, IL", "Denver, CO", "Los Angeles, CA",
         "Miami, FL", "Atlanta, GA", "Portland, OR", "San Diego, CA"
-    ]
+    ])
     
-    BENEFITS = [
+    BENEFITS = _interned([
         "Health Insurance", "Dental Insurance", "Vision Insurance",
         "401(k) Matching", "Stock Options", "Unlimited PTO",
         "Remote Work", "Flexible Hours", "Learning Budget",
         "Gym Membership", "Parental Leave", "Mental Health Support",
         "Home Office Stipend", "Commuter Benefits", "Free Meals"
-    ]
+    ])
     
     # Blue-collar companies
-    BLUECOLLAR_COMPANIES = [
+    BLUECOLLAR_COMPANIES = _interned([
         "QuickDeliver Logistics", "Metro Warehouse Co", "CleanPro Services",
         "HandyFix Solutions", "SecureGuard Security", "FastFreight Transport",
         "CityMove Movers", "BuildRight Construction", "FreshClean Janitorial",
@@ -109,7 +279,7 @@ class DataGenerator:
         "LoadMaster Warehouse", "TrustGuard Services", "RapidHaul Transport",
         "HomeFix Repairs", "PrimeLogistics Inc", "CargoKing Shipping",
         "SpotlessClean Co", "ReliableMovers", "ConstructAll Builders"
-    ]
+    ])
     
     # Blue-collar job titles
     BLUECOLLAR_TITLES = {
@@ -146,26 +316,26 @@ class DataGenerator:
     
     # Blue-collar requirements/skills
     BLUECOLLAR_REQUIREMENTS = {
-        "licenses": [
+        "licenses": _interned([
             "Valid Driver's License", "CDL Class A", "CDL Class B",
             "Forklift Certification", "OSHA Safety Certification"
-        ],
-        "physical": [
+        ]),
+        "physical": _interned([
             "Able to lift 25kg/55lbs", "Able to lift 50kg/110lbs",
             "Able to stand for 8+ hours", "Able to walk long distances",
             "Good physical condition", "Able to work outdoors"
-        ],
-        "age": [
+        ]),
+        "age": _interned([
             "Minimum age 18", "Minimum age 21", "Minimum age 25"
-        ],
-        "other": [
+        ]),
+        "other": _interned([
             "Height above 170cm/5'7\"", "Height above 180cm/5'11\"",
             "Clean background check", "Own transportation",
             "Available for night shifts", "Available for weekends",
             "Flexible schedule", "Reliable and punctual",
             "Basic English proficiency", "Team player",
             "Customer service skills", "Attention to detail"
-        ]
+        ])
     }
     
     # Blue-collar pay rates by job type
@@ -179,36 +349,60 @@ class DataGenerator:
         "construction": {"hourly": (16, 30), "daily": (130, 240), "weekly": (650, 1200)}
     }
     
-    BLUECOLLAR_INDUSTRIES = [
+    # Pay types offered for blue-collar jobs: (type, annual multiplier, unit)
+    BLUECOLLAR_PAY_TYPES = (
+        (PayType.HOURLY, 2080, "hour"),  # 40 hrs/week * 52 weeks
+        (PayType.DAILY, 260, "day"),     # 5 days/week * 52 weeks
+        (PayType.WEEKLY, 52, "week"),
+    )
+    
+    # BLUECOLLAR_PAY ranges as tuples aligned with BLUECOLLAR_PAY_TYPES
+    BLUECOLLAR_PAY_RANGES = _align_pay_ranges(
+        BLUECOLLAR_PAY, [pay_type for pay_type, _, _ in BLUECOLLAR_PAY_TYPES]
+    )
+    
+    BLUECOLLAR_INDUSTRIES = _interned([
         "Logistics", "Warehousing", "Retail", "Hospitality", "Construction",
         "Cleaning Services", "Security Services", "Moving Services", 
         "Food Service", "Property Management"
-    ]
+    ])
     
-    BLUECOLLAR_BENEFITS = [
+    BLUECOLLAR_BENEFITS = _interned([
         "Weekly Pay", "Daily Pay", "Health Insurance", "Overtime Available",
         "Flexible Hours", "Uniform Provided", "Training Provided",
         "Growth Opportunities", "Paid Breaks", "Transportation Allowance",
         "Meal Allowance", "Safety Equipment Provided"
-    ]
+    ])
 
     # Candidate data pools
-    FIRST_NAMES = [
+    FIRST_NAMES = _interned([
         "Alex", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie",
         "Quinn", "Avery", "Cameron", "Blake", "Drew", "Sage", "Parker"
-    ]
+    ])
     
-    BLUECOLLAR_FIRST_NAMES = [
+    BLUECOLLAR_FIRST_NAMES = _interned([
         "Mike", "Joe", "Dave", "Steve", "Tom", "Chris", "John", "Mark",
         "Dan", "Bob", "Jim", "Rick", "Tony", "Frank", "Eddie", "Sam",
         "Maria", "Rosa", "Ana", "Carmen", "Elena", "Sofia", "Linda", "Susan"
-    ]
+    ])
     
-    LAST_NAMES = [
+    LAST_NAMES = _interned([
         "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia",
         "Miller", "Davis", "Rodriguez", "Martinez", "Anderson", "Taylor",
         "Thomas", "Moore", "Jackson", "Martin", "Lee", "Perez", "Chen", "Patel"
-    ]
+    ])
+    
+    # Lowercase name variants for email addresses, aligned with the pools above
+    FIRST_NAMES_LOWER = tuple(n.lower() for n in FIRST_NAMES)
+    BLUECOLLAR_FIRST_NAMES_LOWER = tuple(n.lower() for n in BLUECOLLAR_FIRST_NAMES)
+    LAST_NAMES_LOWER = tuple(n.lower() for n in LAST_NAMES)
+    
+    # Every (name, email) pair, indexed by first_idx * len(LAST_NAMES) + last_idx,
+    # so candidates share prebuilt strings instead of formatting their own
+    NAME_TABLE = _name_table(FIRST_NAMES, FIRST_NAMES_LOWER, LAST_NAMES, LAST_NAMES_LOWER)
+    BLUECOLLAR_NAME_TABLE = _name_table(
+        BLUECOLLAR_FIRST_NAMES, BLUECOLLAR_FIRST_NAMES_LOWER, LAST_NAMES, LAST_NAMES_LOWER
+    )
     
     CANDIDATE_SUMMARIES = [
         "Passionate software engineer with {years} years of experience building scalable systems.",
@@ -221,6 +415,85 @@ class DataGenerator:
         "Tech enthusiast with deep expertise in {domain} and cloud technologies.",
     ]
     
+    # Lookup tables derived from the pools above, built once at class load
+    # instead of on every generate_* call
+    DEPARTMENT_TITLE_CATEGORY = {
+        "Engineering": "engineering",
+        "Data Science": "data",
+        "Product": "product",
+        "Security": "security",
+        "Infrastructure": "engineering",
+        "Platform": "engineering",
+        "Research": "data",
+        "Analytics": "data"
+    }
+    
+    ENGINEERING_SKILL_DOMAINS = ("backend", "frontend", "devops")
+    DATA_SKILL_DOMAINS = ("data", "ml")
+    FIXED_SKILL_DOMAINS = {
+        "Security": "security",
+        "Infrastructure": "devops",
+        "Platform": "devops",
+    }
+    
+    # Annual salary band (low, high) by experience level
+    SALARY_BANDS = {
+        ExperienceLevel.JUNIOR: (70000, 100000),
+        ExperienceLevel.MID: (100000, 140000),
+        ExperienceLevel.SENIOR: (140000, 180000),
+        ExperienceLevel.LEAD: (170000, 220000),
+        ExperienceLevel.PRINCIPAL: (200000, 280000),
+    }
+    
+    SENIOR_LEVELS = (ExperienceLevel.SENIOR, ExperienceLevel.LEAD)
+    JUNIOR_LEVELS = (ExperienceLevel.JUNIOR, ExperienceLevel.MID)
+    LOCATION_TYPES = tuple(LocationType)
+    BLUECOLLAR_LOCATION_TYPES = (LocationType.ONSITE, LocationType.HYBRID)
+    
+    CANDIDATE_DOMAINS = ("backend", "frontend", "data", "ml", "devops")
+    DOMAIN_LABELS = {
+        "backend": "backend development",
+        "frontend": "frontend development",
+        "data": "data engineering",
+        "ml": "machine learning",
+        "devops": "DevOps and infrastructure"
+    }
+    DOMAIN_TITLE_CATEGORY = {
+        "backend": "engineering",
+        "frontend": "engineering",
+        "data": "data",
+        "ml": "data",
+        "devops": "engineering"
+    }
+    
+    BLUECOLLAR_CATEGORIES = tuple(BLUECOLLAR_TITLES)
+    BLUECOLLAR_CATEGORY_DEPARTMENTS = {category: category.title() for category in BLUECOLLAR_TITLES}
+    
+    # Flat title/skill pools; generators draw indices from the per-category
+    # ranges and read the value from the flat tuple
+    TITLES_FLAT, TITLE_RANGES = _flatten_pools(JOB_TITLES)
+    TITLE_EXP_CLASSES = tuple(_experience_class(t) for t in TITLES_FLAT)
+    SKILLS_FLAT, SKILL_RANGES = _flatten_pools(SKILLS_BY_DOMAIN)
+    OTHER_SKILL_DOMAINS = _other_keys(SKILLS_BY_DOMAIN)
+    
+    # Title indices a candidate may currently hold, by years of experience
+    EARLY_CAREER_TITLES = _filter_ranges(
+        TITLES_FLAT, TITLE_RANGES, lambda t: "Senior" not in t and "Lead" not in t
+    )
+    MID_CAREER_TITLES = _filter_ranges(
+        TITLES_FLAT, TITLE_RANGES, lambda t: "Senior" in t or "Engineer" in t
+    )
+    BLUECOLLAR_TITLES_FLAT, BLUECOLLAR_TITLE_RANGES = _flatten_pools(BLUECOLLAR_TITLES)
+    BLUECOLLAR_DOMAIN_LABELS = {
+        "delivery": "delivery and driving",
+        "warehouse": "warehouse operations",
+        "cleaning": "cleaning and janitorial",
+        "maintenance": "maintenance and repairs",
+        "security": "security work",
+        "moving": "moving and logistics",
+        "construction": "construction and labor"
+    }
+    
     BLUECOLLAR_SUMMARIES = [
         "Reliable worker with {years} years of experience in {domain}. Always punctual and hardworking.",
         "Dedicated {domain} professional looking for steady work. Strong work ethic.",
@@ -232,79 +505,140 @@ class DataGenerator:
         "Motivated worker with background in {domain}. {years} years experience. Flexible schedule.",
     ]
     
+    JOB_DESCRIPTION_TEMPLATES = (
+        "We are seeking a talented {title} to join our {department} team at {company}. "
+        "You will work on challenging projects using {skills} and collaborate with "
+        "cross-functional teams to deliver innovative solutions.",
+        
+        "{company} is looking for a {level}-level {title} to help build "
+        "the next generation of our products. Experience with {skills} is essential. "
+        "You'll have the opportunity to make a significant impact on our technical direction.",
+        
+        "Join {company}'s growing {department} team as a {title}. We're building "
+        "cutting-edge solutions and need someone skilled in {skills}. "
+        "This is a great opportunity to work with talented engineers and grow your career.",
+        
+        "As a {title} at {company}, you'll be responsible for designing and implementing "
+        "scalable systems using {skills}. We value innovation, collaboration, "
+        "and continuous learning.",
+    )
+    
+    BLUECOLLAR_DESCRIPTION_TEMPLATES = (
+        "{company} is hiring {title}s! Pay: {pay} ({pay_type}). "
+        "Requirements: {requirements}. Immediate start available. Apply now!",
+        
+        "Looking for reliable {title} to join {company}. "
+        "Earn {pay} ({pay_type} pay). Must have: {requirements}. "
+        "No experience needed - we train!",
+        
+        "JOIN OUR TEAM as a {title} at {company}! "
+        "Competitive pay: {pay}. Requirements: {requirements}. "
+        "Full-time and part-time positions available.",
+        
+        "{title} needed at {company}. Pay: {pay} ({pay_type}). "
+        "We're looking for: {requirements}. Great team environment!",
+        
+        "NOW HIRING: {title} for {company}. "
+        "Starting at {pay}. Requirements: {requirements}. "
+        "Stable work with growth opportunities.",
+    )
+    
     def __init__(self, seed: int = 42):
         """Initialize generator with optional seed for reproducibility."""
-        random.seed(seed)
+        # A private RNG keeps the global random module untouched; hot methods
+        # are bound once so draws skip the attribute lookups
+        self._rand = random.Random(seed)
+        self._choice = self._rand.choice
+        self._randint = self._rand.randint
+        self._randrange = self._rand.randrange
+        self._random = self._rand.random
+        self._sample = partial(_sample, self._randrange)
+        self.seed = seed
+        self._id_pool = ""
+        self._id_offset = 0
+    
+    def _random_id_suffix(self) -> str:
+        """Return an 8-character random hex id suffix.
         
-    def generate_job(self, job_id: str | None = None) -> Job:
-        """Generate a single mock job vacancy."""
-        department = random.choice(self.DEPARTMENTS)
+        Suffixes are sliced from a block of ID_POOL_SIZE ids fetched with a
+        single os.urandom call, refilled when exhausted.
+        """
+        if self._id_offset >= len(self._id_pool):
+            self._id_pool = os.urandom(ID_POOL_SIZE * ID_HEX_CHARS // 2).hex()
+            self._id_offset = 0
+        start = self._id_offset
+        self._id_offset = start + ID_HEX_CHARS
+        return self._id_pool[start:start + ID_HEX_CHARS]
+        
+    def generate_job(self, job_id: str | None = None, validate: bool = False) -> Job:
+        """Generate a single mock job vacancy.
+        
+        Args:
+            job_id: Job ID; a random one is assigned if omitted
+            validate: Run pydantic validation on the generated job
+        """
+        department = self._choice(self.DEPARTMENTS)
         
         # Map department to title category
-        title_category = {
-            "Engineering": "engineering",
-            "Data Science": "data",
-            "Product": "product",
-            "Security": "security",
-            "Infrastructure": "engineering",
-            "Platform": "engineering",
-            "Research": "data",
-            "Analytics": "data"
-        }.get(department, "engineering")
-        
-        title = random.choice(self.JOB_TITLES.get(title_category, self.JOB_TITLES["engineering"]))
-        
-        # Determine experience level from title
-        if any(word in title.lower() for word in ["senior", "staff", "lead", "manager", "architect"]):
-            exp_level = random.choice([ExperienceLevel.SENIOR, ExperienceLevel.LEAD])
-            min_years = random.randint(5, 10)
-        elif "principal" in title.lower():
+        title_category = self.DEPARTMENT_TITLE_CATEGORY.get(department, "engineering")
+        
+        title_range = self.TITLE_RANGES.get(title_category, self.TITLE_RANGES["engineering"])
+        title_idx = self._choice(title_range)
+        title = self.TITLES_FLAT[title_idx]
+        
+        # Determine experience level from title (classified once at class load)
+        exp_class = self.TITLE_EXP_CLASSES[title_idx]
+        if exp_class == EXP_CLASS_SENIOR:
+            exp_level = self._choice(self.SENIOR_LEVELS)
+            min_years = self._randint(5, 10)
+        elif exp_class == EXP_CLASS_PRINCIPAL:
             exp_level = ExperienceLevel.PRINCIPAL
-            min_years = random.randint(10, 15)
+            min_years = self._randint(10, 15)
         else:
-            exp_level = random.choice([ExperienceLevel.JUNIOR, ExperienceLevel.MID])
-            min_years = random.randint(0, 4)
-        
-        # Select skills based on department/title
-        skill_domain = {
-            "Engineering": random.choice(["backend", "frontend", "devops"]),
-            "Data Science": random.choice(["data", "ml"]),
-            "Security": "security",
-            "Infrastructure": "devops",
-            "Platform": "devops",
-        }.get(department, "backend")
-        
-        all_skills = self.SKILLS_BY_DOMAIN.get(skill_domain, self.SKILLS_BY_DOMAIN["backend"])
-        required_skills = random.sample(all_skills, min(5, len(all_skills)))
-        preferred_skills = random.sample(
-            [s for s in all_skills if s not in required_skills],
-            min(3, len(all_skills) - len(required_skills))
+            exp_level = self._choice(self.JUNIOR_LEVELS)
+            min_years = self._randint(0, 4)
+        
+        # Select skills based on department/title. Both draws are always
+        # made so seeded output does not depend on the department.
+        engineering_domain = self._choice(self.ENGINEERING_SKILL_DOMAINS)
+        data_domain = self._choice(self.DATA_SKILL_DOMAINS)
+        if department == "Engineering":
+            skill_domain = engineering_domain
+        elif department == "Data Science":
+            skill_domain = data_domain
+        else:
+            skill_domain = self.FIXED_SKILL_DOMAINS.get(department, "backend")
+        
+        skills = self.SKILLS_FLAT
+        skill_range = self.SKILL_RANGES.get(skill_domain, self.SKILL_RANGES["backend"])
+        required_idx = self._sample(skill_range, min(5, len(skill_range)))
+        preferred_idx = self._sample(
+            [i for i in skill_range if i not in required_idx],
+            min(3, len(skill_range) - len(required_idx))
         )
+        required_skills = [skills[i] for i in required_idx]
+        preferred_skills = [skills[i] for i in preferred_idx]
         
         # Generate salary based on experience level
-        salary_base = {
-            ExperienceLevel.JUNIOR: (70000, 100000),
-            ExperienceLevel.MID: (100000, 140000),
-            ExperienceLevel.SENIOR: (140000, 180000),
-            ExperienceLevel.LEAD: (170000, 220000),
-            ExperienceLevel.PRINCIPAL: (200000, 280000),
-        }[exp_level]
+        salary_base = self.SALARY_BANDS[exp_level]
         
-        salary_min = random.randint(salary_base[0], salary_base[0] + 20000)
-        salary_max = random.randint(salary_min + 20000, max(salary_min + 40000, salary_base[1]))
+        salary_min = self._randint(salary_base[0], salary_base[0] + 20000)
+        salary_max = self._randint(salary_min + 20000, max(salary_min + 40000, salary_base[1]))
         
-        location_type = random.choice(list(LocationType))
-        location = random.choice(self.LOCATIONS) if location_type != LocationType.REMOTE else None
+        location_type = self._choice(self.LOCATION_TYPES)
+        location = self._choice(self.LOCATIONS) if location_type != LocationType.REMOTE else None
         
-        company = random.choice(self.COMPANIES)
-        industry = random.choice(self.INDUSTRIES)
+        company = self._choice(self.COMPANIES)
+        industry = self._choice(self.INDUSTRIES)
         
         description = self._generate_job_description(
             title, company, department, required_skills, exp_level
         )
         
-        return Job(
-            id=job_id or f"job-{uuid.uuid4().hex[:8]}",
+        return _build_model(
+            Job,
+            validate,
+            id=job_id or f"job-{self._random_id_suffix()}",
             title=title,
             company=company,
             description=description,
@@ -318,7 +652,7 @@ class DataGenerator:
             salary_max=salary_max,
             industry=industry,
             department=department,
-            benefits=random.sample(self.BENEFITS, random.randint(4, 8))
+            benefits=self._sample(self.BENEFITS, self._randint(4, 8))
         )
     
     def _generate_job_description(
@@ -326,94 +660,72 @@ class DataGenerator:
         skills: list[str], exp_level: ExperienceLevel
     ) -> str:
         """Generate a realistic job description."""
-        skills_text = ", ".join(skills[:3])
-        
-        descriptions = [
-            f"We are seeking a talented {title} to join our {department} team at {company}. "
-            f"You will work on challenging projects using {skills_text} and collaborate with "
-            f"cross-functional teams to deliver innovative solutions.",
-            
-            f"{company} is looking for a {exp_level.value}-level {title} to help build "
-            f"the next generation of our products. Experience with {skills_text} is essential. "
-            f"You'll have the opportunity to make a significant impact on our technical direction.",
-            
-            f"Join {company}'s growing {department} team as a {title}. We're building "
-            f"cutting-edge solutions and need someone skilled in {skills_text}. "
-            f"This is a great opportunity to work with talented engineers and grow your career.",
-            
-            f"As a {title} at {company}, you'll be responsible for designing and implementing "
-            f"scalable systems using {skills_text}. We value innovation, collaboration, "
-            f"and continuous learning.",
-        ]
-        
-        return random.choice(descriptions)
+        # Pick the template first so only one description is formatted
+        return self._choice(self.JOB_DESCRIPTION_TEMPLATES).format(
+            title=title,
+            company=company,
+            department=department,
+            skills=", ".join(skills[:3]),
+            level=exp_level.value,
+        )
     
-    def generate_candidate(self, candidate_id: str | None = None) -> Candidate:
-        """Generate a single mock candidate profile."""
-        first_name = random.choice(self.FIRST_NAMES)
-        last_name = random.choice(self.LAST_NAMES)
-        name = f"{first_name} {last_name}"
-        email = f"{first_name.lower()}.{last_name.lower()}@email.com"
+    def generate_candidate(self, candidate_id: str | None = None, validate: bool = False) -> Candidate:
+        """Generate a single mock candidate profile.
         
-        years_exp = random.randint(1, 15)
+        Args:
+            candidate_id: Candidate ID; a random one is assigned if omitted
+            validate: Run pydantic validation on the generated candidate
+        """
+        first_idx = self._randrange(len(self.FIRST_NAMES))
+        last_idx = self._randrange(len(self.LAST_NAMES))
+        name, email = self.NAME_TABLE[first_idx * len(self.LAST_NAMES) + last_idx]
+        
+        years_exp = self._randint(1, 15)
         
         # Select a primary domain for the candidate
-        domain = random.choice(["backend", "frontend", "data", "ml", "devops"])
-        domain_label = {
-            "backend": "backend development",
-            "frontend": "frontend development",
-            "data": "data engineering",
-            "ml": "machine learning",
-            "devops": "DevOps and infrastructure"
-        }[domain]
+        domain = self._choice(self.CANDIDATE_DOMAINS)
+        domain_label = self.DOMAIN_LABELS[domain]
         
         # Generate skills from primary domain plus some cross-domain skills
-        primary_skills = random.sample(
-            self.SKILLS_BY_DOMAIN[domain],
-            min(5, len(self.SKILLS_BY_DOMAIN[domain]))
-        )
-        other_domain = random.choice([d for d in self.SKILLS_BY_DOMAIN.keys() if d != domain])
-        cross_skills = random.sample(
-            self.SKILLS_BY_DOMAIN[other_domain],
-            min(2, len(self.SKILLS_BY_DOMAIN[other_domain]))
-        )
-        skills = primary_skills + cross_skills
+        skill_range = self.SKILL_RANGES[domain]
+        primary_idx = self._sample(skill_range, min(5, len(skill_range)))
+        other_domain = self._choice(self.OTHER_SKILL_DOMAINS[domain])
+        other_range = self.SKILL_RANGES[other_domain]
+        cross_idx = self._sample(other_range, min(2, len(other_range)))
+        skills = [self.SKILLS_FLAT[i] for i in primary_idx + cross_idx]
         
         # Generate summary
-        summary_template = random.choice(self.CANDIDATE_SUMMARIES)
+        summary_template = self._choice(self.CANDIDATE_SUMMARIES)
         summary = summary_template.format(years=years_exp, domain=domain_label)
         
         # Current title based on experience
-        title_category = {
-            "backend": "engineering",
-            "frontend": "engineering",
-            "data": "data",
-            "ml": "data",
-            "devops": "engineering"
-        }[domain]
-        
-        possible_titles = self.JOB_TITLES[title_category]
+        title_category = self.DOMAIN_TITLE_CATEGORY[domain]
+        
+        titles = self.TITLES_FLAT
+        title_range = self.TITLE_RANGES[title_category]
         if years_exp < 3:
-            current_title = random.choice([t for t in possible_titles if "Senior" not in t and "Lead" not in t])
+            current_title = titles[self._choice(self.EARLY_CAREER_TITLES[title_category])]
         elif years_exp < 7:
-            current_title = random.choice([t for t in possible_titles if "Senior" in t or "Engineer" in t])
+            current_title = titles[self._choice(self.MID_CAREER_TITLES[title_category])]
         else:
-            current_title = random.choice(possible_titles)
+            current_title = titles[self._choice(title_range)]
         
         # Preferences
-        preferred_titles = random.sample(possible_titles, min(3, len(possible_titles)))
-        preferred_location_types = random.sample(list(LocationType), random.randint(1, 3))
-        preferred_locations = random.sample(self.LOCATIONS, random.randint(1, 3)) if LocationType.ONSITE in preferred_location_types or LocationType.HYBRID in preferred_location_types else []
+        preferred_titles = [titles[i] for i in self._sample(title_range, min(3, len(title_range)))]
+        preferred_location_types = self._sample(self.LOCATION_TYPES, self._randint(1, 3))
+        preferred_locations = self._sample(self.LOCATIONS, self._randint(1, 3)) if LocationType.ONSITE in preferred_location_types or LocationType.HYBRID in preferred_location_types else []
         
         # Salary expectations based on experience
         base_salary = 70000 + (years_exp * 10000)
-        min_salary = base_salary + random.randint(-10000, 10000)
-        max_salary = min_salary + random.randint(30000, 60000)
+        min_salary = base_salary + self._randint(-10000, 10000)
+        max_salary = min_salary + self._randint(30000, 60000)
         
-        preferred_industries = random.sample(self.INDUSTRIES, random.randint(1, 4))
+        preferred_industries = self._sample(self.INDUSTRIES, self._randint(1, 4))
         
-        return Candidate(
-            id=candidate_id or f"candidate-{uuid.uuid4().hex[:8]}",
+        return _build_model(
+            Candidate,
+            validate,
+            id=candidate_id or f"candidate-{self._random_id_suffix()}",
             name=name,
             email=email,
             summary=summary,
@@ -430,65 +742,64 @@ class DataGenerator:
             accepted_job_id=None
         )
     
-    def generate_bluecollar_job(self, job_id: str | None = None) -> Job:
-        """Generate a single blue-collar job vacancy."""
-        job_category = random.choice(list(self.BLUECOLLAR_TITLES.keys()))
-        title = random.choice(self.BLUECOLLAR_TITLES[job_category])
-        company = random.choice(self.BLUECOLLAR_COMPANIES)
-        industry = random.choice(self.BLUECOLLAR_INDUSTRIES)
+    def generate_bluecollar_job(self, job_id: str | None = None, validate: bool = False) -> Job:
+        """Generate a single blue-collar job vacancy.
+        
+        Args:
+            job_id: Job ID; a random one is assigned if omitted
+            validate: Run pydantic validation on the generated job
+        """
+        job_category = self._choice(self.BLUECOLLAR_CATEGORIES)
+        title = self.BLUECOLLAR_TITLES_FLAT[self._choice(self.BLUECOLLAR_TITLE_RANGES[job_category])]
+        company = self._choice(self.BLUECOLLAR_COMPANIES)
+        industry = self._choice(self.BLUECOLLAR_INDUSTRIES)
         
         # Generate requirements
         requirements = []
         
         # Add license requirement for driving jobs
         if job_category in ["delivery", "moving"]:
-            requirements.append(random.choice(self.BLUECOLLAR_REQUIREMENTS["licenses"][:2]))
+            requirements.append(self._choice(self.BLUECOLLAR_REQUIREMENTS["licenses"][:2]))
         elif job_category == "warehouse":
-            if random.random() > 0.5:
+            if self._random() > 0.5:
                 requirements.append("Forklift Certification")
         
         # Add physical requirements
-        requirements.extend(random.sample(self.BLUECOLLAR_REQUIREMENTS["physical"], random.randint(1, 2)))
+        requirements.extend(self._sample(self.BLUECOLLAR_REQUIREMENTS["physical"], self._randint(1, 2)))
         
         # Add age requirement
         if job_category in ["delivery", "security"]:
-            requirements.append(random.choice(self.BLUECOLLAR_REQUIREMENTS["age"]))
+            requirements.append(self._choice(self.BLUECOLLAR_REQUIREMENTS["age"]))
         
         # Add other requirements
-        requirements.extend(random.sample(self.BLUECOLLAR_REQUIREMENTS["other"], random.randint(2, 4)))
+        requirements.extend(self._sample(self.BLUECOLLAR_REQUIREMENTS["other"], self._randint(2, 4)))
         
         # Choose pay type
-        pay_type = random.choice([PayType.HOURLY, PayType.DAILY, PayType.WEEKLY])
-        pay_range = self.BLUECOLLAR_PAY[job_category][pay_type.value]
-        pay_min = random.randint(pay_range[0], pay_range[0] + 3)
-        pay_max = random.randint(pay_min + 2, pay_range[1])
+        pay_slot = self._randrange(len(self.BLUECOLLAR_PAY_TYPES))
+        pay_type, annual_multiplier, pay_unit = self.BLUECOLLAR_PAY_TYPES[pay_slot]
+        pay_range = self.BLUECOLLAR_PAY_RANGES[job_category][pay_slot]
+        pay_min = self._randint(pay_range[0], pay_range[0] + 3)
+        pay_max = self._randint(pay_min + 2, pay_range[1])
         
         # Convert to annual equivalent for consistency with Job model
-        annual_multiplier = {
-            PayType.HOURLY: 2080,  # 40 hrs/week * 52 weeks
-            PayType.DAILY: 260,    # 5 days/week * 52 weeks
-            PayType.WEEKLY: 52,
-        }
-        salary_min = pay_min * annual_multiplier[pay_type]
-        salary_max = pay_max * annual_multiplier[pay_type]
+        salary_min = pay_min * annual_multiplier
+        salary_max = pay_max * annual_multiplier
         
         # Location
-        location_type = random.choice([LocationType.ONSITE, LocationType.HYBRID])
-        location = random.choice(self.LOCATIONS)
+        location_type = self._choice(self.BLUECOLLAR_LOCATION_TYPES)
+        location = self._choice(self.LOCATIONS)
         
         # Description with pay info
-        pay_text = {
-            PayType.HOURLY: f"${pay_min}-${pay_max}/hour",
-            PayType.DAILY: f"${pay_min}-${pay_max}/day",
-            PayType.WEEKLY: f"${pay_min}-${pay_max}/week",
-        }[pay_type]
+        pay_text = f"${pay_min}-${pay_max}/{pay_unit}"
         
         description = self._generate_bluecollar_description(
             title, company, requirements, pay_text, pay_type
         )
         
-        return Job(
-            id=job_id or f"job-{uuid.uuid4().hex[:8]}",
+        return _build_model(
+            Job,
+            validate,
+            id=job_id or f"job-{self._random_id_suffix()}",
             title=title,
             company=company,
             description=description,
@@ -501,8 +812,8 @@ class DataGenerator:
             salary_min=salary_min,
             salary_max=salary_max,
             industry=industry,
-            department=job_category.title(),
-            benefits=random.sample(self.BLUECOLLAR_BENEFITS, random.randint(3, 6))
+            department=self.BLUECOLLAR_CATEGORY_DEPARTMENTS[job_category],
+            benefits=self._sample(self.BLUECOLLAR_BENEFITS, self._randint(3, 6))
         )
     
     def _generate_bluecollar_description(
@@ -510,50 +821,31 @@ class DataGenerator:
         pay_text: str, pay_type: PayType
     ) -> str:
         """Generate a blue-collar job description."""
-        req_text = ", ".join(requirements[:3])
-        
-        descriptions = [
-            f"{company} is hiring {title}s! Pay: {pay_text} ({pay_type.value}). "
-            f"Requirements: {req_text}. Immediate start available. Apply now!",
-            
-            f"Looking for reliable {title} to join {company}. "
-            f"Earn {pay_text} ({pay_type.value} pay). Must have: {req_text}. "
-            f"No experience needed - we train!",
-            
-            f"JOIN OUR TEAM as a {title} at {company}! "
-            f"Competitive pay: {pay_text}. Requirements: {req_text}. "
-            f"Full-time and part-time positions available.",
-            
-            f"{title} needed at {company}. Pay: {pay_text} ({pay_type.value}). "
-            f"We're looking for: {req_text}. Great team environment!",
-            
-            f"NOW HIRING: {title} for {company}. "
-            f"Starting at {pay_text}. Requirements: {req_text}. "
-            f"Stable work with growth opportunities.",
-        ]
-        
-        return random.choice(descriptions)
+        # Pick the template first so only one description is formatted
+        return self._choice(self.BLUECOLLAR_DESCRIPTION_TEMPLATES).format(
+            title=title,
+            company=company,
+            requirements=", ".join(requirements[:3]),
+            pay=pay_text,
+            pay_type=pay_type.value,
+        )
     
-    def generate_bluecollar_candidate(self, candidate_id: str | None = None) -> Candidate:
-        """Generate a blue-collar candidate profile."""
-        first_name = random.choice(self.BLUECOLLAR_FIRST_NAMES)
-        last_name = random.choice(self.LAST_NAMES)
-        name = f"{first_name} {last_name}"
-        email = f"{first_name.lower()}.{last_name.lower()}@email.com"
+    def generate_bluecollar_candidate(self, candidate_id: str | None = None, validate: bool = False) -> Candidate:
+        """Generate a blue-collar candidate profile.
         
-        years_exp = random.randint(0, 10)
+        Args:
+            candidate_id: Candidate ID; a random one is assigned if omitted
+            validate: Run pydantic validation on the generated candidate
+        """
+        first_idx = self._randrange(len(self.BLUECOLLAR_FIRST_NAMES))
+        last_idx = self._randrange(len(self.LAST_NAMES))
+        name, email = self.BLUECOLLAR_NAME_TABLE[first_idx * len(self.LAST_NAMES) + last_idx]
+        
+        years_exp = self._randint(0, 10)
         
         # Select job category preference
-        job_category = random.choice(list(self.BLUECOLLAR_TITLES.keys()))
-        domain_label = {
-            "delivery": "delivery and driving",
-            "warehouse": "warehouse operations",
-            "cleaning": "cleaning and janitorial",
-            "maintenance": "maintenance and repairs",
-            "security": "security work",
-            "moving": "moving and logistics",
-            "construction": "construction and labor"
-        }[job_category]
+        job_category = self._choice(self.BLUECOLLAR_CATEGORIES)
+        domain_label = self.BLUECOLLAR_DOMAIN_LABELS[job_category]
         
         # Generate qualifications/skills
         skills = []
@@ -561,21 +853,21 @@ class DataGenerator:
         # Add relevant licenses
         if job_category in ["delivery", "moving"]:
             skills.append("Valid Driver's License")
-            if random.random() > 0.7:
-                skills.append(random.choice(["CDL Class A", "CDL Class B"]))
-        elif job_category == "warehouse" and random.random() > 0.5:
+            if self._random() > 0.7:
+                skills.append(self._choice(["CDL Class A", "CDL Class B"]))
+        elif job_category == "warehouse" and self._random() > 0.5:
             skills.append("Forklift Certification")
         
         # Add physical abilities
-        skills.extend(random.sample([
+        skills.extend(self._sample([
             "Able to lift 25kg/55lbs",
             "Able to lift 50kg/110lbs", 
             "Good physical condition",
             "Able to stand for 8+ hours"
-        ], random.randint(1, 2)))
+        ], self._randint(1, 2)))
         
         # Add soft skills
-        skills.extend(random.sample([
+        skills.extend(self._sample([
             "Punctual and reliable",
             "Team player",
             "Customer service skills",
@@ -583,27 +875,30 @@ class DataGenerator:
             "Available weekends",
             "Night shift available",
             "Own transportation"
-        ], random.randint(2, 4)))
+        ], self._randint(2, 4)))
         
         # Generate summary
-        summary_template = random.choice(self.BLUECOLLAR_SUMMARIES)
+        summary_template = self._choice(self.BLUECOLLAR_SUMMARIES)
         summary = summary_template.format(years=years_exp, domain=domain_label)
         
         # Current and preferred titles
-        current_title = random.choice(self.BLUECOLLAR_TITLES[job_category])
+        titles = self.BLUECOLLAR_TITLES_FLAT
+        current_title = titles[self._choice(self.BLUECOLLAR_TITLE_RANGES[job_category])]
         preferred_titles = []
-        for cat in random.sample(list(self.BLUECOLLAR_TITLES.keys()), random.randint(2, 4)):
-            preferred_titles.extend(random.sample(self.BLUECOLLAR_TITLES[cat], 1))
+        for cat in self._sample(self.BLUECOLLAR_CATEGORIES, self._randint(2, 4)):
+            preferred_titles.extend(titles[i] for i in self._sample(self.BLUECOLLAR_TITLE_RANGES[cat], 1))
         
         # Salary expectations (hourly equivalent converted to annual)
-        hourly_rate = random.randint(14, 25)
+        hourly_rate = self._randint(14, 25)
         min_salary = hourly_rate * 2080  # Annual equivalent
-        max_salary = (hourly_rate + random.randint(5, 10)) * 2080
+        max_salary = (hourly_rate + self._randint(5, 10)) * 2080
         
-        preferred_industries = random.sample(self.BLUECOLLAR_INDUSTRIES, random.randint(2, 4))
+        preferred_industries = self._sample(self.BLUECOLLAR_INDUSTRIES, self._randint(2, 4))
         
-        return Candidate(
-            id=candidate_id or f"candidate-{uuid.uuid4().hex[:8]}",
+        return _build_model(
+            Candidate,
+            validate,
+            id=candidate_id or f"candidate-{self._random_id_suffix()}",
             name=name,
             email=email,
             summary=summary,
@@ -611,8 +906,8 @@ class DataGenerator:
             years_experience=years_exp,
             current_title=current_title,
             preferred_titles=preferred_titles,
-            preferred_location_types=[LocationType.ONSITE, LocationType.HYBRID],
-            preferred_locations=random.sample(self.LOCATIONS, random.randint(1, 3)),
+            preferred_location_types=list(self.BLUECOLLAR_LOCATION_TYPES),
+            preferred_locations=self._sample(self.LOCATIONS, self._randint(1, 3)),
             min_salary=min_salary,
             max_salary=max_salary,
             preferred_industries=preferred_industries,
@@ -620,43 +915,121 @@ class DataGenerator:
             accepted_job_id=None
         )
 
-    def generate_jobs(self, count: int = 100) -> list[Job]:
+    def _iter_many(self, method_name: str, id_prefix: str, count: int) -> Iterator:
+        """Yield count records with sequential ids, one at a time."""
+        method = getattr(self, method_name)
+        for i in range(1, count + 1):
+            yield method(f"{id_prefix}-{i:03d}")
+    
+    def _generate_many(self, method_name: str, id_prefix: str, count: int, workers: int) -> list:
+        """Generate count records with sequential ids, optionally in parallel.
+        
+        With workers > 1 the ids are split into fixed PARALLEL_CHUNK_SIZE
+        chunks generated in a process pool, chunk n seeded with seed + n.
+        The result is reproducible for a given seed regardless of the worker
+        count, but differs from the serial output for the same seed.
+        
+        Args:
+            method_name: Single-record generator method to call
+            id_prefix: Prefix for the sequential ids
+            count: Number of records
+            workers: Number of worker processes (1 generates serially)
+        
+        Returns:
+            List of generated records in id order
+        """
+        if workers <= 1:
+            return list(self._iter_many(method_name, id_prefix, count))
+        
+        starts = range(1, count + 1, PARALLEL_CHUNK_SIZE)
+        stops = [min(start + PARALLEL_CHUNK_SIZE, count + 1) for start in starts]
+        seeds = [self.seed + chunk for chunk in range(len(starts))]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = pool.map(
+                _generate_chunk, seeds, repeat(method_name), repeat(id_prefix), starts, stops
+            )
+            return [record for chunk in chunks for record in chunk]
+    
+    def iter_jobs(self, count: int = 100) -> Iterator[Job]:
+        """Yield job vacancies one at a time.
+        
+        Pair with save_jobs to write large data sets without holding every
+        record in memory.
+        """
+        return self._iter_many("generate_job", "job", count)
+    
+    def iter_bluecollar_jobs(self, count: int = 200) -> Iterator[Job]:
+        """Yield blue-collar job vacancies one at a time."""
+        return self._iter_many("generate_bluecollar_job", "job-bc", count)
+    
+    def iter_candidates(self, count: int = 10) -> Iterator[Candidate]:
+        """Yield candidate profiles one at a time."""
+        return self._iter_many("generate_candidate", "candidate", count)
+    
+    def iter_bluecollar_candidates(self, count: int = 20) -> Iterator[Candidate]:
+        """Yield blue-collar candidate profiles one at a time."""
+        return self._iter_many("generate_bluecollar_candidate", "candidate-bc", count)
+    
+    def generate_jobs(self, count: int = 100, workers: int = 1) -> list[Job]:
         """Generate multiple job vacancies."""
-        return [self.generate_job(f"job-{i:03d}") for i in range(1, count + 1)]
+        return self._generate_many("generate_job", "job", count, workers)
     
-    def generate_bluecollar_jobs(self, count: int = 200) -> list[Job]:
+    def generate_bluecollar_jobs(self, count: int = 200, workers: int = 1) -> list[Job]:
         """Generate multiple blue-collar job vacancies."""
-        return [self.generate_bluecollar_job(f"job-bc-{i:03d}") for i in range(1, count + 1)]
+        return self._generate_many("generate_bluecollar_job", "job-bc", count, workers)
     
-    def generate_candidates(self, count: int = 10) -> list[Candidate]:
+    def generate_candidates(self, count: int = 10, workers: int = 1) -> list[Candidate]:
         """Generate multiple candidate profiles."""
-        return [self.generate_candidate(f"candidate-{i:03d}") for i in range(1, count + 1)]
+        return self._generate_many("generate_candidate", "candidate", count, workers)
     
-    def generate_bluecollar_candidates(self, count: int = 20) -> list[Candidate]:
+    def generate_bluecollar_candidates(self, count: int = 20, workers: int = 1) -> list[Candidate]:
         """Generate multiple blue-collar candidate profiles."""
-        return [self.generate_bluecollar_candidate(f"candidate-bc-{i:03d}") for i in range(1, count + 1)]
+        return self._generate_many("generate_bluecollar_candidate", "candidate-bc", count, workers)
     
-    def save_jobs(self, jobs: list[Job], filepath: Path) -> None:
-        """Save jobs to JSON file."""
+    def save_jobs(self, jobs: Iterable[Job], filepath: Path) -> None:
+        """Save jobs to JSON file.
+        
+        A list is serialized in one pass and written with a single write;
+        any other iterable is streamed record by record.
+        """
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w") as f:
-            json.dump([job.model_dump() for job in jobs], f, indent=2)
+        if isinstance(jobs, list):
+            filepath.write_bytes(_JOB_LIST_ADAPTER.dump_json(jobs, indent=2))
+        else:
+            _write_json_array(jobs, filepath)
     
-    def save_candidates(self, candidates: list[Candidate], filepath: Path) -> None:
-        """Save candidates to JSON file."""
+    def save_candidates(self, candidates: Iterable[Candidate], filepath: Path) -> None:
+        """Save candidates to JSON file.
+        
+        Lists are written in a single write, as in save_jobs.
+        """
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w") as f:
-            json.dump([c.model_dump() for c in candidates], f, indent=2)
+        if isinstance(candidates, list):
+            filepath.write_bytes(_CANDIDATE_LIST_ADAPTER.dump_json(candidates, indent=2))
+        else:
+            _write_json_array(candidates, filepath)
     
     def load_jobs(self, filepath: Path) -> list[Job]:
         """Load jobs from JSON file."""
-        with open(filepath) as f:
-            data = json.load(f)
-        return [Job(**job) for job in data]
+        return _JOB_LIST_ADAPTER.validate_json(filepath.read_bytes())
+    
+    def iter_jobs_from_file(self, filepath: Path) -> Iterator[Job]:
+        """Stream jobs from a JSON file one at a time.
+        
+        The top-level array is parsed incrementally, so memory use stays flat
+        regardless of the file size.
+        """
+        with open(filepath, "rb") as f:
+            for job in ijson.items(f, "item", use_float=True):
+                yield Job(**job)
     
     def load_candidates(self, filepath: Path) -> list[Candidate]:
         """Load candidates from JSON file."""
-        with open(filepath) as f:
-            data = json.load(f)
-        return [Candidate(**c) for c in data]
+        return _CANDIDATE_LIST_ADAPTER.validate_json(filepath.read_bytes())
+
 
+def _generate_chunk(seed: int, method_name: str, id_prefix: str, start: int, stop: int) -> list:
+    """Process pool entry point: generate ids [start, stop) with a chunk-seeded generator."""
+    generator = DataGenerator(seed)
+    method = getattr(generator, method_name)
+    return [method(f"{id_prefix}-{i:03d}") for i in range(start, stop)]
@@ -1,52 +1,266 @@
 #!/usr/bin/env python3
 """Deploy Vertex AI Vector Search index."""
 
+import argparse
+import asyncio
+import json
+import re
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from config.settings import get_settings
-from src.services.vector_search import VectorSearchService
+from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
+from pydantic import ValidationError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from config.settings import get_cloud_settings
 
-def update_env_file(key: str, value: str):
-    """Update a key in the .env file."""
-    env_file = project_root / ".env"
+if TYPE_CHECKING:
+    # Imported in main(): loading the Vertex AI SDK is slow and not needed
+    # when the script exits early on missing configuration
+    from src.services.vector_search import VectorSearchService
+
+# Records completed deployment phases so re-runs skip them
+DEPLOY_STATE_FILE = ".deploy_state.json"
+
+# Embeddings file uploaded by create_embeddings.py
+EMBEDDINGS_FILENAME = "job_embeddings.jsonl"
+
+# Retry transient API errors a few times (waiting 1s, 2s) before giving up.
+# Only errors meaning the request was not accepted are retried: after a
+# timeout or internal error the create/deploy call may still have gone
+# through, and repeating it could create a duplicate index or endpoint.
+gcp_retry = retry(
+    retry=retry_if_exception_type((ResourceExhausted, ServiceUnavailable)),
+    wait=wait_exponential(multiplier=1, max=4),
+    stop=stop_after_attempt(3),
+    reraise=True,
+)
+
+
+class DeployState:
+    """Completed deployment phases, persisted to a JSON state file.
+    
+    Each phase records the resource it produced, so a phase only counts as
+    done for that same resource; pointing .env at a different index or
+    endpoint runs the phase again.
+    """
+    
+    def __init__(self, path: Path):
+        """Load the state file if it exists.
+        
+        Args:
+            path: Path to the state file
+        """
+        self.path = path
+        self._phases: dict[str, dict] = {}
+        if path.exists():
+            self._phases = json.loads(path.read_text())
+    
+    def is_done(self, phase: str, resource_name: Optional[str]) -> bool:
+        """Check whether a phase completed for the given resource."""
+        entry = self._phases.get(phase)
+        return bool(resource_name) and entry is not None and entry.get("resource_name") == resource_name
+    
+    def mark_done(self, phase: str, resource_name: str) -> None:
+        """Record a completed phase and write the state file atomically."""
+        self._phases[phase] = {"phase": "done", "resource_name": resource_name}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(self._phases, indent=2))
+        os.replace(tmp_path, self.path)
+
+
+@lru_cache(maxsize=None)
+def _env_key_pattern(key: str) -> re.Pattern:
+    """Compile the pattern matching a key's line in a .env file."""
+    return re.compile(rf"^{re.escape(key)}=[^\r\n]*", re.MULTILINE)
+
+
+class EnvFileBuffer:
+    """Buffer updates to the .env file and write them back in one go.
+    
+    The file is read once on enter and every set() only touches memory.
+    Pending updates are written on exit, including when the script exits
+    early or fails, so resources created before the failure are recorded.
+    Writes go to a temporary file that atomically replaces .env, so an
+    interrupted write never leaves it truncated. As before, nothing is
+    written if .env does not exist.
+    """
+    
+    def __init__(self, path: Path):
+        """Initialize the buffer.
+        
+        Args:
+            path: Path to the .env file
+        """
+        self.path = path
+        self._text = ""
+        self._dirty = False
     
-    if not env_file.exists():
-        return
+    def __enter__(self) -> "EnvFileBuffer":
+        if self.path.exists():
+            self._text = self.path.read_text()
+        return self
     
-    with open(env_file, "r") as f:
-        lines = f.readlines()
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
     
-    updated = False
-    for i, line in enumerate(lines):
-        if line.startswith(f"{key}="):
-            lines[i] = f"{key}={value}\n"
-            updated = True
-            break
+    def set(self, key: str, value: str) -> None:
+        """Set a key, replacing its existing line or appending a new one."""
+        line = f"{key}={value}"
+        # A function replacement keeps backslashes in the value literal
+        self._text, replaced = _env_key_pattern(key).subn(lambda _: line, self._text, count=1)
+        if not replaced:
+            if self._text and not self._text.endswith("\n"):
+                self._text += "\n"
+            self._text += line + "\n"
+        self._dirty = True
+    
+    def flush(self) -> None:
+        """Write pending updates to disk."""
+        if not self._dirty or not self.path.exists():
+            return
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(self._text)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Create and deploy the Vector Search index.")
+    parser.add_argument(
+        "-y", "--yes",
+        action="store_true",
+        help="Answer yes to every prompt (also enabled by DEPLOY_AUTO_APPROVE=1)",
+    )
+    parser.add_argument(
+        "--skip-index",
+        action="store_true",
+        help="Do not create the index; use VECTOR_SEARCH_INDEX_ID if set",
+    )
+    parser.add_argument(
+        "--skip-endpoint",
+        action="store_true",
+        help="Do not create the endpoint; use VECTOR_SEARCH_ENDPOINT_ID if set",
+    )
+    parser.add_argument(
+        "--skip-preflight",
+        action="store_true",
+        help="Do not check the uploaded embeddings against the local manifest",
+    )
+    parser.add_argument(
+        "--skip-deploy",
+        action="store_true",
+        help="Stop before deploying the index to the endpoint",
+    )
+    args = parser.parse_args()
+    args.yes = args.yes or os.getenv("DEPLOY_AUTO_APPROVE", "") not in ("", "0")
+    return args
+
+
+def confirm(prompt: str, assume_yes: bool = False) -> bool:
+    """Ask a yes/no question on stdin.
     
-    if not updated:
-        lines.append(f"{key}={value}\n")
+    Args:
+        prompt: Question to print
+        assume_yes: Answer yes without prompting (non-interactive runs)
     
-    with open(env_file, "w") as f:
-        f.writelines(lines)
+    Returns:
+        True if the answer is yes
+    """
+    if assume_yes:
+        print(f"{prompt}y (auto-approved)")
+        return True
+    return input(prompt).lower() == "y"
+
+
+def preflight_embeddings(
+    vector_service: "VectorSearchService",
+    manifest_file: Path,
+    embeddings_uri: str
+) -> str:
+    """Check that the uploaded embeddings match the local upload manifest.
+    
+    Index creation takes 30-60 minutes, so a missing, partial or stale
+    upload is caught before it starts rather than after.
+    
+    Args:
+        vector_service: Service used to look up the uploaded file
+        manifest_file: Manifest written by create_embeddings.py
+        embeddings_uri: GCS URI the index will be built from
+    
+    Returns:
+        The verified CRC32C of the embeddings file
+    
+    Raises:
+        RuntimeError: If the manifest or upload is missing or they differ
+    """
+    if not manifest_file.exists():
+        raise RuntimeError(
+            f"No upload manifest at {manifest_file}; run scripts/create_embeddings.py first"
+        )
+    manifest = json.loads(manifest_file.read_text())
+    if manifest.get("gcs_uri") != embeddings_uri:
+        raise RuntimeError(
+            f"Manifest describes {manifest.get('gcs_uri')}, not {embeddings_uri}"
+        )
+    
+    uploaded = vector_service.get_embeddings_checksums(EMBEDDINGS_FILENAME)
+    if uploaded is None:
+        raise RuntimeError(f"{embeddings_uri} does not exist")
+    
+    # Multipart uploads have no MD5, but GCS always reports a CRC32C
+    keys = ("size", "crc32c", "md5") if uploaded["md5"] else ("size", "crc32c")
+    for key in keys:
+        if uploaded[key] != manifest[key]:
+            raise RuntimeError(
+                f"{embeddings_uri} does not match the local manifest "
+                f"({key}: {uploaded[key]} uploaded, {manifest[key]} expected); "
+                "re-run scripts/create_embeddings.py to upload it again"
+            )
+    return manifest["crc32c"]
+
+
+async def wait_for_operations(
+    vector_service: "VectorSearchService",
+    operations: dict[str, str]
+) -> dict[str, str | Exception]:
+    """Poll several creation operations concurrently.
+    
+    Args:
+        vector_service: Service used to poll the operations
+        operations: Mapping of label to operation name
+    
+    Returns:
+        Mapping of label to created resource name, or the exception the
+        operation failed with
+    """
+    results = await asyncio.gather(
+        *(vector_service.wait_for_operation(name) for name in operations.values()),
+        return_exceptions=True,
+    )
+    return dict(zip(operations, results))
 
 
 def main():
     """Create and deploy Vector Search index."""
+    args = parse_args()
+    
     print("=" * 50)
     print("Vector AI PoC - Index Deployment")
     print("=" * 50)
     
-    settings = get_settings()
-    
-    # Check configuration
-    if not settings.google_cloud_project:
+    # Fail fast on missing configuration
+    try:
+        settings = get_cloud_settings()
+    except ValidationError:
         print("\nError: GOOGLE_CLOUD_PROJECT not set in .env file.")
         print("Please run: ./scripts/setup_gcp.sh <PROJECT_ID>")
         sys.exit(1)
@@ -59,127 +273,213 @@ def main():
     print(f"Region: {settings.google_cloud_region}")
     print(f"GCS Bucket: {settings.gcs_bucket}")
     
-    # Initialize vector search service
-    print("\nInitializing Vector Search service...")
-    try:
-        vector_service = VectorSearchService()
-        print("✓ Vector Search service initialized")
-    except Exception as e:
-        print(f"Error: {e}")
-        sys.exit(1)
-    
-    # Check for existing index
-    if settings.vector_search_index_id:
-        print(f"\nExisting index found: {settings.vector_search_index_id}")
-        response = input("Use existing index? (y/n): ")
-        if response.lower() == "y":
+    with EnvFileBuffer(project_root / ".env") as env:
+        # Initialize vector search service
+        print("\nInitializing Vector Search service...")
+        try:
+            from src.services.vector_search import VectorSearchService
+            
+            vector_service = VectorSearchService()
+            print("✓ Vector Search service initialized")
+        except Exception as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        
+        state = DeployState(project_root / DEPLOY_STATE_FILE)
+        
+        # Check for existing index
+        if state.is_done("index_created", settings.vector_search_index_id):
+            print(f"\n✓ Using index from previous run: {settings.vector_search_index_id}")
             vector_service.load_index(settings.vector_search_index_id)
-        else:
-            settings.vector_search_index_id = ""
-    
-    # Create index if needed
-    if not settings.vector_search_index_id:
-        print("\n" + "-" * 50)
-        print("Creating Vector Search Index")
-        print("-" * 50)
-        print("\nNote: Index creation takes approximately 30-60 minutes.")
-        print("The script will create the index and return immediately.")
-        print("You can check the status in the Google Cloud Console.")
+        elif settings.vector_search_index_id:
+            print(f"\nExisting index found: {settings.vector_search_index_id}")
+            if args.skip_index or confirm("Use existing index? (y/n): ", args.yes):
+                vector_service.load_index(settings.vector_search_index_id)
+            else:
+                settings.vector_search_index_id = ""
         
-        response = input("\nProceed with index creation? (y/n): ")
-        if response.lower() != "y":
-            print("Index creation cancelled.")
-            sys.exit(0)
+        # Check for existing endpoint
+        if state.is_done("endpoint_created", settings.vector_search_endpoint_id):
+            print(f"\n✓ Using endpoint from previous run: {settings.vector_search_endpoint_id}")
+            vector_service.load_endpoint(settings.vector_search_endpoint_id)
+        elif settings.vector_search_endpoint_id:
+            print(f"\nExisting endpoint found: {settings.vector_search_endpoint_id}")
+            if args.skip_endpoint or confirm("Use existing endpoint? (y/n): ", args.yes):
+                vector_service.load_endpoint(settings.vector_search_endpoint_id)
+            else:
+                settings.vector_search_endpoint_id = ""
         
-        embeddings_uri = f"gs://{settings.gcs_bucket}/embeddings/job_embeddings.jsonl"
-        print(f"\nUsing embeddings from: {embeddings_uri}")
+        # Create index if needed. Creation is only submitted here; its
+        # operation is recorded in .env so a re-run resumes waiting on it.
+        index_operation = settings.vector_search_index_operation
+        if args.skip_index:
+            if not settings.vector_search_index_id:
+                print("\nSkipping index creation (--skip-index)")
+        elif not settings.vector_search_index_id and index_operation:
+            print(f"\nResuming index creation: {index_operation}")
+        elif not settings.vector_search_index_id:
+            print("\n" + "-" * 50)
+            print("Creating Vector Search Index")
+            print("-" * 50)
+            print("\nNote: Index creation takes approximately 30-60 minutes.")
+            print("The endpoint is created at the same time.")
+            print("You can check the status in the Google Cloud Console.")
+            
+            if not confirm("\nProceed with index creation? (y/n): ", args.yes):
+                print("Index creation cancelled.")
+                sys.exit(0)
+            
+            embeddings_uri = f"gs://{settings.gcs_bucket}/embeddings/{EMBEDDINGS_FILENAME}"
+            print(f"\nUsing embeddings from: {embeddings_uri}")
+            
+            if not args.skip_preflight:
+                from src.services.vector_search import EMBEDDINGS_MANIFEST_FILENAME
+                
+                try:
+                    preflight_hash = preflight_embeddings(
+                        vector_service,
+                        settings.data_dir / EMBEDDINGS_MANIFEST_FILENAME,
+                        embeddings_uri,
+                    )
+                except RuntimeError as e:
+                    print(f"Error: {e}")
+                    sys.exit(1)
+                # Ties the index to the exact embeddings it was built from
+                env.set("EMBEDDINGS_PREFLIGHT_HASH", preflight_hash)
+                print(f"✓ Embeddings verified (crc32c {preflight_hash})")
+            
+            try:
+                index_operation = gcp_retry(vector_service.start_index_creation)(
+                    display_name="job-vacancies-index",
+                    embeddings_gcs_uri=embeddings_uri,
+                    description="Vector search index for job matching PoC"
+                )
+            except Exception as e:
+                print(f"Error creating index: {e}")
+                sys.exit(1)
+            
+            # Persist right away so an interrupted run does not create a second index
+            env.set("VECTOR_SEARCH_INDEX_OPERATION", index_operation)
+            env.flush()
+            print(f"\n✓ Index creation initiated: {index_operation}")
         
-        try:
-            index = vector_service.create_index(
-                display_name="job-vacancies-index",
-                embeddings_gcs_uri=embeddings_uri,
-                description="Vector search index for job matching PoC"
-            )
+        # Create endpoint if needed
+        endpoint_operation = settings.vector_search_endpoint_operation
+        if args.skip_endpoint:
+            if not settings.vector_search_endpoint_id:
+                print("\nSkipping endpoint creation (--skip-endpoint)")
+        elif not settings.vector_search_endpoint_id and endpoint_operation:
+            print(f"\nResuming endpoint creation: {endpoint_operation}")
+        elif not settings.vector_search_endpoint_id:
+            print("\n" + "-" * 50)
+            print("Creating Index Endpoint")
+            print("-" * 50)
             
-            # Update .env file
-            update_env_file("VECTOR_SEARCH_INDEX_ID", index.resource_name)
-            print(f"\n✓ Index creation initiated: {index.resource_name}")
-            print("✓ Updated .env with VECTOR_SEARCH_INDEX_ID")
+            if not confirm("\nProceed with endpoint creation? (y/n): ", args.yes):
+                print("Endpoint creation cancelled.")
+                sys.exit(0)
             
-        except Exception as e:
-            print(f"Error creating index: {e}")
-            sys.exit(1)
-    
-    # Check for existing endpoint
-    if settings.vector_search_endpoint_id:
-        print(f"\nExisting endpoint found: {settings.vector_search_endpoint_id}")
-        response = input("Use existing endpoint? (y/n): ")
-        if response.lower() == "y":
-            vector_service.load_endpoint(settings.vector_search_endpoint_id)
-        else:
-            settings.vector_search_endpoint_id = ""
-    
-    # Create endpoint if needed
-    if not settings.vector_search_endpoint_id:
+            try:
+                endpoint_operation = gcp_retry(vector_service.start_endpoint_creation)(
+                    display_name="job-vacancies-endpoint",
+                    description="Endpoint for job matching PoC"
+                )
+            except Exception as e:
+                print(f"Error creating endpoint: {e}")
+                sys.exit(1)
+            
+            env.set("VECTOR_SEARCH_ENDPOINT_OPERATION", endpoint_operation)
+            env.flush()
+            print(f"\n✓ Endpoint creation initiated: {endpoint_operation}")
+        
+        # Wait for both creations concurrently
+        pending = {}
+        if not settings.vector_search_index_id and not args.skip_index:
+            pending["VECTOR_SEARCH_INDEX"] = index_operation
+        if not settings.vector_search_endpoint_id and not args.skip_endpoint:
+            pending["VECTOR_SEARCH_ENDPOINT"] = endpoint_operation
+        
+        if pending:
+            print("\nWaiting for creation to complete (safe to interrupt and re-run)...")
+            results = asyncio.run(wait_for_operations(vector_service, pending))
+            
+            failed = False
+            for prefix, result in results.items():
+                # A finished operation is never polled again, whatever its outcome
+                env.set(f"{prefix}_OPERATION", "")
+                if isinstance(result, Exception):
+                    print(f"Error: {result}")
+                    failed = True
+                else:
+                    env.set(f"{prefix}_ID", result)
+                    setattr(settings, f"{prefix.lower()}_id", result)
+                    print(f"✓ Created {result}")
+                    print(f"✓ Updated .env with {prefix}_ID")
+            if failed:
+                sys.exit(1)
+            
+            if "VECTOR_SEARCH_INDEX" in results:
+                vector_service.load_index(results["VECTOR_SEARCH_INDEX"])
+            if "VECTOR_SEARCH_ENDPOINT" in results:
+                vector_service.load_endpoint(results["VECTOR_SEARCH_ENDPOINT"])
+        
+        if settings.vector_search_index_id:
+            state.mark_done("index_created", settings.vector_search_index_id)
+        if settings.vector_search_endpoint_id:
+            state.mark_done("endpoint_created", settings.vector_search_endpoint_id)
+        
+        if args.skip_deploy:
+            print("\nSkipping deployment (--skip-deploy)")
+            return
+        if not (settings.vector_search_index_id and settings.vector_search_endpoint_id):
+            print("\nSkipping deployment: both an index and an endpoint are required.")
+            return
+        
+        # Deploy index to endpoint
+        deployment = (
+            f"{settings.vector_search_endpoint_id}/deployedIndexes/{settings.deployed_index_id}"
+            f"?index={settings.vector_search_index_id}"
+        )
+        if state.is_done("deployed", deployment):
+            print(f"\n✓ Index already deployed as {settings.deployed_index_id}")
+            print("\nStart the service with:")
+            print("  python -m src.api.main")
+            return
+        
         print("\n" + "-" * 50)
-        print("Creating Index Endpoint")
+        print("Deploying Index to Endpoint")
         print("-" * 50)
+        print("\nNote: Deployment takes approximately 20-30 minutes.")
         
-        response = input("\nProceed with endpoint creation? (y/n): ")
-        if response.lower() != "y":
-            print("Endpoint creation cancelled.")
+        if not confirm("\nProceed with deployment? (y/n): ", args.yes):
+            print("Deployment cancelled.")
+            print("\nYou can deploy later by running this script again.")
             sys.exit(0)
         
         try:
-            endpoint = vector_service.create_endpoint(
-                display_name="job-vacancies-endpoint",
-                description="Endpoint for job matching PoC"
+            gcp_retry(vector_service.deploy_index)(
+                deployed_index_id=settings.deployed_index_id,
+                machine_type="e2-standard-16",
+                min_replica_count=1,
+                max_replica_count=1
             )
             
-            # Update .env file
-            update_env_file("VECTOR_SEARCH_ENDPOINT_ID", endpoint.resource_name)
-            print(f"\n✓ Endpoint created: {endpoint.resource_name}")
-            print("✓ Updated .env with VECTOR_SEARCH_ENDPOINT_ID")
+            state.mark_done("deployed", deployment)
+            print("\n✓ Deployment initiated")
             
         except Exception as e:
-            print(f"Error creating endpoint: {e}")
+            print(f"Error deploying index: {e}")
+            print("\nThis might be because the index is still being created.")
+            print("Wait for index creation to complete, then run this script again.")
             sys.exit(1)
-    
-    # Deploy index to endpoint
-    print("\n" + "-" * 50)
-    print("Deploying Index to Endpoint")
-    print("-" * 50)
-    print("\nNote: Deployment takes approximately 20-30 minutes.")
-    
-    response = input("\nProceed with deployment? (y/n): ")
-    if response.lower() != "y":
-        print("Deployment cancelled.")
-        print("\nYou can deploy later by running this script again.")
-        sys.exit(0)
-    
-    try:
-        vector_service.deploy_index(
-            deployed_index_id=settings.deployed_index_id,
-            machine_type="e2-standard-16",
-            min_replica_count=1,
-            max_replica_count=1
-        )
-        
-        print("\n✓ Deployment initiated")
         
-    except Exception as e:
-        print(f"Error deploying index: {e}")
-        print("\nThis might be because the index is still being created.")
-        print("Wait for index creation to complete, then run this script again.")
-        sys.exit(1)
-    
-    print("\n" + "=" * 50)
-    print("Index Deployment Initiated!")
-    print("=" * 50)
-    print("\nWait for deployment to complete (20-30 minutes), then:")
-    print("  python -m src.api.main")
-    print("\nYou can monitor progress in the Google Cloud Console:")
-    print(f"  https://console.cloud.google.com/vertex-ai/matching-engine/indexes?project={settings.google_cloud_project}")
+        print("\n" + "=" * 50)
+        print("Index Deployment Initiated!")
+        print("=" * 50)
+        print("\nWait for deployment to complete (20-30 minutes), then:")
+        print("  python -m src.api.main")
+        print("\nYou can monitor progress in the Google Cloud Console:")
+        print(f"  https://console.cloud.google.com/vertex-ai/matching-engine/indexes?project={settings.google_cloud_project}")
 
 
 if __name__ == "__main__":
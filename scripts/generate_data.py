@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Generate mock job and candidate data."""
 
+import argparse
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add project root to path
@@ -12,22 +14,84 @@ from config.settings import get_settings
 from data_generator import DataGenerator
 
 
-def main():
-    """Generate mock jobs and candidates."""
-    print("=" * 50)
-    print("Vector AI PoC - Data Generation")
-    print("=" * 50)
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Generate mock job and candidate data.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Generate in this many processes (output differs from the serial run)",
+    )
+    mode.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Generate the four data sets concurrently, one process each "
+             "(output differs from the serial run)",
+    )
+    return parser.parse_args()
+
+
+def _generate(method_name: str, count: int, seed: int) -> list:
+    """Generate one data set with its own seeded generator.
     
-    settings = get_settings()
-    generator = DataGenerator(seed=42)  # Fixed seed for reproducibility
+    Runs in a worker process when --parallel is set.
     
-    # Generate tech jobs
-    print("\n📊 Generating 100 tech job vacancies...")
-    tech_jobs = generator.generate_jobs(count=100)
+    Args:
+        method_name: DataGenerator.generate_* method to call
+        count: Number of records to generate
+        seed: Seed for this data set's generator
     
-    # Generate blue-collar jobs
+    Returns:
+        Generated jobs or candidates
+    """
+    return getattr(DataGenerator(seed=seed), method_name)(count=count)
+
+
+def generate_parallel(generator: DataGenerator) -> tuple[list, list, list, list]:
+    """Generate the four data sets concurrently, one process each.
+    
+    Each data set gets its own generator seeded generator.seed + offset,
+    so every stream stays reproducible on its own.
+    
+    Args:
+        generator: Generator whose seed the per-process seeds derive from
+    
+    Returns:
+        Tuple of (tech_jobs, bluecollar_jobs, tech_candidates, bluecollar_candidates)
+    """
+    print("\n📊 Generating 100 tech job vacancies...")
     print("🔧 Generating 200 blue-collar job vacancies...")
-    bluecollar_jobs = generator.generate_bluecollar_jobs(count=200)
+    print("👔 Generating 10 tech candidate profiles...")
+    print("👷 Generating 20 blue-collar candidate profiles...")
+    
+    tasks = [
+        ("generate_jobs", 100),
+        ("generate_bluecollar_jobs", 200),
+        ("generate_candidates", 10),
+        ("generate_bluecollar_candidates", 20),
+    ]
+    with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = [
+            executor.submit(_generate, method_name, count, generator.seed + offset)
+            for offset, (method_name, count) in enumerate(tasks)
+        ]
+        return tuple(future.result() for future in futures)
+
+
+def save_jobs(generator: DataGenerator, tech_jobs: list, bluecollar_jobs: list) -> list:
+    """Save all jobs and print a few samples.
+    
+    Args:
+        generator: Generator used to write the file
+        tech_jobs: Generated tech jobs
+        bluecollar_jobs: Generated blue-collar jobs
+    
+    Returns:
+        Combined list of jobs
+    """
+    settings = get_settings()
     
     # Combine all jobs
     all_jobs = tech_jobs + bluecollar_jobs
@@ -46,13 +110,25 @@ def main():
         hourly = job.salary_min // 2080
         print(f"  - {job.title} at {job.company} (~${hourly}/hour)")
     
-    # Generate tech candidates
-    print("\n👔 Generating 10 tech candidate profiles...")
-    tech_candidates = generator.generate_candidates(count=10)
+    return all_jobs
+
+
+def save_candidates(
+    generator: DataGenerator,
+    tech_candidates: list,
+    bluecollar_candidates: list
+) -> list:
+    """Save all candidates and print a few samples.
     
-    # Generate blue-collar candidates
-    print("👷 Generating 20 blue-collar candidate profiles...")
-    bluecollar_candidates = generator.generate_bluecollar_candidates(count=20)
+    Args:
+        generator: Generator used to write the file
+        tech_candidates: Generated tech candidates
+        bluecollar_candidates: Generated blue-collar candidates
+    
+    Returns:
+        Combined list of candidates
+    """
+    settings = get_settings()
     
     # Combine all candidates
     all_candidates = tech_candidates + bluecollar_candidates
@@ -70,6 +146,48 @@ def main():
         hourly = candidate.min_salary // 2080
         print(f"  - {candidate.name}: {candidate.current_title} (looking for ~${hourly}/hour)")
     
+    return all_candidates
+
+
+def main():
+    """Generate mock jobs and candidates."""
+    args = parse_args()
+    
+    print("=" * 50)
+    print("Vector AI PoC - Data Generation")
+    print("=" * 50)
+    
+    generator = DataGenerator(seed=42)  # Fixed seed for reproducibility
+    
+    if args.parallel:
+        tech_jobs, bluecollar_jobs, tech_candidates, bluecollar_candidates = (
+            generate_parallel(generator)
+        )
+        all_jobs = save_jobs(generator, tech_jobs, bluecollar_jobs)
+        all_candidates = save_candidates(generator, tech_candidates, bluecollar_candidates)
+    else:
+        # Generate tech jobs
+        print("\n📊 Generating 100 tech job vacancies...")
+        tech_jobs = generator.generate_jobs(count=100, workers=args.workers)
+        
+        # Generate blue-collar jobs
+        print("🔧 Generating 200 blue-collar job vacancies...")
+        bluecollar_jobs = generator.generate_bluecollar_jobs(count=200, workers=args.workers)
+        
+        all_jobs = save_jobs(generator, tech_jobs, bluecollar_jobs)
+        
+        # Generate tech candidates
+        print("\n👔 Generating 10 tech candidate profiles...")
+        tech_candidates = generator.generate_candidates(count=10, workers=args.workers)
+        
+        # Generate blue-collar candidates
+        print("👷 Generating 20 blue-collar candidate profiles...")
+        bluecollar_candidates = generator.generate_bluecollar_candidates(
+            count=20, workers=args.workers
+        )
+        
+        all_candidates = save_candidates(generator, tech_candidates, bluecollar_candidates)
+    
     print("\n" + "=" * 50)
     print("Data generation complete!")
     print("=" * 50)
@@ -79,4 +197,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
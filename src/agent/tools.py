@@ -2,33 +2,43 @@
 
 This module provides the tool functions that the ADK agent uses to interact
 with the job matching system. Each tool wraps a service method and returns
-JSON-formatted strings for the agent to process.
+a plain dict, which ADK encodes into the function response for the model.
 
 Design Principles:
 - Tools use ADK's ToolContext for session state management
 - State tracks: candidate_id, last_search_results, preferences_updated
 - Services are injected for testability (Dependency Inversion)
-- All responses are JSON-formatted for agent consumption
+- All responses are JSON-serializable dicts for agent consumption
 
 Reference: https://cloud.google.com/blog/topics/developers-practitioners/remember-this-agent-state-and-memory-with-adk
 """
 
-import json
+import asyncio
 from typing import Optional
 
 from google.adk.tools.tool_context import ToolContext
 
+from src.services.cache_service import (
+    get_cache_service,
+    candidate_profile_cache_key,
+    job_details_cache_key,
+)
 from src.services.job_service import get_job_service
 from src.services.candidate_service import get_candidate_service
 from src.services.matching_service import get_matching_service
 
+# How long tool responses are reused. Candidate profiles are also
+# invalidated whenever the candidate is updated.
+JOB_DETAILS_TTL = 300
+CANDIDATE_PROFILE_TTL = 60
+
 
 def search_jobs(
     tool_context: ToolContext,
     candidate_id: str,
     additional_criteria: Optional[str] = None,
     num_results: int = 3
-) -> str:
+) -> dict:
     """Search for job vacancies matching a candidate's profile.
     
     Uses ADK session state to track search history.
@@ -40,12 +50,14 @@ def search_jobs(
         num_results: Number of job matches to return (default: 3)
     
     Returns:
-        JSON string with matching job details
+        Dictionary with matching job details
     """
-    # Track candidate in session state
+    # Track candidate in session state (one batched write)
     state = tool_context.state
-    state["candidate_id"] = candidate_id
-    state["search_count"] = state.get("search_count", 0) + 1
+    state.update({
+        "candidate_id": candidate_id,
+        "search_count": state.get("search_count", 0) + 1,
+    })
     
     matching_service = get_matching_service()
     result = matching_service.search_jobs_for_candidate(
@@ -58,10 +70,10 @@ def search_jobs(
     if "matches" in result:
         state["last_job_ids"] = [m["id"] for m in result["matches"]]
     
-    return json.dumps(result, indent=2)
+    return result
 
 
-def get_job_details(tool_context: ToolContext, job_id: str) -> str:
+def get_job_details(tool_context: ToolContext, job_id: str) -> dict:
     """Get detailed information about a specific job.
     
     Args:
@@ -69,25 +81,34 @@ def get_job_details(tool_context: ToolContext, job_id: str) -> str:
         job_id: ID of the job to retrieve
     
     Returns:
-        JSON string with full job details
+        Dictionary with full job details
     """
-    # Track viewed jobs in state
+    # Track viewed jobs in state as an insertion-ordered dict of job ID to
+    # True: O(1) membership, and still JSON-serializable
     state = tool_context.state
-    viewed_jobs = state.get("viewed_job_ids", [])
+    viewed_jobs = state.get("viewed_job_ids") or {}
     if job_id not in viewed_jobs:
-        viewed_jobs.append(job_id)
-    state["viewed_job_ids"] = viewed_jobs
+        viewed_jobs[job_id] = True
+        state["viewed_job_ids"] = viewed_jobs
+    
+    cache = get_cache_service()
+    cache_key = job_details_cache_key(job_id)
+    response = cache.get(cache_key)
+    if response is not None:
+        return response
     
     job_service = get_job_service()
     job = job_service.get_job(job_id)
     
     if not job:
-        return json.dumps({"error": f"Job {job_id} not found"})
+        return {"error": f"Job {job_id} not found"}
     
-    return json.dumps(job_service.format_job_details(job), indent=2)
+    response = job_service.format_job_details(job)
+    cache.set(cache_key, response, ttl=JOB_DETAILS_TTL)
+    return response
 
 
-def update_candidate_preferences(
+async def update_candidate_preferences(
     tool_context: ToolContext,
     candidate_id: str,
     min_salary: Optional[int] = None,
@@ -97,11 +118,11 @@ def update_candidate_preferences(
     skills: Optional[list[str]] = None,
     search_immediately: bool = True,
     num_results: int = 3
-) -> str:
+) -> dict:
     """Update preferences AND search for matching jobs in one call.
     
     This is optimized for speed:
-    - Updates preferences in database immediately
+    - Updates preferences in database while searching, concurrently
     - Searches using new preferences + text augmentation (no embedding wait)
     - Queues embedding update in background for future searches
     - Tracks preference changes in ADK session state
@@ -118,43 +139,54 @@ def update_candidate_preferences(
         num_results: Number of job results to return
     
     Returns:
-        JSON with updated preferences AND matching jobs
+        Dictionary with updated preferences AND matching jobs
     """
-    # Track in session state
+    # Track in session state; written once the changes are known
     state = tool_context.state
-    state["candidate_id"] = candidate_id
-    state["preferences_updated"] = True
+    state_changes = {"candidate_id": candidate_id, "preferences_updated": True}
     
     candidate_service = get_candidate_service()
     matching_service = get_matching_service()
     
-    # Build preference changes dict
-    preference_changes = {}
+    # Build preference changes dict from the provided (non-None) fields;
+    # it doubles as the keyword arguments for the update
+    preference_changes = {
+        field: value
+        for field, value in (
+            ("min_salary", min_salary),
+            ("preferred_titles", preferred_titles),
+            ("preferred_location_types", preferred_location_types),
+            ("preferred_industries", preferred_industries),
+            ("skills", skills),
+        )
+        if value is not None
+    }
     if min_salary is not None:
-        preference_changes["min_salary"] = min_salary
-        state["current_min_salary"] = min_salary
-    if preferred_titles is not None:
-        preference_changes["preferred_titles"] = preferred_titles
+        state_changes["current_min_salary"] = min_salary
     if preferred_location_types is not None:
-        preference_changes["preferred_location_types"] = preferred_location_types
-        state["current_location_types"] = preferred_location_types
-    if preferred_industries is not None:
-        preference_changes["preferred_industries"] = preferred_industries
-    if skills is not None:
-        preference_changes["skills"] = skills
-    
-    # Update preferences in database
-    success, updated_fields = candidate_service.update_preferences(
-        candidate_id=candidate_id,
-        min_salary=min_salary,
-        preferred_titles=preferred_titles,
-        preferred_location_types=preferred_location_types,
-        preferred_industries=preferred_industries,
-        skills=skills
+        state_changes["current_location_types"] = preferred_location_types
+    state.update(state_changes)
+    
+    # Update preferences in database. The search only needs preference_changes,
+    # so it runs alongside the update instead of after it.
+    update = candidate_service.update_preferences_async(
+        candidate_id, **preference_changes
     )
+    search_result = None
+    if search_immediately and preference_changes:
+        (success, updated_fields), search_result = await asyncio.gather(
+            update,
+            matching_service.search_with_updated_preferences_async(
+                candidate_id=candidate_id,
+                preference_changes=preference_changes,
+                num_results=num_results
+            ),
+        )
+    else:
+        success, updated_fields = await update
     
     if not success:
-        return json.dumps({"error": f"Candidate {candidate_id} not found"})
+        return {"error": f"Candidate {candidate_id} not found"}
     
     result = {
         "status": "success",
@@ -162,13 +194,8 @@ def update_candidate_preferences(
         "updated_fields": updated_fields,
     }
     
-    # Search immediately with updated preferences (parallel pattern)
-    if search_immediately and preference_changes:
-        search_result = matching_service.search_with_updated_preferences(
-            candidate_id=candidate_id,
-            preference_changes=preference_changes,
-            num_results=num_results
-        )
+    # Results of the search run alongside the update (parallel pattern)
+    if search_result is not None:
         result["matches"] = search_result.get("matches", [])
         # Store in state
         if result["matches"]:
@@ -194,86 +221,92 @@ def update_candidate_preferences(
     else:
         result["message"] = "Preferences updated successfully."
     
-    return json.dumps(result, indent=2)
+    return result
 
 
-def accept_job(tool_context: ToolContext, candidate_id: str, job_id: str) -> str:
+async def accept_job(tool_context: ToolContext, candidate_id: str, job_id: str) -> dict:
     """Record that a candidate has accepted a job offer.
     
+    The acceptance is applied in memory right away; writing it to the
+    candidates file happens in the background so the reply is not held up.
+    
     Args:
         tool_context: ADK tool context for state management
         candidate_id: ID of the candidate
         job_id: ID of the accepted job
     
     Returns:
-        JSON string confirming the acceptance
+        Dictionary confirming the acceptance
     """
     # Track in state
-    state = tool_context.state
-    state["candidate_id"] = candidate_id
-    state["accepted_job_id"] = job_id
-    state["workflow_complete"] = True
-    
-    candidate_service = get_candidate_service()
-    job_service = get_job_service()
+    tool_context.state.update({
+        "candidate_id": candidate_id,
+        "accepted_job_id": job_id,
+        "workflow_complete": True,
+    })
     
-    if not candidate_service.candidate_exists(candidate_id):
-        return json.dumps({"error": f"Candidate {candidate_id} not found"})
+    candidate_found, job, accepted = get_matching_service().validate_and_accept(
+        candidate_id, job_id, save=False
+    )
+    if accepted:
+        get_candidate_service().save_in_background()
     
-    job = job_service.get_job(job_id)
+    if not candidate_found:
+        return {"error": f"Candidate {candidate_id} not found"}
     if not job:
-        return json.dumps({"error": f"Job {job_id} not found"})
-    
-    candidate_service.accept_job(candidate_id, job_id)
+        return {"error": f"Job {job_id} not found"}
     
-    return json.dumps({
+    return {
         "status": "success",
         "candidate_id": candidate_id,
         "accepted_job": {
             "id": job.id,
             "title": job.title,
             "company": job.company,
-            "salary_range": f"${job.salary_min:,} - ${job.salary_max:,}"
+            "salary_range": job.salary_range
         },
         "message": f"Congratulations! You have accepted the {job.title} position at {job.company}."
-    }, indent=2)
+    }
 
 
-def decline_jobs(tool_context: ToolContext, candidate_id: str, job_ids: list[str]) -> str:
+async def decline_jobs(tool_context: ToolContext, candidate_id: str, job_ids: list[str]) -> dict:
     """Record that a candidate has declined job offers.
     
+    Like accept_job, the candidates file is written in the background.
+    
     Args:
         tool_context: ADK tool context for state management
         candidate_id: ID of the candidate
         job_ids: List of job IDs being declined
     
     Returns:
-        JSON string confirming the decline and prompting for new search
+        Dictionary confirming the decline and prompting for new search
     """
-    # Track in state
+    # Track in state. declined_job_ids is the same ordered dict of job ID
+    # to True as viewed_job_ids.
     state = tool_context.state
-    state["candidate_id"] = candidate_id
-    declined_list = state.get("declined_job_ids", [])
-    declined_list.extend(job_ids)
-    state["declined_job_ids"] = declined_list
+    declined_jobs = state.get("declined_job_ids") or {}
+    declined_jobs.update(dict.fromkeys(job_ids, True))
+    state.update({"candidate_id": candidate_id, "declined_job_ids": declined_jobs})
     
     candidate_service = get_candidate_service()
     
     if not candidate_service.candidate_exists(candidate_id):
-        return json.dumps({"error": f"Candidate {candidate_id} not found"})
+        return {"error": f"Candidate {candidate_id} not found"}
     
-    candidate_service.decline_jobs(candidate_id, job_ids)
+    candidate_service.decline_jobs(candidate_id, job_ids, save=False)
+    candidate_service.save_in_background()
     declined_count = len(candidate_service.get_declined_job_ids(candidate_id))
     
-    return json.dumps({
+    return {
         "status": "success",
         "candidate_id": candidate_id,
         "declined_jobs_count": declined_count,
         "message": "Jobs declined. Would you like to update your preferences or search for new matches?"
-    }, indent=2)
+    }
 
 
-def get_candidate_profile(tool_context: ToolContext, candidate_id: str) -> str:
+def get_candidate_profile(tool_context: ToolContext, candidate_id: str) -> dict:
     """Get the current profile and preferences of a candidate.
     
     Args:
@@ -281,65 +314,47 @@ def get_candidate_profile(tool_context: ToolContext, candidate_id: str) -> str:
         candidate_id: ID of the candidate
     
     Returns:
-        JSON string with candidate profile
+        Dictionary with candidate profile
     """
     # Track in state
     state = tool_context.state
     state["candidate_id"] = candidate_id
     
-    candidate_service = get_candidate_service()
-    candidate = candidate_service.get_candidate(candidate_id)
-    
-    if not candidate:
-        return json.dumps({"error": f"Candidate {candidate_id} not found"})
+    cache = get_cache_service()
+    cache_key = candidate_profile_cache_key(candidate_id)
+    profile = cache.get(cache_key)
+    if profile is None:
+        candidate_service = get_candidate_service()
+        candidate = candidate_service.get_candidate(candidate_id)
+        
+        if not candidate:
+            return {"error": f"Candidate {candidate_id} not found"}
+        
+        profile = candidate_service.format_candidate_profile(candidate)
+        cache.set(cache_key, profile, ttl=CANDIDATE_PROFILE_TTL)
     
     # Store current preferences in state for quick reference
-    profile = candidate_service.format_candidate_profile(candidate)
-    state["current_min_salary"] = profile.get("min_salary")
-    state["current_location_types"] = profile.get("preferred_location_types")
+    state.update({
+        "current_min_salary": profile.get("min_salary"),
+        "current_location_types": profile.get("preferred_location_types"),
+    })
     
-    return json.dumps(profile, indent=2)
+    return profile
 
 
-def list_available_candidates(tool_context: ToolContext) -> str:
+def list_available_candidates(tool_context: ToolContext) -> dict:
     """List all available candidates for testing.
     
     Args:
         tool_context: ADK tool context for state management
     
     Returns:
-        JSON string with list of candidate summaries
+        Dictionary with list of candidate summaries
     """
-    candidate_service = get_candidate_service()
-    candidates = candidate_service.get_all_candidates()
-    
-    summaries = [
-        candidate_service.format_candidate_summary(c)
-        for c in candidates
-    ]
+    summaries = get_candidate_service().summaries_cached()
     
-    return json.dumps({
+    return {
         "total_candidates": len(summaries),
-        "candidates": summaries
-    }, indent=2)
-
-
-# Legacy exports for backwards compatibility with routes.py
-def _load_jobs():
-    """Legacy: Load jobs (use job_service instead)."""
-    return {job.id: job for job in get_job_service().get_all_jobs()}
-
-
-def _load_candidates():
-    """Legacy: Load candidates (use candidate_service instead)."""
-    return {c.id: c for c in get_candidate_service().get_all_candidates()}
-
-
-def _candidates_store():
-    """Legacy: Get candidates store (use candidate_service instead)."""
-    return _load_candidates()
-
+        "candidates": list(summaries)
+    }
 
-def _save_candidates():
-    """Legacy: Save candidates (handled by candidate_service)."""
-    pass  # Now handled internally by CandidateService
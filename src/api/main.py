@@ -1,18 +1,16 @@
 """FastAPI application entry point."""
 
-import sys
 from pathlib import Path
+from typing import Optional
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 
-from config.settings import get_settings
+from config.settings import Settings, get_settings
 from src.api.routes import (
     chat_router,
     candidates_router,
@@ -21,7 +19,9 @@ from src.api.routes import (
     perf_router,
 )
 
-# Create FastAPI app
+# Create FastAPI app. No default_response_class on purpose: routes declare
+# return types, so FastAPI encodes them straight to JSON bytes through
+# Pydantic, which a custom response class (e.g. ORJSONResponse) would bypass.
 app = FastAPI(
     title="Vector AI Job Matching PoC",
     description="""
@@ -51,6 +51,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON payloads (job and candidate lists). Small responses
+# are not worth the CPU; SSE streams are excluded by the middleware.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(chat_router, prefix="/api")
 app.include_router(candidates_router, prefix="/api")
@@ -59,28 +63,36 @@ app.include_router(sessions_router, prefix="/api")
 app.include_router(perf_router, prefix="/api")
 
 # Mount static files
+project_root = Path(__file__).parent.parent.parent
 static_path = project_root / "static"
 if static_path.exists():
     app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
 
 
+# Static API information, encoded once instead of on every request
+_ROOT_BYTES = orjson.dumps({
+    "name": "Vector AI Job Matching PoC",
+    "version": "0.1.0",
+    "docs": "/docs",
+    "chat_ui": "/chat",
+    "endpoints": {
+        "chat": "/api/chat",
+        "chat_stream": "/api/chat/stream",
+        "candidates": "/api/candidates",
+        "jobs": "/api/jobs",
+        "sessions": "/api/sessions",
+        "performance": "/api/perf/stats",
+    }
+})
+
+# Encoded health payload and the settings instance it was built from
+_health_cache: Optional[tuple[Settings, bytes]] = None
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
-    return {
-        "name": "Vector AI Job Matching PoC",
-        "version": "0.1.0",
-        "docs": "/docs",
-        "chat_ui": "/chat",
-        "endpoints": {
-            "chat": "/api/chat",
-            "chat_stream": "/api/chat/stream",
-            "candidates": "/api/candidates",
-            "jobs": "/api/jobs",
-            "sessions": "/api/sessions",
-            "performance": "/api/perf/stats",
-        }
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 @app.get("/chat")
@@ -94,17 +106,24 @@ async def chat_ui():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
+    """Health check endpoint.
+    
+    The payload only depends on settings, so it is encoded once per
+    settings instance and rebuilt when get_settings() is reloaded.
+    """
+    global _health_cache
     settings = get_settings()
-    return {
-        "status": "healthy",
-        "project": settings.google_cloud_project or "not configured",
-        "region": settings.google_cloud_region,
-        "models": {
-            "embedding": settings.embedding_model,
-            "gemini": settings.gemini_model
-        }
-    }
+    if _health_cache is None or _health_cache[0] is not settings:
+        _health_cache = (settings, orjson.dumps({
+            "status": "healthy",
+            "project": settings.google_cloud_project or "not configured",
+            "region": settings.google_cloud_region,
+            "models": {
+                "embedding": settings.embedding_model,
+                "gemini": settings.gemini_model
+            }
+        }))
+    return Response(content=_health_cache[1], media_type="application/json")
 
 
 def main():
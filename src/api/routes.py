@@ -1,27 +1,38 @@
 """FastAPI route definitions."""
 
-import json
 import uuid
 import time
 import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from functools import cache
+from itertools import islice
 from typing import Optional, AsyncGenerator
 from datetime import datetime, timezone
 
+import orjson
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
-from google.genai import types
+from google.genai.types import Content, Part
 
+from config.settings import get_settings
 from src.agent.job_agent import get_job_matching_agent
 from src.services import (
     get_job_service,
     get_candidate_service,
     get_matching_service,
 )
-from src.services.cache_service import get_cache_service, candidate_cache_key
+from src.services.cache_service import (
+    BoundedTTLDict,
+    get_cache_service,
+    candidate_cache_key,
+    text_search_cache_key,
+)
 from src.services.async_embedding_service import get_async_embedding_service
 from src.models.job import JobResponse
 from src.models.candidate import (
@@ -43,9 +54,76 @@ sessions_router = APIRouter(prefix="/sessions", tags=["Sessions"])
 # ADK session service - shared instance for state management
 # According to https://cloud.google.com/blog/topics/developers-practitioners/remember-this-agent-state-and-memory-with-adk
 # Session STATE is lightweight (key-value scratchpad), EVENT HISTORY causes slowdowns
+APP_NAME = "job_matching_app"
 session_service = InMemorySessionService()
-_sessions: dict[str, dict] = {}  # Our history tracking (for display)
-_candidate_sessions: dict[str, str] = {}  # candidate_id -> active session_id
+_settings = get_settings()
+# Our history tracking (for display), bounded so it cannot grow with uptime
+_sessions = BoundedTTLDict(max_size=_settings.session_max_count, ttl=_settings.session_ttl_seconds)
+# candidate_id -> active session_id
+_candidate_sessions = BoundedTTLDict(max_size=_settings.session_max_count, ttl=_settings.session_ttl_seconds)
+
+# How long text search results are reused
+TEXT_SEARCH_TTL = 60
+
+
+@dataclass(slots=True)
+class SessionState:
+    """A display session: its history, stated preferences and turn lock."""
+    candidate_id: str
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    messages: deque = field(
+        default_factory=lambda: deque(maxlen=_settings.session_max_messages)
+    )
+    preferences: dict = field(default_factory=dict)  # Stated across the conversation
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)  # Serializes chat turns
+
+
+@cache
+def get_runner() -> Runner:
+    """Get the shared agent runner, created on first use.
+    
+    A Runner holds no per-conversation state (each run_async call names its
+    own user and session), so one instance serves every request.
+    """
+    return Runner(
+        agent=get_job_matching_agent(),
+        app_name=APP_NAME,
+        session_service=session_service,
+    )
+
+
+def user_content(text: str) -> Content:
+    """Wrap a context message as the user turn sent to the agent."""
+    return Content(role="user", parts=[Part(text=text)])
+
+
+def sse_event(payload: dict) -> bytes:
+    """Encode a payload as one server-sent event for the chat stream."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+def append_message(
+    session: SessionState,
+    role: str,
+    content: str,
+    timestamp: Optional[str] = None
+) -> None:
+    """Append a message to a session's history.
+    
+    The history is a deque bounded by session_max_messages, so the oldest
+    message drops off once it is full.
+    
+    Args:
+        session: The session from _sessions
+        role: "user" or "assistant"
+        content: Message text
+        timestamp: ISO timestamp to record. Defaults to now (UTC).
+    """
+    session.messages.append({
+        "role": role,
+        "content": content,
+        "timestamp": timestamp or datetime.now(timezone.utc).isoformat()
+    })
 
 
 def get_or_create_session(candidate_id: str, session_id: Optional[str] = None) -> str:
@@ -63,26 +141,21 @@ def get_or_create_session(candidate_id: str, session_id: Optional[str] = None) -
     Returns:
         Session ID to use
     """
-    # Case 1: Valid session_id provided
-    if session_id and session_id in _sessions:
-        # Verify it belongs to this candidate
-        if _sessions[session_id]["candidate_id"] == candidate_id:
-            return session_id
+    # Case 1: Valid session_id provided. Sessions can expire at any time,
+    # so each lookup is a single get() rather than a check then an index.
+    session = _sessions.get(session_id) if session_id else None
+    # Verify it belongs to this candidate
+    if session is not None and session.candidate_id == candidate_id:
+        return session_id
     
     # Case 2: Check if candidate has an active session
-    if candidate_id in _candidate_sessions:
-        existing_session_id = _candidate_sessions[candidate_id]
-        if existing_session_id in _sessions:
-            return existing_session_id
+    existing_session_id = _candidate_sessions.get(candidate_id)
+    if existing_session_id is not None and existing_session_id in _sessions:
+        return existing_session_id
     
     # Case 3: Create new session
-    new_session_id = str(uuid.uuid4())
-    _sessions[new_session_id] = {
-        "candidate_id": candidate_id,
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "messages": [],
-        "preferences": {}  # Track stated preferences across conversation
-    }
+    new_session_id = uuid.uuid4().hex
+    _sessions[new_session_id] = SessionState(candidate_id=candidate_id)
     _candidate_sessions[candidate_id] = new_session_id
     
     return new_session_id
@@ -102,9 +175,9 @@ def build_conversation_context(session_id: str, current_message: str, candidate_
     Returns:
         Context message with history and preferences
     """
-    session = _sessions.get(session_id, {})
-    messages = session.get("messages", [])
-    preferences = session.get("preferences", {})
+    session = _sessions.get(session_id)
+    messages = session.messages if session is not None else ()
+    preferences = session.preferences if session is not None else {}
     
     context_parts = []
     
@@ -118,7 +191,8 @@ def build_conversation_context(session_id: str, current_message: str, candidate_
     
     # Add recent conversation history
     if messages:
-        recent_messages = messages[-max_history:]  # Last N messages
+        # Last N messages (deques don't support slicing)
+        recent_messages = list(islice(reversed(messages), max_history))[::-1]
         if recent_messages:
             context_parts.append("\n[Recent Conversation:]")
             for msg in recent_messages:
@@ -249,54 +323,57 @@ def persist_preference_changes(candidate_id: str, changes: dict) -> bool:
         return False
     
     candidate_service = get_candidate_service()
-    candidate = candidate_service.get_candidate(candidate_id)
-    if not candidate:
-        return False
-    
-    made_changes = False
-    
-    # Update min_salary
-    if "min_salary" in changes:
-        candidate.min_salary = changes["min_salary"]
-        made_changes = True
-    
-    # Update preferred location types
-    if "preferred_location_types" in changes:
-        from src.models.job import LocationType
-        try:
-            candidate.preferred_location_types = [
-                LocationType(lt) for lt in changes["preferred_location_types"]
-            ]
+    # Edits the cached candidate in place, so hold the service lock until
+    # it is saved (this runs in the threadpool)
+    with candidate_service.lock:
+        candidate = candidate_service.get_candidate(candidate_id)
+        if not candidate:
+            return False
+        
+        made_changes = False
+        
+        # Update min_salary
+        if "min_salary" in changes:
+            candidate.min_salary = changes["min_salary"]
             made_changes = True
-        except ValueError:
-            pass  # Invalid location type, skip
-    
-    # Update preferred titles
-    if "preferred_titles" in changes:
-        # Merge with existing, don't replace entirely
-        existing_titles = set(candidate.preferred_titles or [])
-        new_titles = set(changes["preferred_titles"])
-        candidate.preferred_titles = list(existing_titles | new_titles)
-        made_changes = True
-    
-    # Update preferred industries
-    if "preferred_industries" in changes:
-        existing = set(candidate.preferred_industries or [])
-        new_industries = set(changes["preferred_industries"])
-        candidate.preferred_industries = list(existing | new_industries)
-        made_changes = True
-    
-    # Add skill (like driver's license)
-    if "add_skill" in changes:
-        if changes["add_skill"] not in candidate.skills:
-            candidate.skills.append(changes["add_skill"])
+        
+        # Update preferred location types
+        if "preferred_location_types" in changes:
+            from src.models.job import LocationType
+            try:
+                candidate.preferred_location_types = [
+                    LocationType(lt) for lt in changes["preferred_location_types"]
+                ]
+                made_changes = True
+            except ValueError:
+                pass  # Invalid location type, skip
+        
+        # Update preferred titles
+        if "preferred_titles" in changes:
+            # Merge with existing, don't replace entirely
+            existing_titles = set(candidate.preferred_titles or [])
+            new_titles = set(changes["preferred_titles"])
+            candidate.preferred_titles = list(existing_titles | new_titles)
             made_changes = True
-    
-    # Save if we made any changes
-    if made_changes:
-        candidate_service.update_candidate(candidate)
-    
-    return made_changes
+        
+        # Update preferred industries
+        if "preferred_industries" in changes:
+            existing = set(candidate.preferred_industries or [])
+            new_industries = set(changes["preferred_industries"])
+            candidate.preferred_industries = list(existing | new_industries)
+            made_changes = True
+        
+        # Add skill (like driver's license)
+        if "add_skill" in changes:
+            if changes["add_skill"] not in candidate.skills:
+                candidate.skills.append(changes["add_skill"])
+                made_changes = True
+        
+        # Save if we made any changes
+        if made_changes:
+            candidate_service.update_candidate(candidate)
+        
+        return made_changes
 
 
 # Request/Response models
@@ -355,9 +432,10 @@ async def chat_with_agent(request: ChatRequest) -> ChatResponse:
     Sessions are automatically reused for the same candidate.
     Conversation history is maintained and sent to the LLM for context.
     """
-    # Verify candidate exists first
+    # Verify candidate exists first. Service calls that may touch the
+    # candidates file run in the threadpool so they don't stall the loop.
     candidate_service = get_candidate_service()
-    if not candidate_service.candidate_exists(request.candidate_id):
+    if not await run_in_threadpool(candidate_service.candidate_exists, request.candidate_id):
         raise HTTPException(
             status_code=404,
             detail=f"Candidate {request.candidate_id} not found"
@@ -366,96 +444,87 @@ async def chat_with_agent(request: ChatRequest) -> ChatResponse:
     # Get or create our display session (for history tracking)
     display_session_id = get_or_create_session(request.candidate_id, request.session_id)
     
-    # Extract and track preferences from user message
-    current_prefs = _sessions[display_session_id].get("preferences", {})
-    updated_prefs, changes_to_persist = extract_preferences_from_message(request.message, current_prefs)
-    _sessions[display_session_id]["preferences"] = updated_prefs
-    
-    # PERSIST preference changes to candidate profile (survives restarts!)
-    if changes_to_persist:
-        persist_preference_changes(request.candidate_id, changes_to_persist)
-    
-    # Store user message in our history tracking BEFORE building context
-    _sessions[display_session_id]["messages"].append({
-        "role": "user",
-        "content": request.message,
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    })
-    
-    # Build context with conversation history (excluding the message we just added)
-    # We want history BEFORE current message, then current message
-    temp_messages = _sessions[display_session_id]["messages"][:-1]  # Exclude current
-    _sessions[display_session_id]["messages"] = temp_messages
-    context_message = build_conversation_context(
-        display_session_id, 
-        request.message, 
-        request.candidate_id,
-        max_history=8  # Include up to 8 previous messages (4 turns)
-    )
-    # Restore message list
-    _sessions[display_session_id]["messages"].append({
-        "role": "user",
-        "content": request.message,
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    })
-    
-    # Get the agent
-    agent = get_job_matching_agent()
-    
-    # Use unique interaction ID to avoid ADK event history accumulation
-    # This keeps each LLM call independent while context is passed via message
-    interaction_id = f"{display_session_id}-{uuid.uuid4().hex[:8]}"
-    
-    APP_NAME = "job_matching_app"
-    runner = Runner(
-        agent=agent,
-        app_name=APP_NAME,
-        session_service=session_service,
-    )
-    
-    # Create new ADK session for this interaction (prevents history buildup)
-    await session_service.create_session(
-        app_name=APP_NAME,
-        user_id=request.candidate_id,
-        session_id=interaction_id
-    )
-    
-    try:
-        # Run the agent with conversation context included in the message
-        response_text = ""
-        async for event in runner.run_async(
-            user_id=request.candidate_id,
-            session_id=interaction_id,
-            new_message=types.Content(
-                role="user",
-                parts=[types.Part(text=context_message)]
-            )
-        ):
-            # Collect the response text
-            if hasattr(event, 'content') and event.content:
-                for part in event.content.parts:
-                    if hasattr(part, 'text') and part.text:
-                        response_text += part.text
+    # Turns on the same session run one at a time, so history and
+    # preferences are not interleaved by a concurrent request
+    session = _sessions[display_session_id]
+    async with session.lock:
+        # Extract and track preferences from user message
+        current_prefs = session.preferences
+        updated_prefs, changes_to_persist = extract_preferences_from_message(request.message, current_prefs)
+        session.preferences = updated_prefs
         
-        # Store assistant response in our history
-        _sessions[display_session_id]["messages"].append({
-            "role": "assistant",
-            "content": response_text,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        })
+        # PERSIST preference changes to candidate profile (survives restarts!)
+        if changes_to_persist:
+            await run_in_threadpool(persist_preference_changes, request.candidate_id, changes_to_persist)
         
-        # Return display_session_id (consistent for candidate)
-        return ChatResponse(
-            session_id=display_session_id,
-            response=response_text,
-            timestamp=datetime.now(timezone.utc).isoformat()
+        # Build context with conversation history BEFORE adding current message
+        context_message = build_conversation_context(
+            display_session_id, 
+            request.message, 
+            request.candidate_id,
+            max_history=8  # Include up to 8 previous messages (4 turns)
         )
         
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Agent error: {str(e)}"
+        # Store user message AFTER building context
+        append_message(session, "user", request.message)
+        
+        runner = get_runner()
+        
+        # Use unique interaction ID to avoid ADK event history accumulation
+        # This keeps each LLM call independent while context is passed via message
+        interaction_id = f"{display_session_id}-{uuid.uuid4().hex[:8]}"
+        
+        # Create new ADK session for this interaction (prevents history buildup)
+        await session_service.create_session(
+            app_name=APP_NAME,
+            user_id=request.candidate_id,
+            session_id=interaction_id
         )
+        
+        try:
+            # Run the agent with conversation context included in the message.
+            # Parts are joined once at the end rather than concatenated per part.
+            response_parts: list[str] = []
+            async for event in runner.run_async(
+                user_id=request.candidate_id,
+                session_id=interaction_id,
+                new_message=user_content(context_message)
+            ):
+                # Collect the response text
+                content = getattr(event, 'content', None)
+                if not content:
+                    continue
+                for part in content.parts or ():
+                    text = getattr(part, 'text', None)
+                    if text:
+                        response_parts.append(text)
+            response_text = "".join(response_parts)
+            
+            # Store assistant response in our history; the reply and its history
+            # entry share one timestamp
+            timestamp = datetime.now(timezone.utc).isoformat()
+            append_message(session, "assistant", response_text, timestamp)
+            
+            # Return display_session_id (consistent for candidate)
+            return ChatResponse(
+                session_id=display_session_id,
+                response=response_text,
+                timestamp=timestamp
+            )
+            
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Agent error: {str(e)}"
+            )
+        finally:
+            # The interaction session is never reused; drop it so the ADK
+            # session service does not grow by one session per message
+            await session_service.delete_session(
+                app_name=APP_NAME,
+                user_id=request.candidate_id,
+                session_id=interaction_id
+            )
 
 
 @chat_router.post("/stream")
@@ -473,7 +542,7 @@ async def chat_with_agent_stream(request: ChatRequest) -> StreamingResponse:
     Sessions are automatically reused for the same candidate.
     Conversation history is maintained and sent to the LLM for context.
     """
-    async def generate() -> AsyncGenerator[str, None]:
+    async def generate() -> AsyncGenerator[bytes, None]:
         start_time = time.time()
         
         # Verify candidate exists (use cache)
@@ -483,100 +552,94 @@ async def chat_with_agent_stream(request: ChatRequest) -> StreamingResponse:
         
         if candidate_exists is None:
             candidate_service = get_candidate_service()
-            candidate_exists = candidate_service.candidate_exists(request.candidate_id)
+            candidate_exists = await run_in_threadpool(
+                candidate_service.candidate_exists, request.candidate_id
+            )
             cache.set(cache_key, candidate_exists, ttl=60)  # Cache for 1 minute
         
         if not candidate_exists:
-            yield f"data: {json.dumps({'error': f'Candidate {request.candidate_id} not found'})}\n\n"
+            yield sse_event({'error': f'Candidate {request.candidate_id} not found'})
             return
         
         # Get or create session (reuses existing session for same candidate)
         session_id = get_or_create_session(request.candidate_id, request.session_id)
         
-        # Extract and track preferences from user message
-        current_prefs = _sessions[session_id].get("preferences", {})
-        updated_prefs, changes_to_persist = extract_preferences_from_message(request.message, current_prefs)
-        _sessions[session_id]["preferences"] = updated_prefs
-        
-        # PERSIST preference changes to candidate profile (survives restarts!)
-        if changes_to_persist:
-            persist_preference_changes(request.candidate_id, changes_to_persist)
-        
-        # Build context with conversation history BEFORE adding current message
-        context_message = build_conversation_context(
-            session_id, 
-            request.message, 
-            request.candidate_id,
-            max_history=8  # Include up to 8 previous messages (4 turns)
-        )
-        
-        # Store user message AFTER building context
-        _sessions[session_id]["messages"].append({
-            "role": "user",
-            "content": request.message,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        })
-        
-        # Get the agent
-        agent = get_job_matching_agent()
-        
-        # Use unique interaction ID to avoid ADK event history accumulation
-        interaction_id = f"{session_id}-{uuid.uuid4().hex[:8]}"
-        
-        APP_NAME = "job_matching_app"
-        runner = Runner(
-            agent=agent,
-            app_name=APP_NAME,
-            session_service=session_service,
-        )
-        
-        # Create new ADK session for this interaction (prevents history buildup)
-        await session_service.create_session(
-            app_name=APP_NAME,
-            user_id=request.candidate_id,
-            session_id=interaction_id
-        )
-        
-        # Send session info first (use display session_id for user)
-        yield f"data: {json.dumps({'session_id': session_id, 'type': 'start'})}\n\n"
-        
-        try:
-            response_text = ""
-            chunk_count = 0
+        # One turn at a time per session, see chat_with_agent
+        session = _sessions[session_id]
+        async with session.lock:
+            # Extract and track preferences from user message
+            current_prefs = session.preferences
+            updated_prefs, changes_to_persist = extract_preferences_from_message(request.message, current_prefs)
+            session.preferences = updated_prefs
             
-            # Use interaction_id for ADK runner (prevents history buildup)
-            # Context message includes conversation history
-            async for event in runner.run_async(
-                user_id=request.candidate_id,
-                session_id=interaction_id,
-                new_message=types.Content(
-                    role="user",
-                    parts=[types.Part(text=context_message)]
-                )
-            ):
-                if hasattr(event, 'content') and event.content:
-                    for part in event.content.parts:
-                        if hasattr(part, 'text') and part.text:
-                            chunk = part.text
-                            response_text += chunk
-                            chunk_count += 1
-                            # Stream each chunk
-                            yield f"data: {json.dumps({'text': chunk, 'type': 'chunk'})}\n\n"
+            # PERSIST preference changes to candidate profile (survives restarts!)
+            if changes_to_persist:
+                await run_in_threadpool(persist_preference_changes, request.candidate_id, changes_to_persist)
             
-            # Store response in our history tracking
-            _sessions[session_id]["messages"].append({
-                "role": "assistant",
-                "content": response_text,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            })
+            # Build context with conversation history BEFORE adding current message
+            context_message = build_conversation_context(
+                session_id, 
+                request.message, 
+                request.candidate_id,
+                max_history=8  # Include up to 8 previous messages (4 turns)
+            )
             
-            elapsed = time.time() - start_time
+            # Store user message AFTER building context
+            append_message(session, "user", request.message)
             
-            # Send completion (use display session_id)
-            yield f"data: {json.dumps({'type': 'done', 'session_id': session_id, 'chunks': chunk_count, 'time_seconds': round(elapsed, 2)})}\n\n"
+            runner = get_runner()
             
-        except Exception as e:
-            yield f"data: {json.dumps({'error': str(e), 'type': 'error'})}\n\n"
+            # Use unique interaction ID to avoid ADK event history accumulation
+            interaction_id = f"{session_id}-{uuid.uuid4().hex[:8]}"
+            
+            # Create new ADK session for this interaction (prevents history buildup)
+            await session_service.create_session(
+                app_name=APP_NAME,
+                user_id=request.candidate_id,
+                session_id=interaction_id
+            )
+            
+            # Send session info first (use display session_id for user)
+            yield sse_event({'session_id': session_id, 'type': 'start'})
+            
+            try:
+                # Streamed parts, joined once for the history entry
+                response_parts: list[str] = []
+                
+                # Use interaction_id for ADK runner (prevents history buildup)
+                # Context message includes conversation history
+                async for event in runner.run_async(
+                    user_id=request.candidate_id,
+                    session_id=interaction_id,
+                    new_message=user_content(context_message)
+                ):
+                    content = getattr(event, 'content', None)
+                    if not content:
+                        continue
+                    for part in content.parts or ():
+                        chunk = getattr(part, 'text', None)
+                        if chunk:
+                            response_parts.append(chunk)
+                            # Stream each chunk
+                            yield sse_event({'text': chunk, 'type': 'chunk'})
+                
+                # Store response in our history tracking
+                append_message(session, "assistant", "".join(response_parts))
+                
+                elapsed = time.time() - start_time
+                
+                # Send completion (use display session_id)
+                yield sse_event({'type': 'done', 'session_id': session_id, 'chunks': len(response_parts), 'time_seconds': round(elapsed, 2)})
+                
+            except Exception as e:
+                yield sse_event({'error': str(e), 'type': 'error'})
+            finally:
+                # Single-use interaction session, see chat_with_agent
+                await session_service.delete_session(
+                    app_name=APP_NAME,
+                    user_id=request.candidate_id,
+                    session_id=interaction_id
+                )
     
     return StreamingResponse(
         generate(),
@@ -611,8 +674,8 @@ async def create_session(request: SessionCreate) -> SessionResponse:
     return SessionResponse(
         session_id=session_id,
         candidate_id=request.candidate_id,
-        created_at=_sessions[session_id]["created_at"],
-        message_count=len(_sessions[session_id]["messages"])
+        created_at=_sessions[session_id].created_at,
+        message_count=len(_sessions[session_id].messages)
     )
 
 
@@ -631,9 +694,9 @@ async def get_session_by_candidate(candidate_id: str) -> SessionResponse:
     
     return SessionResponse(
         session_id=session_id,
-        candidate_id=session["candidate_id"],
-        created_at=session["created_at"],
-        message_count=len(session["messages"])
+        candidate_id=session.candidate_id,
+        created_at=session.created_at,
+        message_count=len(session.messages)
     )
 
 
@@ -662,9 +725,9 @@ async def get_session(session_id: str) -> SessionResponse:
     session = _sessions[session_id]
     return SessionResponse(
         session_id=session_id,
-        candidate_id=session["candidate_id"],
-        created_at=session["created_at"],
-        message_count=len(session["messages"])
+        candidate_id=session.candidate_id,
+        created_at=session.created_at,
+        message_count=len(session.messages)
     )
 
 
@@ -675,26 +738,29 @@ async def get_session_history(session_id: str) -> SessionHistoryResponse:
         raise HTTPException(status_code=404, detail="Session not found")
     
     session = _sessions[session_id]
+    # Messages are written by append_message, so they skip validation
     return SessionHistoryResponse(
         session_id=session_id,
-        candidate_id=session["candidate_id"],
+        candidate_id=session.candidate_id,
         messages=[
-            MessageHistory(**msg) for msg in session["messages"]
+            MessageHistory.model_construct(**msg) for msg in session.messages
         ]
     )
 
 
 # Candidate endpoints
+# These call the candidate/job services, which load and write the data files
+# (and vector search for text search), so they are plain `def` routes that
+# FastAPI runs in its threadpool instead of on the event loop.
 @candidates_router.get("", response_model=list[CandidateResponse])
-async def list_candidates() -> list[CandidateResponse]:
+def list_candidates() -> list[CandidateResponse]:
     """List all candidates."""
     candidate_service = get_candidate_service()
-    candidates = candidate_service.get_all_candidates()
-    return [CandidateResponse.from_candidate(c) for c in candidates]
+    return CandidateResponse.from_candidates(candidate_service.get_all_candidates())
 
 
 @candidates_router.get("/{candidate_id}", response_model=CandidateResponse)
-async def get_candidate(candidate_id: str) -> CandidateResponse:
+def get_candidate(candidate_id: str) -> CandidateResponse:
     """Get a candidate by ID."""
     candidate_service = get_candidate_service()
     candidate = candidate_service.get_candidate(candidate_id)
@@ -704,7 +770,7 @@ async def get_candidate(candidate_id: str) -> CandidateResponse:
 
 
 @candidates_router.post("", response_model=CandidateResponse)
-async def create_candidate(candidate_data: CandidateCreate) -> CandidateResponse:
+def create_candidate(candidate_data: CandidateCreate) -> CandidateResponse:
     """Create a new candidate."""
     candidate_service = get_candidate_service()
     
@@ -722,42 +788,45 @@ async def create_candidate(candidate_data: CandidateCreate) -> CandidateResponse
 
 
 @candidates_router.patch("/{candidate_id}", response_model=CandidateResponse)
-async def update_candidate(
+def update_candidate(
     candidate_id: str,
     updates: CandidateUpdate
 ) -> CandidateResponse:
     """Update a candidate's profile."""
     candidate_service = get_candidate_service()
-    candidate = candidate_service.get_candidate(candidate_id)
-    
-    if not candidate:
-        raise HTTPException(status_code=404, detail="Candidate not found")
-    
-    # Apply updates
-    update_data = updates.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        if value is not None:
-            setattr(candidate, field, value)
-    
-    candidate_service.update_candidate(candidate)
+    # Copy and store under the service lock so a concurrent in-place
+    # preference update is not lost
+    with candidate_service.lock:
+        candidate = candidate_service.get_candidate(candidate_id)
+        
+        if not candidate:
+            raise HTTPException(status_code=404, detail="Candidate not found")
+        
+        # Apply updates. The values were validated by CandidateUpdate, so the
+        # copy does not need to validate them again.
+        candidate = candidate.model_copy(
+            update=updates.model_dump(exclude_unset=True, exclude_none=True)
+        )
+        
+        candidate_service.update_candidate(candidate)
     
     return CandidateResponse.from_candidate(candidate)
 
 
 # Job endpoints
 @jobs_router.get("", response_model=list[JobResponse])
-async def list_jobs(
+def list_jobs(
     limit: int = 20,
     offset: int = 0
 ) -> list[JobResponse]:
     """List all jobs with pagination."""
     job_service = get_job_service()
     job_list = job_service.get_jobs_paginated(offset=offset, limit=limit)
-    return [JobResponse.from_job(j) for j in job_list]
+    return JobResponse.from_jobs(job_list)
 
 
 @jobs_router.get("/{job_id}", response_model=JobResponse)
-async def get_job(job_id: str) -> JobResponse:
+def get_job(job_id: str) -> JobResponse:
     """Get a job by ID."""
     job_service = get_job_service()
     job = job_service.get_job(job_id)
@@ -767,11 +836,22 @@ async def get_job(job_id: str) -> JobResponse:
 
 
 @jobs_router.get("/search/text")
-async def search_jobs_by_text(
+def search_jobs_by_text(
     query: str,
     limit: int = 10
 ) -> dict:
-    """Search jobs by text query using vector search."""
+    """Search jobs by text query using vector search.
+    
+    Successful results are cached for TEXT_SEARCH_TTL seconds, keyed on the
+    normalized query and limit, so repeated searches skip the embedding and
+    vector lookup.
+    """
+    cache = get_cache_service()
+    cache_key = text_search_cache_key(query, limit)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return {**cached, "query": query}
+    
     matching_service = get_matching_service()
     result = matching_service.search_jobs_by_text(query=query, num_results=limit)
     
@@ -781,6 +861,8 @@ async def search_jobs_by_text(
             detail=f"Vector search not available: {result['error']}"
         )
     
+    if "error" not in result:
+        cache.set(cache_key, result, ttl=TEXT_SEARCH_TTL)
     return result
 
 
@@ -805,7 +887,7 @@ async def get_performance_stats() -> dict:
         },
         "sessions": {
             "active": len(_sessions),
-            "total_messages": sum(len(s["messages"]) for s in _sessions.values())
+            "total_messages": sum(len(s.messages) for s in _sessions.values())
         }
     }
 
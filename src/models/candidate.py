@@ -1,5 +1,6 @@
 """Candidate data models."""
 
+from collections.abc import Iterable
 from typing import Optional
 from pydantic import BaseModel, Field
 
@@ -118,22 +119,36 @@ class CandidateResponse(BaseModel):
     has_accepted_job: bool
     declined_jobs_count: int
     
+    @staticmethod
+    def _fields(candidate: Candidate) -> dict:
+        """Response field values for a candidate."""
+        return {
+            "id": candidate.id,
+            "name": candidate.name,
+            "email": candidate.email,
+            "summary": candidate.summary,
+            "skills": candidate.skills,
+            "years_experience": candidate.years_experience,
+            "current_title": candidate.current_title,
+            "preferred_titles": candidate.preferred_titles,
+            "preferred_location_types": [loc.value for loc in candidate.preferred_location_types],
+            "min_salary": candidate.min_salary,
+            "preferred_industries": candidate.preferred_industries,
+            "has_accepted_job": candidate.accepted_job_id is not None,
+            "declined_jobs_count": len(candidate.declined_job_ids),
+        }
+    
     @classmethod
     def from_candidate(cls, candidate: Candidate) -> "CandidateResponse":
         """Create response from Candidate model."""
-        return cls(
-            id=candidate.id,
-            name=candidate.name,
-            email=candidate.email,
-            summary=candidate.summary,
-            skills=candidate.skills,
-            years_experience=candidate.years_experience,
-            current_title=candidate.current_title,
-            preferred_titles=candidate.preferred_titles,
-            preferred_location_types=[loc.value for loc in candidate.preferred_location_types],
-            min_salary=candidate.min_salary,
-            preferred_industries=candidate.preferred_industries,
-            has_accepted_job=candidate.accepted_job_id is not None,
-            declined_jobs_count=len(candidate.declined_job_ids),
-        )
+        return cls(**cls._fields(candidate))
+    
+    @classmethod
+    def from_candidates(cls, candidates: Iterable[Candidate]) -> list["CandidateResponse"]:
+        """Create responses for many candidates.
+        
+        The values come from already-validated Candidate models, so the
+        responses are built with model_construct and skip validation.
+        """
+        return [cls.model_construct(**cls._fields(c)) for c in candidates]
 
@@ -1,5 +1,6 @@
 """Job vacancy data models."""
 
+from collections.abc import Iterable
 from typing import Optional
 from enum import Enum
 from pydantic import BaseModel, Field
@@ -40,6 +41,15 @@ class Job(BaseModel):
     department: str = Field(..., description="Department within company")
     benefits: list[str] = Field(default_factory=list, description="Job benefits")
     
+    @property
+    def salary_range(self) -> str:
+        """Formatted salary range, e.g. "$150,000 - $200,000".
+        
+        Not cached: model_copy() carries cached values over to the copy, so
+        a copy with new salary fields would report the old range.
+        """
+        return f"${self.salary_min:,} - ${self.salary_max:,}"
+    
     def to_embedding_text(self) -> str:
         """Convert job to text for embedding generation."""
         skills_text = ", ".join(self.required_skills + self.preferred_skills)
@@ -51,7 +61,7 @@ class Job(BaseModel):
             f"Experience Level: {self.experience_level.value}\n"
             f"Location: {self.location_type.value}"
             f"{f' - {self.location}' if self.location else ''}\n"
-            f"Salary Range: ${self.salary_min:,} - ${self.salary_max:,}\n"
+            f"Salary Range: {self.salary_range}\n"
             f"Industry: {self.industry}\n"
             f"Department: {self.department}"
         )
@@ -91,20 +101,34 @@ class JobResponse(BaseModel):
     industry: str
     department: str
     
+    @staticmethod
+    def _fields(job: Job) -> dict:
+        """Response field values for a job."""
+        return {
+            "id": job.id,
+            "title": job.title,
+            "company": job.company,
+            "description": job.description,
+            "required_skills": job.required_skills,
+            "experience_level": job.experience_level.value,
+            "location_type": job.location_type.value,
+            "location": job.location,
+            "salary_range": job.salary_range,
+            "industry": job.industry,
+            "department": job.department,
+        }
+    
     @classmethod
     def from_job(cls, job: Job) -> "JobResponse":
         """Create response from Job model."""
-        return cls(
-            id=job.id,
-            title=job.title,
-            company=job.company,
-            description=job.description,
-            required_skills=job.required_skills,
-            experience_level=job.experience_level.value,
-            location_type=job.location_type.value,
-            location=job.location,
-            salary_range=f"${job.salary_min:,} - ${job.salary_max:,}",
-            industry=job.industry,
-            department=job.department,
-        )
+        return cls(**cls._fields(job))
+    
+    @classmethod
+    def from_jobs(cls, jobs: Iterable[Job]) -> list["JobResponse"]:
+        """Create responses for many jobs.
+        
+        The values come from already-validated Job models, so the
+        responses are built with model_construct and skip validation.
+        """
+        return [cls.model_construct(**cls._fields(job)) for job in jobs]
 
@@ -5,6 +5,8 @@ API calls and improve response times.
 """
 
 import time
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
 from typing import Any, Optional, TypeVar, Generic
 from dataclasses import dataclass, field
 from threading import Lock
@@ -140,6 +142,76 @@ class CacheService:
             }
 
 
+class BoundedTTLDict(MutableMapping):
+    """Thread-safe dict with LRU eviction and an idle TTL.
+    
+    Entries expire ttl seconds after they were last read or written, and the
+    least recently used entry is evicted once max_size is exceeded. Entries
+    are kept in access order, so expired ones are always at the front and
+    are purged in O(1) each.
+    """
+    
+    def __init__(self, max_size: int, ttl: float):
+        """Initialize the dict.
+        
+        Args:
+            max_size: Maximum number of entries kept
+            ttl: Seconds without access after which an entry expires
+        """
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+        self._max_size = max_size
+        self._ttl = ttl
+    
+    def _purge_expired(self, now: float) -> None:
+        """Drop expired entries from the least recently used end."""
+        while self._data:
+            accessed_at, _ = next(iter(self._data.values()))
+            if now - accessed_at <= self._ttl:
+                break
+            self._data.popitem(last=False)
+    
+    def __getitem__(self, key: Any) -> Any:
+        with self._lock:
+            accessed_at, value = self._data[key]
+            now = time.monotonic()
+            if now - accessed_at > self._ttl:
+                del self._data[key]
+                raise KeyError(key)
+            self._data[key] = (now, value)
+            self._data.move_to_end(key)
+            return value
+    
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._purge_expired(now)
+            self._data[key] = (now, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+    
+    def __delitem__(self, key: Any) -> None:
+        with self._lock:
+            del self._data[key]
+    
+    def __iter__(self) -> Iterator:
+        with self._lock:
+            self._purge_expired(time.monotonic())
+            return iter(list(self._data))
+    
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge_expired(time.monotonic())
+            return len(self._data)
+    
+    def values(self) -> list:
+        """Snapshot of the live values, without refreshing their access time."""
+        with self._lock:
+            self._purge_expired(time.monotonic())
+            return [value for _, value in self._data.values()]
+
+
 # Singleton instance
 _cache_service: Optional[CacheService] = None
 
@@ -163,6 +235,21 @@ def job_cache_key(job_id: str) -> str:
     return f"job:{job_id}"
 
 
+def job_details_cache_key(job_id: str) -> str:
+    """Generate cache key for a job's serialized details."""
+    return f"job_details:{job_id}"
+
+
+def candidate_profile_cache_key(candidate_id: str) -> str:
+    """Generate cache key for a candidate's serialized profile."""
+    return f"candidate_profile:{candidate_id}"
+
+
+def text_search_cache_key(query: str, limit: int) -> str:
+    """Generate cache key for text search results (case and padding ignored)."""
+    return f"text_search:{limit}:{query.strip().lower()}"
+
+
 def search_cache_key(candidate_id: str, criteria: str = "") -> str:
     """Generate cache key for search results."""
     return f"search:{candidate_id}:{hash(criteria)}"
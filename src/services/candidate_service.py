@@ -4,14 +4,23 @@ This service follows the Single Responsibility Principle (SRP) by focusing
 only on candidate-related business logic.
 """
 
+import asyncio
 import json
+import logging
+import os
+import threading
 from typing import Optional
 from pathlib import Path
 
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
 from config.settings import get_settings
+from src.services.cache_service import get_cache_service, candidate_profile_cache_key
 from src.models.job import LocationType
 from src.models.candidate import Candidate
 
+logger = logging.getLogger(__name__)
+
 
 class CandidateService:
     """Service for managing candidate data and operations.
@@ -32,34 +41,106 @@ class CandidateService:
         settings = get_settings()
         self._candidates_file = candidates_file or settings.candidates_file
         self._candidates_cache: Optional[dict[str, Candidate]] = None
+        self._summaries_cache: Optional[tuple[dict, ...]] = None
+        # Guards the cache and the candidates file. Routes and tools call in
+        # from threadpool workers as well as the event loop thread.
+        self._lock = threading.RLock()
+        # Bumped on every change; a background save is skipped when the file
+        # already holds the latest version
+        self._version = 0
+        self._saved_version = 0
+        self._pending_saves: set[asyncio.Task] = set()
     
     @property
     def candidates(self) -> dict[str, Candidate]:
         """Lazy load and cache candidates from file."""
         if self._candidates_cache is None:
-            self._load_candidates()
+            with self._lock:
+                if self._candidates_cache is None:
+                    self._load_candidates()
         return self._candidates_cache
     
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock held while candidates are modified or saved.
+        
+        Code outside this service that modifies a Candidate in place should
+        hold it until the matching update_candidate() call.
+        """
+        return self._lock
+    
     def _load_candidates(self) -> None:
         """Load candidates from JSON file into cache."""
-        self._candidates_cache = {}
+        candidates = {}
         if self._candidates_file.exists():
             with open(self._candidates_file) as f:
                 data = json.load(f)
-            self._candidates_cache = {c["id"]: Candidate(**c) for c in data}
+            candidates = {c["id"]: Candidate(**c) for c in data}
+        with self._lock:
+            self._candidates_cache = candidates
+            self._summaries_cache = None
     
     def _save_candidates(self) -> None:
         """Persist candidates to JSON file."""
-        with open(self._candidates_file, "w") as f:
-            json.dump(
-                [c.model_dump() for c in self._candidates_cache.values()],
-                f,
-                indent=2
+        with self._lock:
+            version = self._version
+            self._write_candidates_file(
+                [c.model_dump() for c in self._candidates_cache.values()]
             )
+            self._saved_version = version
+    
+    @retry(
+        retry=retry_if_exception_type(OSError),
+        wait=wait_exponential(multiplier=0.1, max=2),
+        stop=stop_after_attempt(3),
+        reraise=True,
+    )
+    def _write_candidates_file(self, data: list[dict]) -> None:
+        """Write serialized candidates to the JSON file, retrying I/O errors.
+        
+        The data goes to a temporary file that then replaces the candidates
+        file, so readers never see a partly written file.
+        
+        Args:
+            data: Candidate dictionaries to write
+        """
+        tmp_file = self._candidates_file.with_name(self._candidates_file.name + ".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_file, self._candidates_file)
+    
+    def _save_if_changed(self) -> None:
+        """Save the current candidates unless the file is already up to date."""
+        with self._lock:
+            if self._saved_version != self._version:
+                self._save_candidates()
+    
+    async def _save_latest(self) -> None:
+        """Save the latest candidates from a worker thread, logging failures."""
+        try:
+            await asyncio.to_thread(self._save_if_changed)
+        except Exception:
+            logger.exception("Background save of candidates failed")
+    
+    def save_in_background(self) -> asyncio.Task:
+        """Persist candidates without blocking the caller.
+        
+        The task writes whatever is in memory when it runs, under the same
+        lock as every other save, so it never overwrites a newer file.
+        Saves scheduled close together collapse into one write. Must be
+        called from within the running event loop.
+        
+        Returns:
+            The scheduled save task
+        """
+        task = asyncio.create_task(self._save_latest())
+        # Keep a reference so the task is not garbage collected mid-write
+        self._pending_saves.add(task)
+        task.add_done_callback(self._pending_saves.discard)
+        return task
     
     def reload(self) -> None:
         """Force reload candidates from file."""
-        self._candidates_cache = None
         self._load_candidates()
     
     def get_candidate(self, candidate_id: str) -> Optional[Candidate]:
@@ -92,14 +173,21 @@ class CandidateService:
         """
         return candidate_id in self.candidates
     
-    def update_candidate(self, candidate: Candidate) -> None:
+    def update_candidate(self, candidate: Candidate, save: bool = True) -> None:
         """Update a candidate in the store.
         
         Args:
             candidate: The updated Candidate object
+            save: Write the candidates file now. Pass False when the caller
+                persists later, e.g. via save_in_background().
         """
-        self._candidates_cache[candidate.id] = candidate
-        self._save_candidates()
+        with self._lock:
+            self.candidates[candidate.id] = candidate
+            self._summaries_cache = None
+            self._version += 1
+            if save:
+                self._save_candidates()
+        get_cache_service().delete(candidate_profile_cache_key(candidate.id))
     
     def update_preferences(
         self,
@@ -125,79 +213,105 @@ class CandidateService:
         Returns:
             Tuple of (success, list of updated fields)
         """
-        candidate = self.get_candidate(candidate_id)
-        if not candidate:
-            return False, []
-        
-        updated_fields = []
-        
-        if min_salary is not None:
-            candidate.min_salary = min_salary
-            updated_fields.append(f"min_salary: ${min_salary:,}")
-        
-        if preferred_titles is not None:
-            candidate.preferred_titles = preferred_titles
-            updated_fields.append(f"preferred_titles: {preferred_titles}")
-        
-        if preferred_location_types is not None:
-            candidate.preferred_location_types = [
-                LocationType(lt) for lt in preferred_location_types
-            ]
-            updated_fields.append(f"preferred_location_types: {preferred_location_types}")
-        
-        if preferred_industries is not None:
-            candidate.preferred_industries = preferred_industries
-            updated_fields.append(f"preferred_industries: {preferred_industries}")
-        
-        if preferred_locations is not None:
-            candidate.preferred_locations = preferred_locations
-            updated_fields.append(f"preferred_locations: {preferred_locations}")
+        with self._lock:
+            candidate = self.get_candidate(candidate_id)
+            if not candidate:
+                return False, []
+            
+            updated_fields = []
+            
+            if min_salary is not None:
+                candidate.min_salary = min_salary
+                updated_fields.append(f"min_salary: ${min_salary:,}")
+            
+            if preferred_titles is not None:
+                candidate.preferred_titles = preferred_titles
+                updated_fields.append(f"preferred_titles: {preferred_titles}")
+            
+            if preferred_location_types is not None:
+                candidate.preferred_location_types = [
+                    LocationType(lt) for lt in preferred_location_types
+                ]
+                updated_fields.append(f"preferred_location_types: {preferred_location_types}")
+            
+            if preferred_industries is not None:
+                candidate.preferred_industries = preferred_industries
+                updated_fields.append(f"preferred_industries: {preferred_industries}")
+            
+            if preferred_locations is not None:
+                candidate.preferred_locations = preferred_locations
+                updated_fields.append(f"preferred_locations: {preferred_locations}")
+            
+            if skills is not None:
+                candidate.skills = skills
+                updated_fields.append(f"skills: {skills}")
+            
+            self.update_candidate(candidate)
+            return True, updated_fields
+    
+    async def update_preferences_async(
+        self,
+        candidate_id: str,
+        **preferences
+    ) -> tuple[bool, list[str]]:
+        """Async wrapper for update_preferences.
         
-        if skills is not None:
-            candidate.skills = skills
-            updated_fields.append(f"skills: {skills}")
+        Runs in a worker thread so the candidates file write does not block
+        the event loop and can overlap with other I/O.
         
-        self.update_candidate(candidate)
-        return True, updated_fields
+        Args:
+            candidate_id: The candidate identifier
+            **preferences: Keyword arguments accepted by update_preferences
+            
+        Returns:
+            Tuple of (success, list of updated fields)
+        """
+        return await asyncio.to_thread(
+            self.update_preferences, candidate_id, **preferences
+        )
     
-    def accept_job(self, candidate_id: str, job_id: str) -> bool:
+    def accept_job(self, candidate_id: str, job_id: str, save: bool = True) -> bool:
         """Record that a candidate has accepted a job.
         
         Args:
             candidate_id: The candidate identifier
             job_id: The accepted job identifier
+            save: Write the candidates file now (see update_candidate)
             
         Returns:
             True if successful, False if candidate not found
         """
-        candidate = self.get_candidate(candidate_id)
-        if not candidate:
-            return False
-        
-        candidate.accepted_job_id = job_id
-        self.update_candidate(candidate)
-        return True
+        with self._lock:
+            candidate = self.get_candidate(candidate_id)
+            if not candidate:
+                return False
+            
+            candidate.accepted_job_id = job_id
+            self.update_candidate(candidate, save=save)
+            return True
     
-    def decline_jobs(self, candidate_id: str, job_ids: list[str]) -> bool:
+    def decline_jobs(self, candidate_id: str, job_ids: list[str], save: bool = True) -> bool:
         """Record that a candidate has declined jobs.
         
         Args:
             candidate_id: The candidate identifier
             job_ids: List of declined job identifiers
+            save: Write the candidates file now (see update_candidate)
             
         Returns:
             True if successful, False if candidate not found
         """
-        candidate = self.get_candidate(candidate_id)
-        if not candidate:
-            return False
-        
-        for job_id in job_ids:
-            if job_id not in candidate.declined_job_ids:
-                candidate.declined_job_ids.append(job_id)
-        
-        self.update_candidate(candidate)
-        return True
+        with self._lock:
+            candidate = self.get_candidate(candidate_id)
+            if not candidate:
+                return False
+            
+            for job_id in job_ids:
+                if job_id not in candidate.declined_job_ids:
+                    candidate.declined_job_ids.append(job_id)
+            
+            self.update_candidate(candidate, save=save)
+            return True
     
     def get_declined_job_ids(self, candidate_id: str) -> list[str]:
         """Get list of declined job IDs for a candidate.
@@ -254,6 +368,22 @@ class CandidateService:
             "years_experience": candidate.years_experience,
             "has_accepted_job": candidate.accepted_job_id is not None
         }
+    
+    def summaries_cached(self) -> tuple[dict, ...]:
+        """Get summaries of all candidates, built once per change.
+        
+        The tuple is rebuilt only after candidates are reloaded or updated.
+        The dicts are shared between callers and must not be modified.
+        
+        Returns:
+            Tuple of candidate summary dictionaries
+        """
+        with self._lock:
+            if self._summaries_cache is None:
+                self._summaries_cache = tuple(
+                    self.format_candidate_summary(c) for c in self.candidates.values()
+                )
+            return self._summaries_cache
 
 
 # Singleton instance
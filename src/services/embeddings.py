@@ -1,14 +1,61 @@
 """Vertex AI Text Embedding Service."""
 
 import asyncio
+import json
+import time
 from typing import Optional
 
+import numpy as np
 import vertexai
+from google.api_core.client_options import ClientOptions
+from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
+from google.cloud import storage
+from google.cloud.aiplatform_v1 import PredictionServiceAsyncClient
+from google.protobuf import json_format, struct_pb2
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 from vertexai.language_models import TextEmbeddingModel, TextEmbeddingInput
 
 from config.settings import get_settings
 
 
+def quantize_int8(vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Symmetrically quantize embeddings to int8 with a per-vector scale.
+    
+    Each vector is scaled so that its largest absolute component maps to 127,
+    shrinking storage 4x relative to float32.
+    
+    Args:
+        vectors: float array of shape (n, dimensions)
+    
+    Returns:
+        Tuple of (int8 array of shape (n, dimensions), float32 scales of shape (n,))
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    scales = np.abs(vectors).max(axis=1) / 127.0
+    # All-zero vectors would divide by zero; any non-zero scale decodes them back to 0
+    scales[scales == 0] = 1.0
+    quantized = np.round(vectors / scales[:, None]).astype(np.int8)
+    return quantized, scales.astype(np.float32)
+
+
+def dequantize_int8(quantized: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Reconstruct float32 embeddings from int8 values and per-vector scales.
+    
+    Args:
+        quantized: int8 array of shape (n, dimensions)
+        scales: Per-vector scales of shape (n,)
+    
+    Returns:
+        float32 array of shape (n, dimensions)
+    """
+    return quantized.astype(np.float32) * np.asarray(scales, dtype=np.float32)[:, None]
+
+
 class EmbeddingService:
     """Service for generating text embeddings using Vertex AI."""
     
@@ -36,6 +83,9 @@ class EmbeddingService:
         
         # Load the embedding model
         self._model: Optional[TextEmbeddingModel] = None
+        
+        # Async prediction client (one gRPC channel shared by all requests)
+        self._async_client: Optional[PredictionServiceAsyncClient] = None
     
     @property
     def model(self) -> TextEmbeddingModel:
@@ -44,6 +94,50 @@ class EmbeddingService:
             self._model = TextEmbeddingModel.from_pretrained(self.model_name)
         return self._model
     
+    @property
+    def async_client(self) -> PredictionServiceAsyncClient:
+        """Lazy create the async prediction client.
+        
+        The client owns a single long-lived gRPC channel, so concurrent
+        requests reuse one connection instead of each paying a handshake.
+        It must be first used from inside the event loop that will use it.
+        """
+        if self._async_client is None:
+            self._async_client = PredictionServiceAsyncClient(
+                client_options=ClientOptions(
+                    api_endpoint=f"{self.region}-aiplatform.googleapis.com"
+                )
+            )
+        return self._async_client
+    
+    @property
+    def publisher_model_path(self) -> str:
+        """Full resource name of the publisher embedding model."""
+        return (
+            f"projects/{self.project_id}/locations/{self.region}"
+            f"/publishers/google/models/{self.model_name}"
+        )
+    
+    @retry(
+        retry=retry_if_exception_type((ResourceExhausted, ServiceUnavailable)),
+        wait=wait_random_exponential(min=1, max=32),
+        stop=stop_after_attempt(6),
+        reraise=True,
+    )
+    def _embed(self, inputs: list[TextEmbeddingInput]) -> list[list[float]]:
+        """Call the embedding model, retrying quota and availability errors.
+        
+        Retries use jittered exponential backoff so concurrent callers do not
+        hit the endpoint again in lockstep after a 429/503.
+        
+        Args:
+            inputs: Embedding inputs for a single request
+        
+        Returns:
+            List of embedding vectors
+        """
+        return [e.values for e in self.model.get_embeddings(inputs)]
+    
     def get_embedding(self, text: str, task_type: str = "RETRIEVAL_DOCUMENT") -> list[float]:
         """Generate embedding for a single text.
         
@@ -60,35 +154,101 @@ class EmbeddingService:
             List of embedding values
         """
         inputs = [TextEmbeddingInput(text=text, task_type=task_type)]
-        embeddings = self.model.get_embeddings(inputs)
-        return embeddings[0].values
+        return self._embed(inputs)[0]
     
     def get_embeddings_batch(
         self,
         texts: list[str],
         task_type: str = "RETRIEVAL_DOCUMENT",
         batch_size: int = 5
-    ) -> list[list[float]]:
+    ) -> np.ndarray:
         """Generate embeddings for multiple texts in batches.
         
         Args:
             texts: List of texts to embed
             task_type: Type of embedding task
-            batch_size: Number of texts per batch (max 5 for Vertex AI)
+            batch_size: Number of texts per request (max 250 for
+                text-embedding-005, subject to the per-request token limit)
         
         Returns:
-            List of embedding vectors
+            float32 array of shape (len(texts), dimensions)
         """
-        all_embeddings = []
+        all_embeddings = np.empty((len(texts), self.dimensions), dtype=np.float32)
         
         for i in range(0, len(texts), batch_size):
             batch_texts = texts[i:i + batch_size]
             inputs = [TextEmbeddingInput(text=t, task_type=task_type) for t in batch_texts]
-            embeddings = self.model.get_embeddings(inputs)
-            all_embeddings.extend([e.values for e in embeddings])
+            all_embeddings[i:i + len(batch_texts)] = self._embed(inputs)
         
         return all_embeddings
     
+    def get_embeddings_batch_prediction(
+        self,
+        texts: list[str],
+        gcs_bucket: str,
+        task_type: str = "RETRIEVAL_DOCUMENT",
+        gcs_prefix: str = "embedding-batch"
+    ) -> np.ndarray:
+        """Generate embeddings offline with a Vertex AI batch prediction job.
+        
+        Uploads the texts as a JSONL dataset to GCS, runs a batch prediction
+        job against the embedding model and reads the results back. Batch
+        jobs are billed at a discount and are not subject to the online
+        per-minute quota, which suits one-off corpus embedding.
+        
+        Args:
+            texts: List of texts to embed
+            gcs_bucket: GCS bucket used for the job input and output
+            task_type: Type of embedding task
+            gcs_prefix: Folder in the bucket for job input/output files
+        
+        Returns:
+            float32 array of shape (len(texts), dimensions) aligned with texts
+        """
+        run_prefix = f"{gcs_prefix}/{int(time.time())}"
+        
+        storage_client = storage.Client(project=self.project_id)
+        bucket = storage_client.bucket(gcs_bucket)
+        # Identical texts are submitted once; results are looked up by text
+        bucket.blob(f"{run_prefix}/input.jsonl").upload_from_string(
+            "\n".join(
+                json.dumps({"content": text, "task_type": task_type})
+                for text in dict.fromkeys(texts)
+            )
+        )
+        
+        # Blocks until the job finishes (the SDK polls the job state)
+        job = self.model.batch_predict(
+            dataset=f"gs://{gcs_bucket}/{run_prefix}/input.jsonl",
+            destination_uri_prefix=f"gs://{gcs_bucket}/{run_prefix}/output",
+            model_parameters={"outputDimensionality": self.dimensions},
+        )
+        
+        # Output rows echo their instance, so map them back by text
+        embeddings_by_text: dict[str, list[float]] = {}
+        for blob in job.iter_outputs():
+            if not blob.name.endswith(".jsonl"):
+                continue
+            for line in blob.download_as_text().splitlines():
+                if not line:
+                    continue
+                row = json.loads(line)
+                predictions = row.get("predictions")
+                if predictions:
+                    embeddings_by_text[row["instance"]["content"]] = (
+                        predictions[0]["embeddings"]["values"]
+                    )
+        
+        missing = sum(1 for text in texts if text not in embeddings_by_text)
+        if missing:
+            raise RuntimeError(
+                f"Batch prediction returned no embedding for {missing} texts"
+            )
+        
+        return np.array(
+            [embeddings_by_text[text] for text in texts], dtype=np.float32
+        )
+    
     def get_query_embedding(self, query: str) -> list[float]:
         """Generate embedding for a search query.
         
@@ -126,6 +286,49 @@ class EmbeddingService:
         """
         return self.get_embedding(text)
     
+    @retry(
+        retry=retry_if_exception_type((ResourceExhausted, ServiceUnavailable)),
+        wait=wait_random_exponential(min=1, max=32),
+        stop=stop_after_attempt(6),
+        reraise=True,
+    )
+    async def aget_embeddings_batch(
+        self,
+        texts: list[str],
+        task_type: str = "RETRIEVAL_DOCUMENT"
+    ) -> np.ndarray:
+        """Generate embeddings for one request's worth of texts asynchronously.
+        
+        Calls the prediction API directly over the shared async client rather
+        than through a worker thread. All texts are sent in a single request,
+        so callers are responsible for batching (max 250 texts).
+        
+        Args:
+            texts: List of texts to embed
+            task_type: Type of embedding task
+        
+        Returns:
+            float32 array of shape (len(texts), dimensions)
+        """
+        instances = [
+            json_format.ParseDict(
+                {"content": text, "task_type": task_type}, struct_pb2.Value()
+            )
+            for text in texts
+        ]
+        parameters = json_format.ParseDict({"autoTruncate": True}, struct_pb2.Value())
+        
+        response = await self.async_client.predict(
+            endpoint=self.publisher_model_path,
+            instances=instances,
+            parameters=parameters,
+        )
+        
+        return np.array(
+            [p["embeddings"]["values"] for p in response.predictions],
+            dtype=np.float32,
+        )
+    
     async def get_embedding_async(
         self,
         text: str,
@@ -151,7 +354,7 @@ class EmbeddingService:
         texts: list[str],
         task_type: str = "RETRIEVAL_DOCUMENT",
         batch_size: int = 5
-    ) -> list[list[float]]:
+    ) -> np.ndarray:
         """Async wrapper for get_embeddings_batch.
         
         Args:
@@ -160,7 +363,7 @@ class EmbeddingService:
             batch_size: Number of texts per batch
         
         Returns:
-            List of embedding vectors
+            float32 array of shape (len(texts), dimensions)
         """
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
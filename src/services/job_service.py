@@ -133,7 +133,7 @@ class JobService:
             "experience_level": job.experience_level.value,
             "location_type": job.location_type.value,
             "location": job.location,
-            "salary_range": f"${job.salary_min:,} - ${job.salary_max:,}",
+            "salary_range": job.salary_range,
             "industry": job.industry,
         }
         
@@ -164,7 +164,7 @@ class JobService:
             "location": job.location,
             "salary_min": job.salary_min,
             "salary_max": job.salary_max,
-            "salary_range": f"${job.salary_min:,} - ${job.salary_max:,}",
+            "salary_range": job.salary_range,
             "industry": job.industry,
             "department": job.department,
             "benefits": job.benefits
@@ -8,6 +8,7 @@ Performance Pattern: Eventual Consistency
 - Background: Embeddings updated asynchronously for future searches
 """
 
+import asyncio
 import json
 import logging
 from typing import Optional
@@ -353,6 +354,31 @@ class MatchingService:
         
         return result
     
+    def validate_and_accept(
+        self,
+        candidate_id: str,
+        job_id: str,
+        save: bool = True
+    ) -> tuple[bool, Optional[Job], bool]:
+        """Check that the candidate and job exist and record the acceptance.
+        
+        Args:
+            candidate_id: The candidate identifier
+            job_id: The accepted job identifier
+            save: Write the candidates file now (see CandidateService.update_candidate)
+            
+        Returns:
+            Tuple of (candidate found, job or None, acceptance recorded).
+            Nothing is recorded unless both the candidate and job exist.
+        """
+        candidate_found = self.candidate_service.candidate_exists(candidate_id)
+        job = self.job_service.get_job(job_id)
+        if not candidate_found or job is None:
+            return candidate_found, job, False
+        
+        accepted = self.candidate_service.accept_job(candidate_id, job_id, save=save)
+        return candidate_found, job, accepted
+    
     def search_jobs_by_text(
         self,
         query: str,
@@ -464,6 +490,35 @@ class MatchingService:
         
         return result
     
+    async def search_with_updated_preferences_async(
+        self,
+        candidate_id: str,
+        preference_changes: dict,
+        additional_criteria: Optional[str] = None,
+        num_results: int = 3
+    ) -> dict:
+        """Async wrapper for search_with_updated_preferences.
+        
+        The search runs in a worker thread, so it can overlap with the
+        preference update that produced preference_changes.
+        
+        Args:
+            candidate_id: ID of the candidate
+            preference_changes: Dictionary of changed preferences
+            additional_criteria: Optional additional search text
+            num_results: Number of results to return
+            
+        Returns:
+            Dictionary with matches, alternatives, and suggestions
+        """
+        return await asyncio.to_thread(
+            self.search_with_updated_preferences,
+            candidate_id,
+            preference_changes,
+            additional_criteria,
+            num_results,
+        )
+    
     def _build_augmented_criteria(
         self,
         candidate: Candidate,
@@ -579,7 +634,10 @@ class MatchingService:
         required_titles = preference_changes.get("preferred_titles", candidate.preferred_titles or [])
         min_salary = preference_changes.get("min_salary", candidate.min_salary)
         salary_floor = min_salary * (1 - SALARY_TOLERANCE) if min_salary > 0 else 0
+        title_keywords = [title_keyword.lower() for title_keyword in required_titles]
         
+        # Matches are kept as (job, match_score); only the ones returned
+        # are formatted
         exact_matches = []
         close_matches = []
         filtered_count = 0
@@ -596,37 +654,32 @@ class MatchingService:
                     continue
             
             # STRICT: Filter by job title keywords if specified
-            if required_titles:
-                title_match = any(
-                    title_keyword.lower() in job.title.lower()
-                    for title_keyword in required_titles
-                )
-                if not title_match:
+            if title_keywords:
+                job_title = job.title.lower()
+                if not any(keyword in job_title for keyword in title_keywords):
                     filtered_count += 1
                     continue
             
             # Check salary match level
             match_score = round(1 - result["distance"], 2)
-            formatted = self.job_service.format_job_for_display(
-                job, include_match_score=True, match_score=match_score
-            )
             
             if min_salary > 0:
                 if job.salary_max >= min_salary:
-                    exact_matches.append(formatted)
+                    exact_matches.append((job, match_score))
                 elif job.salary_max >= salary_floor:
-                    # Add salary gap info
-                    salary_gap = min_salary - job.salary_max
-                    salary_gap_pct = round((salary_gap / min_salary) * 100, 1)
-                    formatted["salary_gap"] = f"${salary_gap:,} below ({salary_gap_pct}% less)"
-                    close_matches.append(formatted)
+                    close_matches.append((job, match_score))
                 else:
                     filtered_count += 1
             else:
-                exact_matches.append(formatted)
+                exact_matches.append((job, match_score))
         
         # Take top results
-        matched_jobs = exact_matches[:num_results]
+        matched_jobs = [
+            self.job_service.format_job_for_display(
+                job, include_match_score=True, match_score=match_score
+            )
+            for job, match_score in exact_matches[:num_results]
+        ]
         
         result = {
             "candidate_id": candidate.id,
@@ -643,7 +696,18 @@ class MatchingService:
         
         # If no exact matches but have close matches, include as alternatives
         if len(matched_jobs) == 0 and len(close_matches) > 0:
-            result["close_alternatives"] = close_matches[:num_results]
+            close_alternatives = []
+            for job, match_score in close_matches[:num_results]:
+                formatted = self.job_service.format_job_for_display(
+                    job, include_match_score=True, match_score=match_score
+                )
+                # Add salary gap info
+                salary_gap = min_salary - job.salary_max
+                salary_gap_pct = round((salary_gap / min_salary) * 100, 1)
+                formatted["salary_gap"] = f"${salary_gap:,} below ({salary_gap_pct}% less)"
+                close_alternatives.append(formatted)
+            
+            result["close_alternatives"] = close_alternatives
             result["note"] = f"No jobs found at ${min_salary:,}+, but found {len(close_matches)} options within {int(SALARY_TOLERANCE*100)}% (${salary_floor:,.0f}+)"
         elif len(matched_jobs) > 0:
             result["note"] = f"Found {len(matched_jobs)} jobs meeting your ${min_salary:,}+ requirement"
@@ -688,12 +752,18 @@ class MatchingService:
             candidate.preferred_titles or []
         )
         
+        # Loop-invariant lookups, built once rather than per job
+        declined_ids = set(candidate.declined_job_ids)
+        candidate_skills = set(candidate.skills)
+        industries = set(preferred_industries)
+        title_keywords = [title_keyword.lower() for title_keyword in preferred_titles]
+        
         exact_matches = []
         close_matches = []
         filtered_count = 0
         
         for job in self.job_service.get_all_jobs():
-            if job.id in candidate.declined_job_ids:
+            if job.id in declined_ids:
                 continue
             
             # STRICT: Filter by location type if specified
@@ -703,12 +773,9 @@ class MatchingService:
                     continue
             
             # STRICT: Filter by job title keywords if specified
-            if preferred_titles:
-                title_match = any(
-                    title_keyword.lower() in job.title.lower()
-                    for title_keyword in preferred_titles
-                )
-                if not title_match:
+            if title_keywords:
+                job_title = job.title.lower()
+                if not any(keyword in job_title for keyword in title_keywords):
                     filtered_count += 1
                     continue
             
@@ -728,7 +795,7 @@ class MatchingService:
             score = 0.0
             
             # Skill overlap
-            skill_overlap = len(set(candidate.skills) & set(job.required_skills))
+            skill_overlap = len(candidate_skills.intersection(job.required_skills))
             score += skill_overlap * 2
             
             # Salary match bonus
@@ -736,7 +803,7 @@ class MatchingService:
                 score += 3
             
             # Industry match
-            if job.industry in preferred_industries:
+            if job.industry in industries:
                 score += 2
             
             # Title match bonus
@@ -1,16 +1,147 @@
 """Vertex AI Vector Search Service."""
 
-import json
+import asyncio
+import base64
+import hashlib
+import queue
+import threading
 import time
 from typing import Optional
 from pathlib import Path
 
+import google_crc32c
+import orjson
+from google.api_core.client_options import ClientOptions
+from google.api_core.exceptions import NotFound
 from google.cloud import aiplatform
 from google.cloud import storage
+from google.cloud.aiplatform_v1 import (
+    Index,
+    IndexEndpoint,
+    IndexEndpointServiceClient,
+    IndexServiceAsyncClient,
+    IndexServiceClient,
+)
+from google.cloud.storage import transfer_manager
+from google.protobuf import json_format, struct_pb2
 
 from config.settings import get_settings
 from src.services.embeddings import EmbeddingService
 
+# Files above this size are uploaded as parallel chunks
+PARALLEL_UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+PARALLEL_UPLOAD_WORKERS = 8
+
+# Chunk size for streaming (resumable) uploads; must be a multiple of 256 KiB
+STREAMING_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Backoff bounds (seconds) when polling long-running operations
+OPERATION_POLL_MIN = 1
+OPERATION_POLL_MAX = 60
+
+# Size and checksums of the last uploaded embeddings file, kept in data_dir
+EMBEDDINGS_MANIFEST_FILENAME = ".embeddings_manifest.json"
+
+
+def file_checksums(filepath: Path, chunk_size: int = 1024 * 1024) -> dict:
+    """Compute a file's size and checksums in the format GCS reports them.
+    
+    Args:
+        filepath: File to hash
+        chunk_size: Bytes read per iteration
+    
+    Returns:
+        Dict with 'size', 'md5' and 'crc32c' (base64-encoded digests)
+    """
+    md5 = hashlib.md5()
+    crc32c = google_crc32c.Checksum()
+    size = 0
+    with open(filepath, "rb") as f:
+        while chunk := f.read(chunk_size):
+            md5.update(chunk)
+            crc32c.update(chunk)
+            size += len(chunk)
+    return {
+        "size": size,
+        "md5": base64.b64encode(md5.digest()).decode("ascii"),
+        "crc32c": base64.b64encode(crc32c.digest()).decode("ascii"),
+    }
+
+
+class StreamingBlobUpload:
+    """Upload bytes to a GCS blob while they are still being produced.
+    
+    Writes are queued and sent by a background thread through a resumable
+    upload session, so network transfer overlaps with the producer's work.
+    The object only becomes visible once close() succeeds; abort() cancels
+    the session and leaves no object behind.
+    """
+    
+    def __init__(
+        self,
+        blob: storage.Blob,
+        chunk_size: int = STREAMING_UPLOAD_CHUNK_SIZE,
+        max_pending: int = 64
+    ):
+        """Start the background upload.
+        
+        Args:
+            blob: Destination blob
+            chunk_size: Bytes sent per resumable upload request
+            max_pending: Maximum number of queued writes before write() blocks
+        """
+        self._blob = blob
+        self._chunk_size = chunk_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._abort = False
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def _run(self) -> None:
+        """Drain the queue into the resumable upload stream."""
+        writer = None
+        finished = False  # Whether the None sentinel has been taken
+        try:
+            writer = self._blob.open(
+                "wb", chunk_size=self._chunk_size, ignore_flush=True
+            )
+            while (data := self._queue.get()) is not None:
+                writer.write(data)
+            finished = True
+            if self._abort:
+                writer.terminate()
+            else:
+                writer.close()
+        except BaseException as e:
+            self._error = e
+            if writer is not None and not writer.closed:
+                try:
+                    writer.terminate()
+                except Exception:
+                    pass
+            # Keep draining so producers never block on a dead upload
+            if not finished:
+                while self._queue.get() is not None:
+                    pass
+    
+    def write(self, data: bytes) -> None:
+        """Queue bytes for upload (blocks when the queue is full)."""
+        self._queue.put(data)
+    
+    def close(self) -> None:
+        """Finish the upload, raising any error from the upload thread."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+    
+    def abort(self) -> None:
+        """Cancel the upload without creating the object."""
+        self._abort = True
+        self._queue.put(None)
+        self._thread.join()
+
 
 class VectorSearchService:
     """Service for managing Vertex AI Vector Search operations."""
@@ -101,8 +232,8 @@ class VectorSearchService:
         blob = bucket.blob(f"embeddings/{filename}")
         
         # Convert to JSONL format required by Vector Search
-        jsonl_content = "\n".join(
-            json.dumps({"id": item["id"], "embedding": item["embedding"]})
+        jsonl_content = b"\n".join(
+            orjson.dumps({"id": item["id"], "embedding": item["embedding"]})
             for item in embeddings_data
         )
         
@@ -110,6 +241,74 @@ class VectorSearchService:
         
         return f"gs://{self.gcs_bucket}/embeddings/{filename}"
     
+    def upload_embeddings_file_to_gcs(
+        self,
+        filepath: Path,
+        filename: Optional[str] = None
+    ) -> str:
+        """Upload a local JSONL embeddings file to GCS.
+        
+        The file is streamed from disk, so the embeddings never need to be
+        held in memory. Files larger than one chunk are split and uploaded
+        concurrently (GCS XML multipart upload) to use the available
+        bandwidth.
+        
+        Args:
+            filepath: Path to a JSONL file with 'id' and 'embedding' per line
+            filename: Name of the file in GCS (defaults to the local name)
+        
+        Returns:
+            GCS URI of the uploaded file
+        """
+        filename = filename or Path(filepath).name
+        
+        storage_client = storage.Client(project=self.project_id)
+        bucket = storage_client.bucket(self.gcs_bucket)
+        blob = bucket.blob(f"embeddings/{filename}")
+        
+        if Path(filepath).stat().st_size > PARALLEL_UPLOAD_CHUNK_SIZE:
+            transfer_manager.upload_chunks_concurrently(
+                str(filepath),
+                blob,
+                chunk_size=PARALLEL_UPLOAD_CHUNK_SIZE,
+                max_workers=PARALLEL_UPLOAD_WORKERS,
+            )
+        else:
+            blob.upload_from_filename(str(filepath))
+        
+        return f"gs://{self.gcs_bucket}/embeddings/{filename}"
+    
+    def get_embeddings_checksums(self, filename: str) -> Optional[dict]:
+        """Fetch the size and checksums of an uploaded embeddings file.
+        
+        Args:
+            filename: Name of the file in GCS
+        
+        Returns:
+            Dict with 'size', 'md5' and 'crc32c' as reported by GCS ('md5'
+            is None for multipart uploads), or None if the file is missing
+        """
+        storage_client = storage.Client(project=self.project_id)
+        blob = storage_client.bucket(self.gcs_bucket).blob(f"embeddings/{filename}")
+        try:
+            blob.reload()
+        except NotFound:
+            return None
+        return {"size": blob.size, "md5": blob.md5_hash, "crc32c": blob.crc32c}
+    
+    def open_embeddings_stream(self, filename: str) -> StreamingBlobUpload:
+        """Start a streaming upload of embeddings JSONL to GCS.
+        
+        Args:
+            filename: Name of the file in GCS
+        
+        Returns:
+            StreamingBlobUpload accepting JSONL bytes
+        """
+        storage_client = storage.Client(project=self.project_id)
+        bucket = storage_client.bucket(self.gcs_bucket)
+        return StreamingBlobUpload(bucket.blob(f"embeddings/{filename}"))
+    
     def create_index(
         self,
         display_name: str = "job-vacancies-index",
@@ -172,6 +371,123 @@ class VectorSearchService:
         
         return self._endpoint
     
+    @property
+    def _parent(self) -> str:
+        """Resource name of the project location."""
+        return f"projects/{self.project_id}/locations/{self.region}"
+    
+    @property
+    def _client_options(self) -> ClientOptions:
+        """Client options pointing at the regional API endpoint."""
+        return ClientOptions(api_endpoint=f"{self.region}-aiplatform.googleapis.com")
+    
+    def start_index_creation(
+        self,
+        display_name: str = "job-vacancies-index",
+        embeddings_gcs_uri: Optional[str] = None,
+        description: str = "Vector search index for job vacancies"
+    ) -> str:
+        """Submit index creation without waiting for it to finish.
+        
+        Uses the same Tree-AH configuration as create_index. The returned
+        operation name can be persisted and polled later with
+        wait_for_operation, so an interrupted caller can resume waiting
+        instead of creating a second index.
+        
+        Args:
+            display_name: Display name for the index
+            embeddings_gcs_uri: GCS URI containing initial embeddings
+            description: Description of the index
+        
+        Returns:
+            Name of the long-running creation operation
+        """
+        metadata = {
+            "config": {
+                "dimensions": self.dimensions,
+                "approximateNeighborsCount": 10,
+                "distanceMeasureType": "COSINE_DISTANCE",
+                "algorithmConfig": {
+                    "treeAhConfig": {
+                        "leafNodeEmbeddingCount": 500,
+                        "leafNodesToSearchPercent": 7,
+                    }
+                },
+            },
+        }
+        if embeddings_gcs_uri:
+            metadata["contentsDeltaUri"] = embeddings_gcs_uri
+        
+        client = IndexServiceClient(client_options=self._client_options)
+        operation = client.create_index(
+            parent=self._parent,
+            index=Index(
+                display_name=display_name,
+                description=description,
+                metadata=json_format.ParseDict(metadata, struct_pb2.Value()),
+                index_update_method=Index.IndexUpdateMethod.STREAM_UPDATE,
+            ),
+        )
+        return operation.operation.name
+    
+    def start_endpoint_creation(
+        self,
+        display_name: str = "job-vacancies-endpoint",
+        description: str = "Endpoint for job vacancy vector search"
+    ) -> str:
+        """Submit index endpoint creation without waiting for it to finish.
+        
+        Args:
+            display_name: Display name for the endpoint
+            description: Description of the endpoint
+        
+        Returns:
+            Name of the long-running creation operation
+        """
+        client = IndexEndpointServiceClient(client_options=self._client_options)
+        operation = client.create_index_endpoint(
+            parent=self._parent,
+            index_endpoint=IndexEndpoint(
+                display_name=display_name,
+                description=description,
+                public_endpoint_enabled=True,
+            ),
+        )
+        return operation.operation.name
+    
+    async def wait_for_operation(self, operation_name: str) -> str:
+        """Poll a long-running operation until it completes.
+        
+        Polls with exponential backoff between OPERATION_POLL_MIN and
+        OPERATION_POLL_MAX seconds, so several operations can be awaited
+        concurrently with asyncio.gather.
+        
+        Args:
+            operation_name: Name returned by start_index_creation or
+                start_endpoint_creation
+        
+        Returns:
+            Resource name of the created index or endpoint
+        
+        Raises:
+            RuntimeError: If the operation finished with an error
+        """
+        client = IndexServiceAsyncClient(client_options=self._client_options)
+        delay = OPERATION_POLL_MIN
+        while True:
+            operation = await client.get_operation({"name": operation_name})
+            if operation.done:
+                break
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, OPERATION_POLL_MAX)
+        
+        if operation.HasField("error"):
+            raise RuntimeError(
+                f"Operation {operation_name} failed: {operation.error.message}"
+            )
+        # Operation names are "<resource name>/operations/<id>"
+        return operation_name.split("/operations/")[0]
+    
     def deploy_index(
         self,
         deployed_index_id: Optional[str] = None,
@@ -1,5 +1,7 @@
 """Tests for API endpoints."""
 
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -183,17 +185,15 @@ class TestConversationContext:
     
     def test_build_context_with_history(self):
         """Test building context includes conversation history."""
-        from src.api.routes import build_conversation_context, _sessions
+        from src.api.routes import build_conversation_context, _sessions, SessionState
         
         # Create a test session
-        _sessions["test-session"] = {
-            "candidate_id": "test-candidate",
-            "messages": [
-                {"role": "user", "content": "Hello"},
-                {"role": "assistant", "content": "Hi there!"},
-            ],
-            "preferences": {"location": "remote"}
-        }
+        session = SessionState(candidate_id="test-candidate", preferences={"location": "remote"})
+        session.messages.extend([
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi there!"},
+        ])
+        _sessions["test-session"] = session
         
         context = build_conversation_context(
             "test-session",
@@ -213,13 +213,9 @@ class TestConversationContext:
     
     def test_build_context_empty_session(self):
         """Test building context for new session."""
-        from src.api.routes import build_conversation_context, _sessions
+        from src.api.routes import build_conversation_context, _sessions, SessionState
         
-        _sessions["new-session"] = {
-            "candidate_id": "test-candidate",
-            "messages": [],
-            "preferences": {}
-        }
+        _sessions["new-session"] = SessionState(candidate_id="test-candidate")
         
         context = build_conversation_context(
             "new-session",
@@ -233,6 +229,75 @@ class TestConversationContext:
         
         # Cleanup
         del _sessions["new-session"]
+    
+    def test_session_history_is_bounded(self):
+        """Test session history keeps only the latest messages."""
+        from src.api.routes import (
+            _settings, _sessions, _candidate_sessions,
+            append_message, build_conversation_context, get_or_create_session,
+        )
+        
+        session_id = get_or_create_session("bounded-candidate")
+        session = _sessions[session_id]
+        for i in range(_settings.session_max_messages + 5):
+            append_message(session, "user", f"message {i}")
+        
+        messages = session.messages
+        assert len(messages) == _settings.session_max_messages
+        assert messages[0]["content"] == "message 5"
+        
+        context = build_conversation_context(session_id, "Hi", "bounded-candidate", max_history=2)
+        last = _settings.session_max_messages + 4
+        assert f"message {last - 1}" in context
+        assert f"message {last}" in context
+        assert f"message {last - 2}\n" not in context
+        
+        # Cleanup
+        del _sessions[session_id]
+        del _candidate_sessions["bounded-candidate"]
+    
+    def test_get_session_history(self, test_client):
+        """Test the history endpoint returns stored messages in order."""
+        from src.api.routes import _sessions, SessionState, append_message
+        
+        session = SessionState(candidate_id="test-candidate")
+        append_message(session, "user", "Hello", timestamp="2024-01-01T00:00:00+00:00")
+        append_message(session, "assistant", "Hi there!")
+        _sessions["history-session"] = session
+        
+        response = test_client.get("/api/sessions/history-session/history")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["candidate_id"] == "test-candidate"
+        assert [m["content"] for m in data["messages"]] == ["Hello", "Hi there!"]
+        assert data["messages"][0] == {
+            "role": "user",
+            "content": "Hello",
+            "timestamp": "2024-01-01T00:00:00+00:00",
+        }
+        
+        # Cleanup
+        del _sessions["history-session"]
+
+
+class TestChatStream:
+    """Tests for the streaming chat endpoint."""
+    
+    def test_stream_unknown_candidate(self, test_client):
+        """Test an unknown candidate gets a single error event."""
+        response = test_client.post(
+            "/api/chat/stream",
+            json={"message": "Find me jobs", "candidate_id": "non-existent"}
+        )
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text.startswith("data: ")
+        assert response.text.endswith("\n\n")
+        assert json.loads(response.text[len("data: "):]) == {
+            "error": "Candidate non-existent not found"
+        }
 
 
 class TestHealthEndpoint:
@@ -329,6 +394,33 @@ class TestJobsAPI:
         data = response.json()
         assert len(data) == 2
     
+    def test_list_jobs_gzip(self, test_client):
+        """Test large job lists are gzip-compressed and small payloads are not."""
+        response = test_client.get("/api/jobs", headers={"Accept-Encoding": "gzip"})
+        
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == "gzip"
+        assert isinstance(response.json(), list)
+        
+        response = test_client.get("/api/jobs?limit=1", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+    
+    def test_search_jobs_by_text_cached(self, test_client):
+        """Test repeated text searches are served from the cache."""
+        matching_service = MagicMock()
+        matching_service.search_jobs_by_text.return_value = {
+            "query": "Cached Query Test", "results": [], "total": 0
+        }
+        
+        with patch("src.api.routes.get_matching_service", return_value=matching_service):
+            first = test_client.get("/api/jobs/search/text?query=Cached Query Test")
+            second = test_client.get("/api/jobs/search/text?query=cached query test ")
+        
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert second.json()["query"] == "cached query test "
+        matching_service.search_jobs_by_text.assert_called_once()
+    
     def test_get_job_exists(self, test_client):
         """Test getting existing job."""
         response = test_client.get("/api/jobs/job-test-001")
@@ -401,7 +493,7 @@ class TestAgentTools:
         assert callable(list_available_candidates)
     
     def test_get_job_details_returns_json(self):
-        """Test get_job_details returns valid JSON."""
+        """Test get_job_details returns a JSON-serializable dict."""
         import json
         from unittest.mock import MagicMock
         from src.agent.tools import get_job_details
@@ -413,12 +505,12 @@ class TestAgentTools:
         # This will return error JSON since no data is loaded
         result = get_job_details(mock_context, "non-existent")
         
-        # Should be valid JSON
-        parsed = json.loads(result)
+        # Should be a dict that encodes to valid JSON
+        parsed = json.loads(json.dumps(result))
         assert "error" in parsed
     
     def test_get_candidate_profile_returns_json(self):
-        """Test get_candidate_profile returns valid JSON."""
+        """Test get_candidate_profile returns a JSON-serializable dict."""
         import json
         from unittest.mock import MagicMock
         from src.agent.tools import get_candidate_profile
@@ -429,6 +521,6 @@ class TestAgentTools:
         
         result = get_candidate_profile(mock_context, "non-existent")
         
-        parsed = json.loads(result)
+        parsed = json.loads(json.dumps(result))
         assert "error" in parsed
 
@@ -44,6 +44,14 @@ class TestJobModel:
         assert "FastDelivery" in text
         assert "Driver's License" in text
     
+    def test_job_salary_range(self, sample_job):
+        """Test formatted salary range follows the salary fields and is not serialized."""
+        assert sample_job.salary_range == "$150,000 - $200,000"
+        assert "salary_range" not in sample_job.model_dump()
+        
+        copy = sample_job.model_copy(update={"salary_min": 1})
+        assert copy.salary_range == "$1 - $200,000"
+    
     def test_job_response_from_job(self, sample_job):
         """Test JobResponse creation from Job."""
         response = JobResponse.from_job(sample_job)
@@ -53,6 +61,15 @@ class TestJobModel:
         assert response.company == sample_job.company
         assert "$150,000" in response.salary_range
     
+    def test_job_response_from_jobs(self, sample_job, sample_bluecollar_job):
+        """Test bulk responses match the validated single-job ones."""
+        jobs = [sample_job, sample_bluecollar_job]
+        responses = JobResponse.from_jobs(jobs)
+        
+        assert [r.model_dump() for r in responses] == [
+            JobResponse.from_job(j).model_dump() for j in jobs
+        ]
+    
     def test_experience_level_enum(self):
         """Test ExperienceLevel enum values."""
         assert ExperienceLevel.JUNIOR.value == "junior"
@@ -169,6 +186,15 @@ class TestCandidateModel:
         assert response.email == sample_candidate.email
         assert response.years_experience == sample_candidate.years_experience
     
+    def test_candidate_response_from_candidates(self, sample_candidate, sample_bluecollar_candidate):
+        """Test bulk responses match the validated single-candidate ones."""
+        candidates = [sample_candidate, sample_bluecollar_candidate]
+        responses = CandidateResponse.from_candidates(candidates)
+        
+        assert [r.model_dump() for r in responses] == [
+            CandidateResponse.from_candidate(c).model_dump() for c in candidates
+        ]
+    
     def test_candidate_declined_jobs(self, sample_candidate):
         """Test candidate declined jobs tracking."""
         assert sample_candidate.declined_job_ids == []
@@ -254,6 +254,51 @@ class TestCandidateService:
         
         assert success is False
     
+    async def test_accept_job_save_in_background(self, candidate_service, temp_candidates_file):
+        """Test deferred save writes the acceptance to the candidates file."""
+        import json
+        
+        candidate_service.accept_job("candidate-test-001", "job-123", save=False)
+        await candidate_service.save_in_background()
+        
+        with open(temp_candidates_file) as f:
+            saved = {c["id"]: c for c in json.load(f)}
+        assert saved["candidate-test-001"]["accepted_job_id"] == "job-123"
+    
+    async def test_save_in_background_keeps_newer_save(self, candidate_service, temp_candidates_file):
+        """Test a background save never overwrites a newer synchronous save."""
+        candidate_service.accept_job("candidate-test-001", "job-123", save=False)
+        task = candidate_service.save_in_background()
+        candidate_service.update_preferences("candidate-test-001", min_salary=123456)
+        await task
+        
+        with open(temp_candidates_file) as f:
+            saved = {c["id"]: c for c in json.load(f)}
+        assert saved["candidate-test-001"]["min_salary"] == 123456
+        assert saved["candidate-test-001"]["accepted_job_id"] == "job-123"
+        assert list(temp_candidates_file.parent.glob("*.tmp")) == []
+    
+    def test_concurrent_updates(self, candidate_service, sample_candidate, temp_candidates_file):
+        """Test updates from many threads keep the cache and file consistent."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        def create(i):
+            candidate_service.update_candidate(
+                sample_candidate.model_copy(update={"id": f"candidate-thread-{i}"})
+            )
+        
+        def decline(i):
+            candidate_service.decline_jobs("candidate-test-001", [f"job-{i}"])
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(create, range(20)))
+            list(pool.map(decline, range(20)))
+        
+        with open(temp_candidates_file) as f:
+            saved = {c["id"]: c for c in json.load(f)}
+        assert len(saved) == 22
+        assert len(saved["candidate-test-001"]["declined_job_ids"]) == 20
+    
     def test_get_declined_job_ids(self, candidate_service):
         """Test getting declined job IDs."""
         candidate_service.decline_jobs("candidate-test-001", ["job-a", "job-b"])
@@ -288,6 +333,19 @@ class TestCandidateService:
         assert summary["name"] == "John Doe"
         assert summary["current_title"] == "Senior Software Engineer"
         assert summary["years_experience"] == 8
+    
+    def test_summaries_cached_rebuilt_on_update(self, candidate_service):
+        """Test cached summaries are reused until a candidate changes."""
+        summaries = candidate_service.summaries_cached()
+        
+        assert len(summaries) == 2
+        assert candidate_service.summaries_cached() is summaries
+        
+        candidate_service.accept_job("candidate-test-001", "job-123")
+        updated = candidate_service.summaries_cached()
+        
+        assert updated is not summaries
+        assert updated[0]["has_accepted_job"] is True
 
 
 class TestMatchingService:
@@ -380,4 +438,176 @@ class TestMatchingService:
         
         assert "error" in result
         assert "not available" in result["error"]
+    
+    def test_validate_and_accept(self, matching_service, candidate_service):
+        """Test accepting a job through the matching service."""
+        found, job, accepted = matching_service.validate_and_accept(
+            "candidate-test-001", "job-test-001"
+        )
+        
+        assert found is True
+        assert job.id == "job-test-001"
+        assert accepted is True
+        assert candidate_service.get_candidate("candidate-test-001").accepted_job_id == "job-test-001"
+    
+    def test_validate_and_accept_missing_job(self, matching_service, candidate_service):
+        """Test that nothing is recorded when the job does not exist."""
+        found, job, accepted = matching_service.validate_and_accept(
+            "candidate-test-001", "non-existent"
+        )
+        
+        assert found is True
+        assert job is None
+        assert accepted is False
+        assert candidate_service.get_candidate("candidate-test-001").accepted_job_id is None
+
+
+class TestBoundedTTLDict:
+    """Tests for the bounded session dict."""
+    
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted at capacity."""
+        from src.services.cache_service import BoundedTTLDict
+        
+        sessions = BoundedTTLDict(max_size=2, ttl=60)
+        sessions["a"] = 1
+        sessions["b"] = 2
+        assert sessions["a"] == 1  # "b" is now least recently used
+        sessions["c"] = 3
+        
+        assert "b" not in sessions
+        assert sorted(sessions) == ["a", "c"]
+        assert sorted(sessions.values()) == [1, 3]
+    
+    def test_expires_idle_entries(self):
+        """Test entries expire after the TTL without access."""
+        import time
+        from src.services.cache_service import BoundedTTLDict
+        
+        sessions = BoundedTTLDict(max_size=10, ttl=0.01)
+        sessions["a"] = 1
+        time.sleep(0.02)
+        
+        assert sessions.get("a") is None
+        assert len(sessions) == 0
 
+
+class TestEmbeddingQuantization:
+    """Tests for int8 embedding quantization helpers."""
+    
+    def test_quantize_round_trip(self):
+        """Test that dequantized vectors stay close to the originals."""
+        import numpy as np
+        from src.services.embeddings import quantize_int8, dequantize_int8
+        
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((4, 768)).astype(np.float32)
+        
+        quantized, scales = quantize_int8(vectors)
+        
+        assert quantized.dtype == np.int8
+        assert scales.shape == (4,)
+        assert np.abs(quantized).max() == 127
+        restored = dequantize_int8(quantized, scales)
+        assert np.allclose(restored, vectors, atol=scales.max())
+    
+    def test_quantize_zero_vector(self):
+        """Test that an all-zero vector quantizes without dividing by zero."""
+        import numpy as np
+        from src.services.embeddings import quantize_int8, dequantize_int8
+        
+        quantized, scales = quantize_int8(np.zeros((1, 8), dtype=np.float32))
+        
+        assert not quantized.any()
+        assert not dequantize_int8(quantized, scales).any()
+
+
+class FakeBlobWriter:
+    """In-memory stand-in for a resumable GCS blob writer."""
+    
+    def __init__(self, fail_on: str):
+        self.fail_on = fail_on
+        self.data = b""
+        self.closed = False
+    
+    def write(self, data: bytes) -> None:
+        if self.fail_on == "write":
+            raise OSError("write failed")
+        self.data += data
+    
+    def close(self) -> None:
+        if self.fail_on == "close":
+            raise OSError("close failed")
+        self.closed = True
+    
+    def terminate(self) -> None:
+        self.closed = True
+
+
+class FakeBlob:
+    """Blob whose open() returns a FakeBlobWriter."""
+    
+    def __init__(self, fail_on: str = ""):
+        self.writer = FakeBlobWriter(fail_on)
+    
+    def open(self, mode: str, **kwargs) -> FakeBlobWriter:
+        return self.writer
+
+
+class TestStreamingBlobUpload:
+    """Tests for the background streaming upload."""
+    
+    def _finish(self, action) -> BaseException | None:
+        """Run close()/abort() in a thread, failing the test if it hangs."""
+        import threading
+        
+        errors = []
+        
+        def run():
+            try:
+                action()
+            except BaseException as e:
+                errors.append(e)
+        
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive(), "upload did not finish"
+        return errors[0] if errors else None
+    
+    def test_close_uploads_data(self):
+        """Test queued writes reach the blob on close."""
+        from src.services.vector_search import StreamingBlobUpload
+        
+        blob = FakeBlob()
+        upload = StreamingBlobUpload(blob)
+        upload.write(b"a")
+        upload.write(b"b")
+        
+        assert self._finish(upload.close) is None
+        assert blob.writer.data == b"ab"
+    
+    def test_close_failure_raises_without_hanging(self):
+        """Test a failing writer.close() is raised instead of blocking."""
+        from src.services.vector_search import StreamingBlobUpload
+        
+        upload = StreamingBlobUpload(FakeBlob(fail_on="close"))
+        upload.write(b"a")
+        
+        error = self._finish(upload.close)
+        assert isinstance(error, OSError)
+        assert str(error) == "close failed"
+    
+    def test_write_failure_keeps_producer_unblocked(self):
+        """Test writes after a failed upload do not block the producer."""
+        from src.services.vector_search import StreamingBlobUpload
+        
+        upload = StreamingBlobUpload(FakeBlob(fail_on="write"), max_pending=1)
+        
+        def write_then_close():
+            for _ in range(10):
+                upload.write(b"a")
+            upload.close()
+        
+        error = self._finish(write_then_close)
+        assert isinstance(error, OSError)